@@ -7,6 +7,8 @@ from typing import Optional, List, Dict, Any
 from openai import AsyncOpenAI
 from ..config.settings import get_settings
 from ..models.message import ChatMessage
+from ..services.llm_gateway import get_llm_gateway
+from .intents import DIRECTOR_INTENTS
 
 settings = get_settings()
 
@@ -54,8 +56,10 @@ Previous conversation context: {context}
 Respond with ONLY the agent name (one of: conversation, pronunciation, reading, writing, progress).
 If unsure, default to "conversation"."""
 
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY) if settings.OPENAI_API_KEY else None
+    @property
+    def client(self) -> Optional[AsyncOpenAI]:
+        """OpenAI client borrowed from the shared LLM gateway"""
+        return get_llm_gateway().openai
 
     async def route_message(
         self,
@@ -86,17 +90,11 @@ If unsure, default to "conversation"."""
 
     def _keyword_routing(self, message: str) -> RoutingDecision:
         """Simple keyword-based routing as fallback"""
-        message_lower = message.lower()
+        intents = DIRECTOR_INTENTS.match(message)
 
         # Learning/teaching keywords - route to conversation for language teaching
         # This catches most common learning requests
-        if any(word in message_lower for word in [
-            "teach", "learn", "how do you say", "what is", "translate",
-            "greeting", "greetings", "hello", "number", "numbers", "count", "counting",
-            "phrase", "phrases", "vocabulary", "word", "words", "mean", "meaning",
-            "culture", "cultural", "exercise", "practice", "quiz", "lesson",
-            "hiligaynon", "ilonggo", "kumusta", "maayong", "salamat"
-        ]):
+        if "learning" in intents:
             return RoutingDecision(
                 target_agent="conversation",
                 confidence=0.85,
@@ -104,7 +102,7 @@ If unsure, default to "conversation"."""
             )
 
         # Progress keywords - specific progress tracking requests
-        if any(word in message_lower for word in ["my progress", "my stats", "my score", "my level", "my streak", "achievement", "how am i doing"]):
+        if "progress" in intents:
             return RoutingDecision(
                 target_agent="progress",
                 confidence=0.7,
@@ -112,7 +110,7 @@ If unsure, default to "conversation"."""
             )
 
         # Pronunciation keywords - specific pronunciation practice
-        if any(word in message_lower for word in ["pronounce", "pronunciation guide", "accent", "how to say"]):
+        if "pronunciation" in intents:
             return RoutingDecision(
                 target_agent="conversation",  # Route to conversation since it handles pronunciation teaching
                 confidence=0.8,
@@ -133,5 +131,7 @@ async def route_user_message(
     user_context: Dict[str, Any] = None
 ) -> RoutingDecision:
     """Convenience function to route a message"""
-    director = DirectorAgent()
-    return await director.route_message(message, conversation_history, user_context)
+    return await _default_director.route_message(message, conversation_history, user_context)
+
+
+_default_director = DirectorAgent()
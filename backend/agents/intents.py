@@ -0,0 +1,126 @@
+"""
+LingoKa Intent Matching
+Keyword-based intent detection shared by the Director and Conversation agents.
+
+Each matcher compiles all of its keywords once at import, so classifying a
+message is one pass over the text that reports every matched intent.
+Keywords match whole words ("hi" no longer fires on "hiligaynon" or "this");
+a trailing "*" marks a single-word keyword that matches as a word prefix
+("learn*" covers "learn", "learning", "learned").
+"""
+import re
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _trie_pattern(words: List[str]) -> str:
+    """Build a prefix-factored alternation so the regex engine fails fast on each character"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            branches.append("")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class IntentMatcher:
+    """
+    Single-pass, word-boundary-aware multi-keyword intent matcher.
+
+    All keywords are compiled into one prefix-factored regular expression that
+    finds keyword hits (extended to the end of the word) in a single scan.
+    Each distinct hit is resolved to its intents once and cached, which also
+    credits shorter keywords contained in a longer hit ("practice quiz"
+    implies "practic*" and "quiz*").
+    """
+
+    MAX_CACHED_HITS = 50000
+
+    def __init__(self, intents: Dict[str, List[str]]):
+        self._keywords: List[Tuple[Tuple[str, ...], bool, str]] = []
+        for intent, keywords in intents.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                is_prefix = keyword.endswith("*")
+                words = tuple(_TOKEN_PATTERN.findall(keyword.rstrip("*")))
+                self._keywords.append((words, is_prefix, intent))
+
+        stems = sorted({" ".join(words) for words, _, _ in self._keywords})
+        self._pattern = re.compile(r"\b" + _trie_pattern(stems) + r"\w*")
+        self._hit_intents: Dict[str, FrozenSet[str]] = {}
+
+    def _resolve_hit(self, hit: str) -> FrozenSet[str]:
+        tokens = _TOKEN_PATTERN.findall(hit)
+        intents: Set[str] = set()
+        for words, is_prefix, intent in self._keywords:
+            n = len(words)
+            for i in range(len(tokens) - n + 1):
+                window = tokens[i:i + n]
+                if window[:-1] != list(words[:-1]):
+                    continue
+                last = window[-1]
+                if last == words[-1] or (is_prefix and last.startswith(words[-1])):
+                    intents.add(intent)
+                    break
+        result = frozenset(intents)
+        if len(self._hit_intents) < self.MAX_CACHED_HITS:
+            self._hit_intents[hit] = result
+        return result
+
+    def match(self, message: str) -> FrozenSet[str]:
+        """Return every intent whose keywords appear in the message"""
+        found: Set[str] = set()
+        hit_intents = self._hit_intents
+        for hit in self._pattern.findall(message.lower()):
+            intents = hit_intents.get(hit)
+            if intents is None:
+                intents = self._resolve_hit(hit)
+            found |= intents
+        return frozenset(found)
+
+
+# Director routing intents
+DIRECTOR_INTENTS = IntentMatcher({
+    # Learning/teaching requests - routed to conversation for language teaching
+    "learning": [
+        "teach*", "learn*", "how do you say", "what is", "translat*",
+        "greeting*", "hello", "number*", "count*", "phrase*", "vocabulary",
+        "word*", "mean*", "cultur*", "exercise*", "practic*", "quiz*", "lesson*",
+        "hiligaynon", "ilonggo", "kumusta", "maayong", "salamat"
+    ],
+    "progress": [
+        "my progress", "my stats", "my score", "my level", "my streak",
+        "achievement*", "how am i doing"
+    ],
+    "pronunciation": ["pronounce", "pronunciation guide", "accent*", "how to say"]
+})
+
+# Conversation agent topic intents
+CONVERSATION_INTENTS = IntentMatcher({
+    "pronunciation": ["pronounc*", "pronunciation", "how to say", "sound like", "sounds like"],
+    "culture": ["cultur*", "tradition*", "festival*", "custom*"],
+    "exercise": ["exercise*", "quiz*", "test me", "practice quiz"],
+    "numbers": ["number*", "count", "counting", "how many", "pila"],
+    "phrases": ["phrase*", "useful phrase", "common phrase", "expression*"],
+    "greetings": ["greeting*", "hello", "hi", "good morning", "maayong", "kumusta"]
+})
+
+# Conversation agent offline fallback intents
+FALLBACK_INTENTS = IntentMatcher({
+    "greeting": ["hello", "hi", "hey", "kumusta", "maayong"],
+    "thanks": ["thank*", "salamat"],
+    "farewell": ["bye", "goodbye", "paalam"]
+})
@@ -0,0 +1,120 @@
+"""
+LingoKa LLM Admission Benchmark
+A burst of concurrent LLM calls against a simulated upstream, without and
+with admission control, then a classroom of identical prompts with and
+without single-flight coalescing.
+
+Run: python -m backend.benchmarks.bench_admission
+"""
+import asyncio
+import random
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..services.llm_admission import AdmissionRejected, LLMAdmission, LLMPriority
+from ..services.single_flight import SingleFlight
+
+UPSTREAM_LATENCY_S = 0.05
+# Past this many concurrent calls the simulated upstream slows down linearly
+UPSTREAM_CAPACITY = 16
+
+
+class Upstream:
+    """Simulated provider whose latency degrades once it is over capacity"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def complete(self, prompt: str) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(UPSTREAM_LATENCY_S * max(1.0, self.in_flight / UPSTREAM_CAPACITY))
+        finally:
+            self.in_flight -= 1
+        return prompt.upper()
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _burst(admission: Optional[LLMAdmission], calls: List[LLMPriority]) -> Tuple[Upstream, Dict]:
+    upstream = Upstream()
+    latencies: Dict[LLMPriority, List[float]] = {priority: [] for priority in LLMPriority}
+    rejected = dict.fromkeys(LLMPriority, 0)
+
+    async def call(index: int, priority: LLMPriority) -> None:
+        start = time.perf_counter()
+        try:
+            if admission is None:
+                await upstream.complete(f"prompt {index}")
+            else:
+                async with admission.slot(priority):
+                    await upstream.complete(f"prompt {index}")
+        except AdmissionRejected:
+            rejected[priority] += 1
+            return
+        latencies[priority].append(time.perf_counter() - start)
+
+    await asyncio.gather(*(call(i, priority) for i, priority in enumerate(calls)))
+    return upstream, {"latencies": latencies, "rejected": rejected}
+
+
+async def _classroom(single_flight: Optional[SingleFlight], students: int) -> Upstream:
+    upstream = Upstream()
+    prompt = "teach me how to say I love you"
+
+    async def ask() -> str:
+        if single_flight is None:
+            return await upstream.complete(prompt)
+        reply, _ = await single_flight.do(prompt, lambda: upstream.complete(prompt))
+        return reply
+
+    replies = await asyncio.gather(*(ask() for _ in range(students)))
+    assert len(set(replies)) == 1
+    return upstream
+
+
+def _report(label: str, upstream: Upstream, result: Dict) -> None:
+    for priority in LLMPriority:
+        latencies = result["latencies"][priority]
+        print(
+            f"{label:<14}{priority.name.lower():<8}{len(latencies):>7}{result['rejected'][priority]:>9}"
+            f"{statistics.median(latencies) * 1e3 if latencies else 0:>10.0f}"
+            f"{_percentile(latencies, 0.95) * 1e3:>10.0f}{upstream.peak:>12}"
+        )
+
+
+async def _main(burst: int = 600, lesson_share: float = 0.1, students: int = 30) -> None:
+    rng = random.Random(20)
+    calls = [LLMPriority.LESSON if rng.random() < lesson_share else LLMPriority.CHAT for _ in range(burst)]
+
+    print(f"burst of {burst} calls, upstream {UPSTREAM_LATENCY_S * 1e3:.0f} ms at <= {UPSTREAM_CAPACITY} in flight")
+    print(f"{'mode':<14}{'class':<8}{'served':>7}{'rejected':>9}{'p50 ms':>10}{'p95 ms':>10}{'upstream peak':>14}")
+    upstream, result = await _burst(None, calls)
+    _report("unlimited", upstream, result)
+    admission = LLMAdmission(max_in_flight=UPSTREAM_CAPACITY, max_queue=256, queue_timeout=1.0)
+    upstream, result = await _burst(admission, calls)
+    _report("admission", upstream, result)
+
+    print(f"\n{students} students sending the same prompt at once")
+    print(f"{'mode':<14}{'upstream calls':>16}")
+    print(f"{'independent':<14}{(await _classroom(None, students)).calls:>16}")
+    single_flight = SingleFlight()
+    print(f"{'single-flight':<14}{(await _classroom(single_flight, students)).calls:>16}  {single_flight.stats()}")
+
+
+def main() -> None:
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+LingoKa /chat Load Test
+Drives /chat at a fixed arrival rate against the mock LLM, fully offline,
+and reports latency percentiles, throughput and errors, with the time
+spent in the (mock) LLM separated from the backend's own overhead.
+
+Requests are sent open-loop: each one is scheduled at its arrival time
+whether or not earlier ones have finished, and its latency is measured
+from that scheduled time, so a backend that falls behind shows up in the
+percentiles instead of silently slowing the generator down. Every message
+carries a "[req <id>]" tag that the mock records against its service
+time; a request's overhead is its end-to-end latency minus that time.
+
+By default the mock LLM and a single backend worker are started here; pass
+--url (and --llm-url) to load an already running backend instead.
+
+Run: python -m backend.benchmarks.bench_chat_load --rps 20 --duration 20
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from collections import Counter
+from typing import Dict, List, Optional
+
+import httpx
+
+from .bench_workers import _start, _wait_ready
+from .mock_llm import LATENCY_DISTRIBUTIONS, _percentiles
+
+MESSAGE = "Tell me a little story about life in Iloilo"
+
+
+class LoadResult:
+    """Per-request outcomes and latencies of one load run"""
+
+    def __init__(self):
+        self.latencies: Dict[str, float] = {}  # request tag -> end-to-end ms, successful requests only
+        self.outcomes: Counter = Counter()
+        self.sent = 0
+        self.elapsed = 0.0
+
+
+async def _drive(
+    base_url: str,
+    rps: float,
+    duration: float,
+    sessions: int,
+    max_outstanding: int,
+    message: str
+) -> LoadResult:
+    result = LoadResult()
+    run = uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=max_outstanding, max_keepalive_connections=max_outstanding)
+    outstanding = set()
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+
+        async def request(index: int, scheduled: float) -> None:
+            tag = f"{run}-{index}"
+            try:
+                response = await client.post("/chat", json={
+                    "message": f"{message} [req {tag}]",
+                    "session_id": f"load-{run}-{index % sessions}",
+                    "bypass_cache": True
+                })
+            except httpx.TransportError as exc:
+                result.outcomes[f"transport:{type(exc).__name__}"] += 1
+                return
+            if response.status_code != 200:
+                result.outcomes[f"http:{response.status_code}"] += 1
+                return
+            elapsed_ms = (time.perf_counter() - scheduled) * 1000
+            if response.json().get("feedback", {}).get("mode") == "fallback":
+                result.outcomes["fallback"] += 1
+                return
+            result.outcomes["ok"] += 1
+            result.latencies[tag] = elapsed_ms
+
+        started = time.perf_counter()
+        for index in range(int(rps * duration)):
+            scheduled = started + index / rps
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            result.sent += 1
+            if len(outstanding) >= max_outstanding:
+                result.outcomes["dropped"] += 1
+                continue
+            task = asyncio.create_task(request(index, scheduled))
+            outstanding.add(task)
+            task.add_done_callback(outstanding.discard)
+        if outstanding:
+            await asyncio.gather(*outstanding)
+        result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def _llm_times(llm_url: str) -> Dict[str, float]:
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        return (await client.get(f"{llm_url}/stats")).json()["by_tag"]
+
+
+def _report(result: LoadResult, llm_by_tag: Dict[str, float], rps: float, duration: float) -> None:
+    completed = sum(count for outcome, count in result.outcomes.items() if outcome != "dropped")
+    print(f"target {rps:g} req/s for {duration:g} s: sent {result.sent}, completed {completed} "
+          f"in {result.elapsed:.1f} s, throughput {result.outcomes['ok'] / result.elapsed:.1f} ok req/s")
+    print("outcomes: " + ", ".join(f"{outcome} {count}" for outcome, count in sorted(result.outcomes.items())))
+
+    end_to_end = list(result.latencies.values())
+    llm: List[float] = []
+    overhead: List[float] = []
+    for tag, latency in result.latencies.items():
+        if tag in llm_by_tag:
+            llm.append(llm_by_tag[tag])
+            overhead.append(latency - llm_by_tag[tag])
+
+    print(f"\n{'ok requests, ms':<18}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for label, values in (("end-to-end", end_to_end), ("LLM (mock)", llm), ("backend overhead", overhead)):
+        row = _percentiles(values)
+        print(f"{label:<18}{row['p50']:>10.1f}{row['p95']:>10.1f}{row['p99']:>10.1f}{row['max']:>10.1f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rps", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--sessions", type=int, default=1000, help="distinct sessions the requests rotate through")
+    parser.add_argument("--max-outstanding", type=int, default=1000, help="requests beyond this many in flight are dropped")
+    parser.add_argument("--message", default=MESSAGE)
+    parser.add_argument("--url", default=None, help="load a running backend instead of starting one")
+    parser.add_argument("--llm-url", default=None, help="its mock LLM, for the LLM/overhead split")
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--llm-port", type=int, default=9100)
+    parser.add_argument("--llm-latency-ms", type=float, default=200.0)
+    parser.add_argument("--llm-latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--llm-latency-spread", type=float, default=0.5)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    processes = []
+    base_url: Optional[str] = args.url
+    llm_url: Optional[str] = args.llm_url
+    try:
+        if base_url is None:
+            llm_url = f"http://127.0.0.1:{args.llm_port}"
+            processes.append(_start([
+                "backend.benchmarks.mock_llm", "--port", str(args.llm_port),
+                "--latency-ms", str(args.llm_latency_ms), "--latency-dist", args.llm_latency_dist,
+                "--latency-spread", str(args.llm_latency_spread),
+                "--tokens-per-second", str(args.llm_tokens_per_second),
+                "--error-rate", str(args.llm_error_rate), "--seed", "1"
+            ], dict(os.environ)))
+            await _wait_ready(f"{llm_url}/stats")
+            base_url = f"http://127.0.0.1:{args.port}"
+            processes.append(_start([
+                "uvicorn", "backend.main:app", "--port", str(args.port), "--log-level", "warning"
+            ], dict(
+                os.environ,
+                STORAGE_BACKEND="memory",
+                OPENAI_API_KEY="sk-mock",
+                OPENAI_BASE_URL=f"{llm_url}/v1",
+                COMPLETION_CACHE_ENABLED="false"
+            )))
+            await _wait_ready(f"{base_url}/")
+
+        result = await _drive(base_url, args.rps, args.duration, args.sessions, args.max_outstanding, args.message)
+        _report(result, await _llm_times(llm_url) if llm_url else {}, args.rps, args.duration)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
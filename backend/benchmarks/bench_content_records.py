@@ -0,0 +1,82 @@
+"""
+LingoKa Content Record Benchmark
+Memory, construction and attribute-access cost of the tuple-backed content
+records against the Pydantic models they replaced (the same shape now used
+only at the API boundary).
+
+Run: python -m backend.benchmarks.bench_content_records
+"""
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from ..languages.hiligaynon import Phrase, get_hiligaynon_module
+from ..models.content import PhraseModel
+
+COPIES = 10_000
+
+
+def _phrase_fields() -> List[Dict[str, Any]]:
+    return [phrase._asdict() for phrase in get_hiligaynon_module().get_phrases_by_category("all")]
+
+
+def _bytes_per_object(factory: Callable[..., Any], fields: List[Dict[str, Any]]) -> float:
+    # Strings are shared with the source dicts, so only per-object overhead is counted
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(**f) for _ in range(COPIES // len(fields) + 1) for f in fields]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(objects)
+
+
+def _construct_us(factory: Callable[..., Any], fields: List[Dict[str, Any]]) -> float:
+    number = 200
+    best = min(timeit.repeat(lambda: [factory(**f) for f in fields], repeat=5, number=number))
+    return best / (number * len(fields)) * 1e6
+
+
+def _render(phrases: List[Any]) -> str:
+    # Mirrors the greetings/phrases template loops
+    parts = []
+    for p in phrases:
+        parts.append(f"**{p.hiligaynon}** - {p.english}\n")
+        parts.append(f"   *Pronunciation: {p.pronunciation}*\n")
+        if p.literal:
+            parts.append(f"Literal: {p.literal}\n")
+        if p.context:
+            parts.append(f"   _{p.context}_\n")
+    return "".join(parts)
+
+
+def _render_us(phrases: List[Any]) -> float:
+    number = 2000
+    best = min(timeit.repeat(lambda: _render(phrases), repeat=5, number=number))
+    return best / (number * len(phrases)) * 1e6
+
+
+def _access_ns(phrase: Any) -> float:
+    number = 1_000_000
+    best = min(timeit.repeat(lambda: phrase.english, repeat=5, number=number))
+    return best / number * 1e9
+
+
+def main() -> None:
+    fields = _phrase_fields()
+    records = [Phrase(**f) for f in fields]
+    models = [PhraseModel(**f) for f in fields]
+
+    rows = [
+        ("bytes per object", _bytes_per_object(PhraseModel, fields), _bytes_per_object(Phrase, fields), "{:.0f}"),
+        ("construct us/object", _construct_us(PhraseModel, fields), _construct_us(Phrase, fields), "{:.2f}"),
+        ("attribute access ns", _access_ns(models[0]), _access_ns(records[0]), "{:.1f}"),
+        ("template render us/phrase", _render_us(models), _render_us(records), "{:.2f}"),
+    ]
+
+    print(f"{'':<28}{'pydantic':>12}{'record':>12}{'ratio':>8}")
+    for label, model_cost, record_cost, fmt in rows:
+        print(f"{label:<28}{fmt.format(model_cost):>12}{fmt.format(record_cost):>12}{model_cost / record_cost:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+LingoKa Exercise Generator Benchmark
+Startup cost of building the distractor pools and steady-state generation
+rate per exercise type, on the shipped content and on synthetic
+vocabularies of growing size.
+
+Run: python -m backend.benchmarks.bench_exercise_generator
+"""
+import random
+import time
+
+from ..languages.exercise_generator import EXERCISE_TYPES, ExerciseGenerator
+from ..languages.hiligaynon import VocabularyWord, get_hiligaynon_module
+from .bench_search import _lexicon
+
+PARTS_OF_SPEECH = ("noun", "verb", "adjective", "number", "pronoun")
+
+
+def _rate(generator: ExerciseGenerator, exercise_type=None, count: int = 20_000) -> float:
+    types = (exercise_type,) if exercise_type else None
+    start = time.perf_counter()
+    generator.generate(count, 1, exercise_types=types)
+    return count / (time.perf_counter() - start)
+
+
+def _synthetic(size: int, rng: random.Random) -> ExerciseGenerator:
+    vocabulary = {}
+    for word, gloss in _lexicon(size, rng):
+        part_of_speech = rng.choice(PARTS_OF_SPEECH)
+        vocabulary.setdefault(f"topic{rng.randrange(20)}", []).append(VocabularyWord(
+            word, gloss, word, part_of_speech, f"{word} {rng.choice(('na', 'ta', 'gid'))} ako", gloss
+        ))
+    return ExerciseGenerator(vocabulary, {})
+
+
+def main(sizes=(1_000, 10_000, 50_000)) -> None:
+    module = get_hiligaynon_module()
+    start = time.perf_counter()
+    generator = module.exercise_generator
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"shipped content: {len(generator)} items, {generator.count()} item/type pairs, pools built in {build_ms:.1f} ms")
+    print(f"{'type':<20}{'exercises/s':>14}")
+    for exercise_type in EXERCISE_TYPES + (None,):
+        print(f"{exercise_type or 'mixed':<20}{_rate(generator, exercise_type):>14,.0f}")
+
+    rng = random.Random(17)
+    print(f"\n{'items':<10}{'build s':>10}{'mixed exercises/s':>20}")
+    for size in sizes:
+        start = time.perf_counter()
+        synthetic = _synthetic(size, rng)
+        build_s = time.perf_counter() - start
+        print(f"{size:<10}{build_s:>10.2f}{_rate(synthetic):>20,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+LingoKa Review Scheduler Benchmark
+Memory and latency of the spaced-repetition scheduler at catalogue scale:
+many users drawing cards from a 5k-item catalogue, plus single decks holding
+the whole catalogue, where "next N due" is answered from the heap instead
+of sorting the deck.
+
+Run: python -m backend.benchmarks.bench_reviews [--users 100000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from typing import List
+
+from ..services.review_scheduler import DAY_SECONDS, ReviewDeck, ReviewScheduler
+
+CATALOG_SIZE = 5000
+NOW = 1_700_000_000
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * pct))]
+
+
+async def _population(users: int, cards_per_user: int, rng: random.Random) -> None:
+    catalog = [f"item-{i}" for i in range(CATALOG_SIZE)]
+    scheduler = ReviewScheduler(max_decks=users)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for user in range(users):
+        await scheduler.add_items(f"user-{user}", rng.sample(catalog, cards_per_user), now=NOW)
+    build_s = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # One quiz of 10 graded items for a random sample of users
+    quizzes = []
+    for _ in range(2000):
+        user = f"user-{rng.randrange(users)}"
+        items = rng.sample(catalog, 10)
+        quizzes.append((user, [(item, rng.randint(0, 5)) for item in items]))
+    start = time.perf_counter()
+    for user, reviews in quizzes:
+        await scheduler.record_reviews(user, reviews, now=NOW)
+    quiz_us = (time.perf_counter() - start) / len(quizzes) * 1e6
+
+    samples = []
+    for _ in range(2000):
+        user = f"user-{rng.randrange(users)}"
+        start = time.perf_counter()
+        await scheduler.due(user, 20, now=NOW + DAY_SECONDS)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+
+    cards = users * cards_per_user
+    print(f"{'users':<28}{users:>12,}")
+    print(f"{'cards':<28}{cards:>12,}")
+    print(f"{'build s':<28}{build_s:>12.2f}")
+    print(f"{'memory MB':<28}{used / 1e6:>12.1f}")
+    print(f"{'bytes per card':<28}{used / cards:>12.1f}")
+    print(f"{'10-item quiz update us':<28}{quiz_us:>12.1f}")
+    print(f"{'due(20) p50 us':<28}{statistics.median(samples):>12.1f}")
+    print(f"{'due(20) p99 us':<28}{_percentile(samples, 0.99):>12.1f}")
+
+
+def _full_deck(limit: int, rng: random.Random) -> None:
+    deck = ReviewDeck()
+    for item_id in range(CATALOG_SIZE):
+        deck.add(item_id, NOW)
+    for item_id in range(CATALOG_SIZE):
+        deck.review(item_id, rng.randint(0, 5), NOW - rng.randrange(30) * DAY_SECONDS)
+    now = NOW + 3 * DAY_SECONDS
+    deck.due(now, limit)
+
+    def sorted_scan() -> List[int]:
+        states = [deck.state(slot) for slot in range(len(deck))]
+        due = sorted((state[1], slot) for slot, state in enumerate(states) if state[1] <= now)
+        return [slot for _, slot in due[:limit]]
+
+    assert sorted_scan() == deck.due(now, limit)
+
+    def timed(fn, runs: int) -> float:
+        start = time.perf_counter()
+        for _ in range(runs):
+            fn()
+        return (time.perf_counter() - start) / runs * 1e6
+
+    # Interleave reviews with queries so the heap carries stale entries
+    def heap_with_churn() -> None:
+        slots = deck.due(now, limit)
+        if slots:
+            deck.review(deck.state(slots[0])[0], 4, now)
+
+    print(f"\n{'5k-card deck, due(' + str(limit) + ')':<28}{'us':>12}")
+    print(f"{'heap':<28}{timed(lambda: deck.due(now, limit), 2000):>12.1f}")
+    print(f"{'heap + 1 review':<28}{timed(heap_with_churn, 2000):>12.1f}")
+    print(f"{'sort full deck':<28}{timed(sorted_scan, 20):>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--cards-per-user", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(15)
+    asyncio.run(_population(args.users, args.cards_per_user, rng))
+    _full_deck(args.limit, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+LingoKa Routing Microbenchmark
+Per-message cost of keyword intent detection: the compiled IntentMatcher
+against the per-call `any(word in message_lower ...)` scans it replaced.
+
+Run: python -m backend.benchmarks.bench_routing
+"""
+import timeit
+from typing import List
+
+from ..agents.intents import DIRECTOR_INTENTS, CONVERSATION_INTENTS, IntentMatcher
+from ..languages.hiligaynon import get_hiligaynon_module
+
+MESSAGES = [
+    "Hi! Can you teach me some greetings?",
+    "How do you say good night in Hiligaynon?",
+    "what does palangga mean",
+    "Give me a quiz on numbers please",
+    "How do I pronounce ngalan?",
+    "Tell me about Ilonggo culture and festivals",
+    "I want to practice common phrases for the market",
+    "How am I doing? Show my progress",
+    "My friend from Iloilo told me a story yesterday and I want to understand it better",
+    "ok",
+]
+
+
+def _legacy_director(message: str) -> str:
+    message_lower = message.lower()
+    if any(word in message_lower for word in [
+        "teach", "learn", "how do you say", "what is", "translate",
+        "greeting", "greetings", "hello", "number", "numbers", "count", "counting",
+        "phrase", "phrases", "vocabulary", "word", "words", "mean", "meaning",
+        "culture", "cultural", "exercise", "practice", "quiz", "lesson",
+        "hiligaynon", "ilonggo", "kumusta", "maayong", "salamat"
+    ]):
+        return "learning"
+    if any(word in message_lower for word in ["my progress", "my stats", "my score", "my level", "my streak", "achievement", "how am i doing"]):
+        return "progress"
+    if any(word in message_lower for word in ["pronounce", "pronunciation guide", "accent", "how to say"]):
+        return "pronunciation"
+    return "default"
+
+
+def _legacy_conversation(message: str) -> str:
+    message_lower = message.lower()
+    if any(word in message_lower for word in ["pronounce", "pronunciation", "how to say", "sound like"]):
+        return "pronunciation"
+    if any(word in message_lower for word in ["culture", "cultural", "tradition", "festival", "custom"]):
+        return "culture"
+    if any(word in message_lower for word in ["exercise", "quiz", "test me", "practice quiz"]):
+        return "exercise"
+    if any(word in message_lower for word in ["number", "count", "counting", "how many", "pila"]):
+        return "numbers"
+    if any(word in message_lower for word in ["phrase", "phrases", "useful phrase", "common phrase", "expression"]):
+        return "phrases"
+    if any(word in message_lower for word in ["greeting", "greetings", "hello", "hi ", "good morning", "maayong", "kumusta"]):
+        return "greetings"
+    return "general"
+
+
+def _legacy(messages: List[str]) -> None:
+    for m in messages:
+        _legacy_director(m)
+        _legacy_conversation(m)
+
+
+def _compiled(messages: List[str]) -> None:
+    for m in messages:
+        DIRECTOR_INTENTS.match(m)
+        CONVERSATION_INTENTS.match(m)
+
+
+def _per_message_us(fn, repeat: int = 5, number: int = 2000) -> float:
+    best = min(timeit.repeat(lambda: fn(MESSAGES), repeat=repeat, number=number))
+    return best / (number * len(MESSAGES)) * 1e6
+
+
+def _lexicon_keywords() -> List[str]:
+    """Every Hiligaynon word and English gloss, as a stand-in for a growing keyword table"""
+    module = get_hiligaynon_module()
+    words = set()
+    for phrase in module.get_phrases_by_category("all"):
+        words.update(phrase.hiligaynon.lower().split())
+        words.update(phrase.english.lower().split())
+    for entries in module.get_vocabulary().values():
+        for entry in entries:
+            words.add(entry.word.lower())
+            words.add(entry.english.lower())
+    return sorted(w.strip("?!.,/()") for w in words if len(w.strip("?!.,/()")) > 2)
+
+
+def _scaling(sizes=(30, 100, 300)) -> None:
+    lexicon = _lexicon_keywords()
+    print(f"\n{'keywords':<12}{'legacy us/msg':>16}{'matcher us/msg':>16}")
+    for size in sizes:
+        keywords = (lexicon * (size // len(lexicon) + 1))[:size]
+        keywords = [f"{k}{i // len(lexicon) or ''}" for i, k in enumerate(keywords)]
+        matcher = IntentMatcher({"lexicon": keywords})
+
+        def legacy(messages: List[str]) -> None:
+            for m in messages:
+                message_lower = m.lower()
+                any(word in message_lower for word in keywords)
+
+        def compiled(messages: List[str]) -> None:
+            for m in messages:
+                matcher.match(m)
+
+        print(f"{size:<12}{_per_message_us(legacy, number=500):>16.2f}{_per_message_us(compiled, number=500):>16.2f}")
+
+
+def main() -> None:
+    legacy = _per_message_us(_legacy)
+    compiled = _per_message_us(_compiled)
+    print(f"{'routing (director + conversation)':<36}{'us/message':>12}")
+    print(f"{'legacy any() scans':<36}{legacy:>12.2f}")
+    print(f"{'compiled IntentMatcher':<36}{compiled:>12.2f}")
+    print(f"{'speedup':<36}{legacy / compiled:>11.2f}x")
+    _scaling()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+LingoKa Search Benchmark
+Query latency of the trigram search index as the lexicon grows, against the
+linear substring scan that search_phrase used to do.
+
+The lexicon is synthetic (random (C)V(C)-syllable words with two-word glosses),
+and queries are entries with one typo, so most of them have no exact
+substring match at all.
+
+Run: python -m backend.benchmarks.bench_search
+"""
+import random
+import statistics
+import time
+from typing import Callable, List, Tuple
+
+from ..languages.search import TrigramIndex
+
+ONSETS = ["b", "d", "g", "h", "k", "l", "m", "n", "ng", "p", "r", "s", "t", "w", "y", ""]
+CODAS = ["", "", "", "b", "d", "g", "k", "l", "m", "n", "ng", "s", "t", "w", "y"]
+GLOSS_WORDS = [
+    "house", "water", "rice", "morning", "evening", "child", "mother", "market", "river", "road",
+    "happy", "tired", "hungry", "small", "big", "cold", "hot", "eat", "drink", "walk", "speak",
+    "friend", "family", "fish", "sun", "rain", "book", "school", "work", "money", "price",
+]
+
+
+def _lexicon(size: int, rng: random.Random) -> List[Tuple[str, str]]:
+    words = set()
+    entries = []
+    while len(entries) < size:
+        word = "".join(
+            rng.choice(ONSETS) + rng.choice("aeiou") + rng.choice(CODAS)
+            for _ in range(rng.randint(2, 3))
+        )
+        if word in words:
+            continue
+        words.add(word)
+        entries.append((word, f"{rng.choice(GLOSS_WORDS)} {rng.choice(GLOSS_WORDS)}"))
+    return entries
+
+
+def _typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    edit = rng.choice(("drop", "swap", "replace"))
+    if edit == "drop":
+        return word[:i] + word[i + 1:]
+    if edit == "swap" and i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice("aeiou") + word[i + 1:]
+
+
+def _latencies_us(fn: Callable[[str], object], queries: List[str]) -> List[float]:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return sorted(samples)
+
+
+def main(sizes=(1_000, 10_000, 50_000), query_count: int = 500) -> None:
+    rng = random.Random(7)
+    print(f"{'entries':<10}{'build s':>9}{'p50 us':>10}{'p99 us':>10}{'recall@5':>10}{'scan p50 us':>13}")
+    for size in sizes:
+        lexicon = _lexicon(size, rng)
+
+        start = time.perf_counter()
+        index = TrigramIndex()
+        for word, gloss in lexicon:
+            index.add("vocabulary", word, (("word", word, 1.0), ("english", gloss, 1.0)))
+        build_s = time.perf_counter() - start
+
+        targets = [rng.choice(lexicon)[0] for _ in range(query_count)]
+        queries = [_typo(word, rng) for word in targets]
+
+        samples = _latencies_us(lambda q: index.search(q, 5), queries)
+        hits = sum(target in [r.item for r in index.search(q, 5)] for target, q in zip(targets, queries))
+
+        def scan(query: str) -> List[str]:
+            query_lower = query.lower()
+            return [w for w, g in lexicon if query_lower in w.lower() or query_lower in g.lower()]
+
+        scan_samples = _latencies_us(scan, queries[:50])
+
+        print(
+            f"{size:<10}{build_s:>9.2f}{statistics.median(samples):>10.1f}"
+            f"{samples[int(len(samples) * 0.99) - 1]:>10.1f}{hits / query_count:>10.2f}"
+            f"{statistics.median(scan_samples):>13.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
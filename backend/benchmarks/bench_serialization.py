@@ -0,0 +1,86 @@
+"""
+LingoKa Serialization Benchmark
+Cost of turning a realistic ChatResponse (vocabulary, feedback, usage and
+suggestions populated) into response bytes: FastAPI's default
+jsonable_encoder + stdlib json path against the fast paths used by the hot
+endpoints, plus rebuilding /agents per request against its cached payload.
+
+Run: python -m backend.benchmarks.bench_serialization
+"""
+import json
+import timeit
+from typing import Callable, List, Tuple
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ..languages.hiligaynon import get_hiligaynon_module
+from ..main import AGENT_CATALOG, AGENTS_PAYLOAD
+from ..models.message import ChatResponse
+from ..services.payloads import CHAT_RESPONSE_ADAPTER, FastJSONResponse, model_response
+
+
+def _chat_response() -> ChatResponse:
+    module = get_hiligaynon_module()
+    phrases = module.get_phrases_by_category("all")[:8]
+    message = "**Hiligaynon Greetings**\n\n" + "".join(
+        f"**{p.hiligaynon}** - {p.english}\n   *Pronunciation: {p.pronunciation}*\n" for p in phrases
+    )
+    return ChatResponse(
+        message=message,
+        agent_type="conversation",
+        session_id="3f0e6c0a-6a43-4c3c-9a55-8b2c1d5f2a11",
+        routed_to="conversation",
+        confidence=0.92,
+        feedback={
+            "topic": "greetings",
+            "level": "beginner",
+            "corrections": [{"original": "maayong aga po", "suggestion": "Maayong aga", "note": "'po' is Tagalog"}],
+            "scores": {"fluency": 0.8, "accuracy": 0.9}
+        },
+        suggestions=["Try greeting someone in the afternoon", "Ask 'Kumusta ka?'", "Practice numbers next"],
+        vocabulary=[
+            {"word": p.hiligaynon, "translation": p.english, "pronunciation": p.pronunciation}
+            for p in phrases
+        ],
+        grammar_notes=["'Maayong' is 'maayo' (good) + the linker 'ng'"],
+        usage={"prompt_tokens": 1834, "completion_tokens": 212, "history_messages": 12, "history_dropped": 3}
+    )
+
+
+def _us(fn: Callable[[], object], number: int = 5000) -> float:
+    return min(timeit.repeat(fn, repeat=5, number=number)) / number * 1e6
+
+
+def _row(label: str, baseline: float, cost: float) -> str:
+    return f"{label:<40}{cost:>10.2f}{baseline / cost:>9.1f}x"
+
+
+def main() -> None:
+    response = _chat_response()
+    assert json.loads(JSONResponse(jsonable_encoder(response)).body) == json.loads(CHAT_RESPONSE_ADAPTER.dump_json(response))
+
+    chat: List[Tuple[str, Callable[[], object]]] = [
+        ("jsonable_encoder + JSONResponse", lambda: JSONResponse(jsonable_encoder(response)).body),
+        ("model_dump + JSONResponse", lambda: JSONResponse(response.model_dump(mode="json")).body),
+        ("model_dump + FastJSONResponse", lambda: FastJSONResponse(response.model_dump(mode="json")).body),
+        ("TypeAdapter.dump_json (model_response)", lambda: model_response(CHAT_RESPONSE_ADAPTER, response).body),
+    ]
+    print(f"ChatResponse: {len(CHAT_RESPONSE_ADAPTER.dump_json(response))} bytes, {len(response.vocabulary)} vocabulary entries")
+    print(f"{'path':<40}{'us':>10}{'speedup':>10}")
+    baseline = _us(chat[0][1])
+    for label, fn in chat:
+        print(_row(label, baseline, _us(fn)))
+
+    print(f"\n/agents: {len(AGENTS_PAYLOAD.body)} bytes")
+    print(f"{'path':<40}{'us':>10}{'speedup':>10}")
+    rebuild = _us(lambda: JSONResponse(jsonable_encoder(json.loads(json.dumps(AGENT_CATALOG)))).body)
+    encode = _us(lambda: JSONResponse(jsonable_encoder(AGENT_CATALOG)).body)
+    cached = _us(lambda: AGENTS_PAYLOAD.body, number=100_000)
+    print(_row("rebuild dict + default encode", rebuild, rebuild))
+    print(_row("default encode of a constant dict", rebuild, encode))
+    print(_row("cached payload", rebuild, cached))
+
+
+if __name__ == "__main__":
+    main()
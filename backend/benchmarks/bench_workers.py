@@ -0,0 +1,130 @@
+"""
+LingoKa Multi-Worker Throughput Benchmark
+Measures /chat throughput with uvicorn running 1, 2, 4 and 8 workers in
+shared-state mode against the mock LLM, and checks that no turns are lost
+while sessions hop between workers.
+
+Run: python -m backend.benchmarks.bench_workers --workers 1,2,4,8 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+
+MESSAGE = "Tell me a little story about life in Iloilo"
+
+
+def _start(args: List[str], env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-m"] + args, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def _wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"{url} did not come up")
+
+
+async def _drive(base_url: str, duration: float, concurrency: int, sessions_per_client: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    sent: Dict[str, int] = {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits) as client:
+        deadline = time.monotonic() + duration
+
+        async def worker(index: int) -> None:
+            nonlocal errors
+            # Each client owns its sessions so turns on one session never overlap
+            sessions = [f"bench-{index}-{n}" for n in range(sessions_per_client)]
+            turn = 0
+            while time.monotonic() < deadline:
+                session_id = sessions[turn % len(sessions)]
+                turn += 1
+                start = time.perf_counter()
+                try:
+                    response = await client.post("/chat", json={
+                        "message": MESSAGE, "session_id": session_id, "bypass_cache": True
+                    })
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                    sent[session_id] = sent.get(session_id, 0) + 1
+                except httpx.HTTPError:
+                    errors += 1
+
+        started = time.monotonic()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.monotonic() - started
+
+        lost = 0
+        for session_id, count in sent.items():
+            history = (await client.get(f"/sessions/{session_id}/history")).json()
+            lost += max(0, 2 * count - len(history["messages"]))
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "errors": errors,
+        "lost_messages": lost
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--sessions-per-client", type=int, default=4)
+    parser.add_argument("--llm-latency-ms", type=float, default=50.0)
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--llm-port", type=int, default=9100)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    mock = _start(["backend.benchmarks.mock_llm", "--port", str(args.llm_port), "--latency-ms", str(args.llm_latency_ms)], env)
+    try:
+        await _wait_ready(f"http://127.0.0.1:{args.llm_port}/docs")
+        print(f"{'workers':<10}{'req/s':>10}{'p50 ms':>10}{'errors':>10}{'lost msgs':>12}")
+
+        for workers in [int(w) for w in args.workers.split(",")]:
+            with tempfile.TemporaryDirectory() as tmp:
+                server_env = dict(
+                    env,
+                    SHARED_STATE="true",
+                    STORAGE_SQLITE_PATH=os.path.join(tmp, "lingoka.db"),
+                    OPENAI_API_KEY="sk-mock",
+                    OPENAI_BASE_URL=f"http://127.0.0.1:{args.llm_port}/v1",
+                    COMPLETION_CACHE_ENABLED="false",
+                    SESSION_MAX_HISTORY_MESSAGES="100000"
+                )
+                server = _start([
+                    "uvicorn", "backend.main:app", "--port", str(args.port),
+                    "--workers", str(workers), "--log-level", "warning"
+                ], server_env)
+                try:
+                    await _wait_ready(f"http://127.0.0.1:{args.port}/")
+                    result = await _drive(f"http://127.0.0.1:{args.port}", args.duration, args.concurrency, args.sessions_per_client)
+                finally:
+                    server.terminate()
+                    server.wait()
+            print(f"{workers:<10}{result['rps']:>10.1f}{result['p50_ms']:>10.1f}{result['errors']:>10}{result['lost_messages']:>12}")
+    finally:
+        mock.terminate()
+        mock.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""
+LingoKa Benchmark Corpus
+Fixed, realistic learner inputs shared by the microbenchmark suite.
+
+The messages cover every routing intent in roughly the mix learners send
+them (greetings and general chat dominate), in the shapes they arrive in:
+short and long, mixed Hiligaynon and English, misspelled, with emoji and
+punctuation. Search queries include exact words, partial words, English
+glosses and one-typo misspellings.
+
+Keep these lists stable: benchmark baselines are only comparable while the
+corpus is unchanged. Add a new list rather than editing one.
+"""
+
+LEARNER_MESSAGES = (
+    # Greetings
+    "Hi! Can you teach me some greetings?",
+    "hello",
+    "Kumusta ka?",
+    "Maayong aga! How do I say good morning back?",
+    "how do you greet someone in the afternoon",
+    "hi there 👋 i'm new here",
+    "What's the polite way to say hello to my lola?",
+    "good morning!!",
+    # Numbers
+    "teach me numbers",
+    "How do I count to ten in Hiligaynon?",
+    "pila ini? what does that mean",
+    "how many ways are there to say 'one'?",
+    "Can we practice counting from isa to napulo",
+    # Pronunciation
+    "How do I pronounce ngalan?",
+    "what does 'ng' sound like at the start of a word",
+    "pronunciation guide please",
+    "I keep stressing the wrong syllable, how to say maayo properly?",
+    # Culture
+    "Tell me about Ilonggo culture and festivals",
+    "What is the Dinagyang festival?",
+    "are there any traditions around eating together",
+    "Why do people say 'Kaon na ta'? Is it a custom?",
+    # Exercises
+    "Give me a quiz on numbers please",
+    "test me on greetings",
+    "can I have an exercise",
+    "practice quiz!",
+    # Phrases
+    "I want to practice common phrases for the market",
+    "useful phrases for traveling to Iloilo",
+    "teach me some expressions of gratitude",
+    "what are common phrases at a family dinner",
+    # Progress
+    "How am I doing? Show my progress",
+    "what's my streak",
+    "show my stats",
+    # Vocabulary and translation
+    "what does palangga mean",
+    "How do you say 'I love you' in Hiligaynon?",
+    "translate: where is the market",
+    "What is the word for water?",
+    "is 'gid' the same as 'very'?",
+    "meaning of pasensya",
+    # Thanks and farewells
+    "salamat gid!",
+    "thank you so much",
+    "ok bye, paalam na",
+    # General conversation
+    "ok",
+    "yes",
+    "I went to the beach yesterday with my cousins",
+    "My friend from Iloilo told me a story yesterday and I want to understand it better",
+    "Can you help me write a short message to my mother-in-law for her birthday?",
+    "I'm moving to Bacolod next month for work and I'm nervous about not understanding anyone",
+    "Maayo man ako, ikaw?",
+    "Ang ngalan ko si Ana. Taga-Manila ako.",
+    "wat is the diffrence between ka and kamo",
+    "i dont understnd the last part can u explain again",
+    "Why does Hiligaynon sound so different from Tagalog even though some words are the same?",
+    "lets just chat in hiligaynon for a bit, I'll try my best",
+    "What should I focus on this week if I only have 10 minutes a day?",
+    "Nagakaon ako sang kan-on kag isda kada adlaw.",
+    "😅 sorry I forgot everything from yesterday",
+    "Could you correct this: 'Maayong gab-i po, kumusta ka na?'",
+    "tell me a joke in hiligaynon",
+    "What's a good Ilonggo dish I should try first and how do I order it?",
+    "I'm a heritage speaker — my parents speak it but I never learned. Where do I start?",
+)
+
+SEARCH_QUERIES = (
+    # Exact Hiligaynon
+    "salamat",
+    "maayong aga",
+    "palangga",
+    "kumusta",
+    "paalam",
+    # Partial words
+    "maayo",
+    "sala",
+    "kum",
+    # English glosses
+    "thank you",
+    "good morning",
+    "how much",
+    "goodbye",
+    "water",
+    # One-typo misspellings
+    "salamt",
+    "maayng aga",
+    "palanga",
+    "kumsta",
+    "pasensia",
+    # Misses
+    "zzz",
+    "spaceship",
+)
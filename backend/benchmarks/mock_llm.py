@@ -0,0 +1,193 @@
+"""
+LingoKa Mock LLM Server
+Minimal OpenAI-compatible chat completions endpoint for offline benchmarks.
+
+Each request waits for a time-to-first-token drawn from the configured
+latency distribution, then produces its reply at a fixed token rate
+(chunk by chunk when streaming). A configurable fraction of requests fails
+with an OpenAI-style error instead. GET /stats reports what the mock
+served: request and error counts, latency percentiles and, for load tests,
+the time spent on each request tagged with "[req <id>]" in its last user
+message.
+
+Run: python -m backend.benchmarks.mock_llm --port 9100 --latency-ms 200
+Then start the backend with OPENAI_BASE_URL=http://127.0.0.1:9100/v1 and
+any OPENAI_API_KEY.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+REPLY = (
+    "Maayo gid! (Very good!) In Hiligaynon, 'Maayong gab-i' (mah-AH-yong gahb-EE) "
+    "means 'Good evening'. Can you try saying it?"
+)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+_REQUEST_TAG = re.compile(r"\[req ([\w-]+)\]")
+
+
+class LatencyModel:
+    """Time-to-first-token sampler around a median latency"""
+
+    def __init__(self, median_ms: float, distribution: str = "fixed", spread: float = 0.5, seed: Optional[int] = None):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of: {', '.join(LATENCY_DISTRIBUTIONS)}")
+        self.median_ms = median_ms
+        self.distribution = distribution
+        self.spread = spread
+        self._rng = random.Random(seed)
+
+    def sample_ms(self) -> float:
+        """One latency in milliseconds; `spread` is the relative range (uniform) or log-space sigma (lognormal)"""
+        if self.distribution == "uniform":
+            return self._rng.uniform(self.median_ms * (1 - self.spread), self.median_ms * (1 + self.spread))
+        if self.distribution == "exponential":
+            return self._rng.expovariate(math.log(2) / self.median_ms) if self.median_ms > 0 else 0.0
+        if self.distribution == "lognormal":
+            return self.median_ms * self._rng.lognormvariate(0.0, self.spread)
+        return self.median_ms
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    if not values:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": ordered[-1]}
+
+
+def _reply(tokens: int) -> List[str]:
+    words = REPLY.split(" ")
+    return [words[i % len(words)] for i in range(tokens or len(words))]
+
+
+def create_app(
+    latency_ms: float = 200.0,
+    distribution: str = "fixed",
+    spread: float = 0.5,
+    tokens_per_second: float = 0.0,
+    reply_tokens: int = 0,
+    error_rate: float = 0.0,
+    error_status: int = 500,
+    seed: Optional[int] = None
+) -> FastAPI:
+    """
+    Build the mock server.
+
+    tokens_per_second=0 produces the whole reply at once; reply_tokens=0
+    uses the canned reply's own length.
+    """
+    app = FastAPI(title="LingoKa Mock LLM")
+    latency = LatencyModel(latency_ms, distribution, spread, seed)
+    failures = random.Random(None if seed is None else seed + 1)
+    words = _reply(reply_tokens)
+    token_delay = 1.0 / tokens_per_second if tokens_per_second > 0 else 0.0
+    served: List[float] = []
+    by_tag: Dict[str, float] = {}
+    counters = {"requests": 0, "errors": 0, "streams": 0}
+
+    def record(body: dict, started: float) -> None:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        served.append(elapsed_ms)
+        messages = body.get("messages") or [{}]
+        tag = _REQUEST_TAG.search(str(messages[-1].get("content", "")))
+        if tag:
+            by_tag[tag.group(1)] = elapsed_ms
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        started = time.perf_counter()
+        body = await request.json()
+        counters["requests"] += 1
+        created = int(time.time())
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        model = body.get("model", "mock")
+
+        if error_rate and failures.random() < error_rate:
+            counters["errors"] += 1
+            return JSONResponse(
+                {"error": {"message": "mock upstream failure", "type": "server_error", "code": None}},
+                status_code=error_status
+            )
+
+        await asyncio.sleep(latency.sample_ms() / 1000)
+
+        if body.get("stream"):
+            counters["streams"] += 1
+
+            async def stream():
+                for i, word in enumerate(words):
+                    if i and token_delay:
+                        await asyncio.sleep(token_delay)
+                    chunk = {
+                        "id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model,
+                        "choices": [{"index": 0, "delta": {"content": word + " "}, "finish_reason": None}]
+                    }
+                    yield f"data: {json.dumps(chunk)}\n\n"
+                yield "data: [DONE]\n\n"
+                record(body, started)
+            return StreamingResponse(stream(), media_type="text/event-stream")
+
+        if token_delay:
+            await asyncio.sleep(token_delay * len(words))
+        content = " ".join(words)
+        record(body, started)
+        return JSONResponse({
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": len(words), "total_tokens": len(words)}
+        })
+
+    @app.get("/stats")
+    async def stats():
+        return dict(counters, latency_ms=_percentiles(served), by_tag=by_tag)
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        served.clear()
+        by_tag.clear()
+        counters.update(requests=0, errors=0, streams=0)
+        return {"reset": True}
+
+    return app
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible mock LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="median time to first token")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-spread", type=float, default=0.5, help="uniform: relative range; lognormal: sigma")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="0 returns the reply at once")
+    parser.add_argument("--reply-tokens", type=int, default=0, help="0 uses the canned reply's length")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    app = create_app(
+        args.latency_ms, args.latency_dist, args.latency_spread, args.tokens_per_second,
+        args.reply_tokens, args.error_rate, args.error_status, args.seed
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
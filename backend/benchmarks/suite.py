@@ -0,0 +1,227 @@
+"""
+LingoKa Microbenchmark Suite
+Times each request-path stage in isolation over the fixed learner corpus:
+keyword routing, conversation handler dispatch, the teaching renderers,
+content search and ChatResponse serialization.
+
+Every stage processes its whole workload (one op per corpus entry) in a
+timed loop; the suite reports the best and median cost per op over several
+repeats. Each run is compared against the baseline committed next to this
+module (baseline.json): a stage whose best time per op grew by more than
+the threshold is flagged as a regression and the run exits non-zero.
+
+Baselines are specific to the machine and Python build they were taken
+on. On another box, save a local baseline first (--save PATH) and compare
+against that; refresh the committed one with a bare --save when a change
+moves the numbers on purpose.
+
+Run: python -m backend.benchmarks.suite [--only routing,search] [--threshold 0.1]
+                                         [--compare PATH | --no-compare] [--save [PATH]]
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from ..agents.conversation import ConversationAgent
+from ..agents.director import DirectorAgent
+from ..languages.hiligaynon import get_hiligaynon_module
+from ..models.message import ChatResponse
+from ..services.payloads import CHAT_RESPONSE_ADAPTER
+from .corpus import LEARNER_MESSAGES, SEARCH_QUERIES
+
+BASELINE_FORMAT = 1
+BASELINE_PATH = Path(__file__).resolve().with_name("baseline.json")
+DEFAULT_THRESHOLD = 0.10
+
+
+class Stage(NamedTuple):
+    """One timed workload: `run` performs `ops` operations"""
+    name: str
+    ops: int
+    run: Callable[[], None]
+
+
+class StageResult(NamedTuple):
+    best_us: float
+    median_us: float
+    ops: int
+
+
+def _stages() -> List[Stage]:
+    module = get_hiligaynon_module()
+    director = DirectorAgent()
+    agent = ConversationAgent(use_cache=False)
+    loop = asyncio.new_event_loop()
+
+    templates = (agent._teach_greetings, agent._teach_numbers, agent._teach_pronunciation)
+    template_messages = [m for m in LEARNER_MESSAGES if agent._select_handler(m) in templates]
+    responses: List[ChatResponse] = [
+        loop.run_until_complete(agent._select_handler(m)(m))
+        for m in LEARNER_MESSAGES if agent._select_handler(m) in templates + (agent._teach_culture, agent._teach_phrases)
+    ]
+    agent.warm_templates()
+
+    def routing_director() -> None:
+        for message in LEARNER_MESSAGES:
+            director._keyword_routing(message)
+
+    def conversation_dispatch() -> None:
+        for message in LEARNER_MESSAGES:
+            agent._select_handler(message)
+
+    def respond_templates() -> None:
+        async def batch() -> None:
+            for message in template_messages:
+                await agent.respond(message)
+        loop.run_until_complete(batch())
+
+    def teach(handler: Callable, count: int = 20) -> Callable[[], None]:
+        def run() -> None:
+            # Culture notes and phrases are picked at random; fix the picks
+            random.seed(0)
+
+            async def batch() -> None:
+                for _ in range(count):
+                    await handler("tell me more")
+            loop.run_until_complete(batch())
+        return run
+
+    def search_phrase() -> None:
+        for query in SEARCH_QUERIES:
+            module.search_phrase(query)
+
+    def search_all() -> None:
+        for query in SEARCH_QUERIES:
+            module.search(query)
+
+    def serialize() -> None:
+        for response in responses:
+            CHAT_RESPONSE_ADAPTER.dump_json(response)
+
+    return [
+        Stage("routing.director", len(LEARNER_MESSAGES), routing_director),
+        Stage("routing.conversation_dispatch", len(LEARNER_MESSAGES), conversation_dispatch),
+        Stage("render.greetings", 1, agent._render_greetings),
+        Stage("render.numbers", 1, agent._render_numbers),
+        Stage("render.pronunciation", 1, agent._render_pronunciation),
+        Stage("respond.templates", len(template_messages), respond_templates),
+        Stage("teach.culture", 20, teach(agent._teach_culture)),
+        Stage("teach.phrases", 20, teach(agent._teach_phrases)),
+        Stage("search.phrase", len(SEARCH_QUERIES), search_phrase),
+        Stage("search.all", len(SEARCH_QUERIES), search_all),
+        Stage("serialize.chat_response", len(responses), serialize),
+    ]
+
+
+def _time(stage: Stage, repeat: int) -> StageResult:
+    timer = timeit.Timer(stage.run)
+    number, _ = timer.autorange()
+    per_op = [elapsed / number / stage.ops * 1e6 for elapsed in timer.repeat(repeat, number)]
+    return StageResult(min(per_op), statistics.median(per_op), stage.ops)
+
+
+def run(only: Optional[List[str]] = None, repeat: int = 5) -> Dict[str, StageResult]:
+    """Time every stage (or those whose names start with one of `only`)"""
+    results = {}
+    for stage in _stages():
+        if only and not any(stage.name.startswith(prefix) for prefix in only):
+            continue
+        results[stage.name] = _time(stage, repeat)
+    return results
+
+
+def save(results: Dict[str, StageResult], path: str) -> None:
+    """Write results as a JSON baseline"""
+    document = {
+        "format": BASELINE_FORMAT,
+        "created": datetime.utcnow().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "stages": {name: result._asdict() for name, result in results.items()}
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load(path: str) -> Dict[str, StageResult]:
+    """Read a JSON baseline"""
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("format") != BASELINE_FORMAT:
+        raise ValueError(f"{path}: unsupported baseline format {document.get('format')!r}")
+    return {name: StageResult(**result) for name, result in document["stages"].items()}
+
+
+def compare(
+    results: Dict[str, StageResult],
+    baseline: Dict[str, StageResult],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """Print results against a baseline; returns the stages that regressed beyond the threshold"""
+    regressions = []
+    print(f"{'stage':<32}{'ops':>5}{'base us/op':>12}{'now us/op':>12}{'change':>9}  status")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<32}{result.ops:>5}{'-':>12}{result.best_us:>12.2f}{'':>9}  new")
+            continue
+        change = result.best_us / base.best_us - 1
+        status = "ok"
+        if base.ops != result.ops:
+            status = "corpus changed"
+        elif change > threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            status = "faster"
+        print(f"{name:<32}{result.ops:>5}{base.best_us:>12.2f}{result.best_us:>12.2f}{change:>+9.1%}  {status}")
+    return regressions
+
+
+def report(results: Dict[str, StageResult]) -> None:
+    print(f"{'stage':<32}{'ops':>5}{'best us/op':>12}{'median us/op':>14}")
+    for name, result in results.items():
+        print(f"{name:<32}{result.ops:>5}{result.best_us:>12.2f}{result.median_us:>14.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", default=None, help="comma-separated stage name prefixes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--save", metavar="PATH", nargs="?", const=str(BASELINE_PATH),
+        help="write the results as a baseline (default: the committed baseline)"
+    )
+    parser.add_argument(
+        "--compare", metavar="PATH", default=str(BASELINE_PATH) if BASELINE_PATH.exists() else None,
+        help="compare against a saved baseline (default: the committed baseline)"
+    )
+    parser.add_argument("--no-compare", dest="compare", action="store_const", const=None, help="only report timings")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown flagged as a regression")
+    args = parser.parse_args()
+
+    results = run(args.only.split(",") if args.only else None, args.repeat)
+    if args.compare:
+        regressions = compare(results, load(args.compare), args.threshold)
+    else:
+        report(results)
+        regressions = []
+    if args.save:
+        save(results, args.save)
+        print(f"\nbaseline saved to {args.save}")
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
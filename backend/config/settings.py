@@ -3,6 +3,7 @@ LingoKa Configuration Settings
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+import os
 from typing import Optional
 
 
@@ -24,6 +25,7 @@ class Settings(BaseSettings):
 
     # AI Service API Keys
     OPENAI_API_KEY: Optional[str] = None
+    OPENAI_BASE_URL: Optional[str] = None  # Point at an OpenAI-compatible server (e.g. a local mock)
     ANTHROPIC_API_KEY: Optional[str] = None
     ELEVENLABS_API_KEY: Optional[str] = None
 
@@ -36,6 +38,35 @@ class Settings(BaseSettings):
     FIRESTORE_COLLECTION_LESSONS: str = "lessons"
     FIRESTORE_COLLECTION_PROGRESS: str = "progress"
     FIRESTORE_COLLECTION_SESSIONS: str = "sessions"
+    FIRESTORE_COLLECTION_EXERCISES: str = "exercises"
+
+    # Persistent Storage (SQLite stand-in for Firestore)
+    DATA_DIR: str = "~/.lingoka"  # relative storage paths resolve here, not against the working directory
+    STORAGE_BACKEND: str = "sqlite"  # sqlite or memory
+    STORAGE_SQLITE_PATH: str = "lingoka.db"
+    STORAGE_FLUSH_INTERVAL_SECONDS: float = 0.5
+    STORAGE_MAX_BATCH_SIZE: int = 500
+    CONTENT_PACK_DIR: str = "packs"  # compiled language content packs
+    # Run several uvicorn workers against one shared SQLite file
+    SHARED_STATE: bool = False
+
+    # Session Storage
+    SESSION_MAX_ACTIVE: int = 10000
+    SESSION_IDLE_TTL_SECONDS: float = 1800.0
+    SESSION_MAX_HISTORY_MESSAGES: int = 100
+    SESSION_HISTORY_HOT_MESSAGES: int = 20
+    SESSION_HISTORY_COMPRESS_MIN_CHARS: Optional[int] = 256  # None disables compression
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 60.0
+    MAX_USER_PROFILES: int = 100000
+
+    # Spaced Repetition
+    REVIEW_MAX_DECKS: int = 100000  # users whose review decks stay in memory
+    REVIEW_DUE_LIMIT: int = 20
+
+    # Exercises
+    EXERCISE_MAX_PENDING: int = 100000
+    EXERCISE_TTL_SECONDS: float = 3600.0
+    EXERCISE_SWEEP_INTERVAL_SECONDS: float = 60.0
 
     # Security
     SECRET_KEY: str = "dev-secret-key-change-in-production"
@@ -47,6 +78,37 @@ class Settings(BaseSettings):
     DEFAULT_MODEL: str = "gpt-4-turbo-preview"
     TEMPERATURE: float = 0.7
     MAX_TOKENS: int = 2000
+    PROMPT_TOKEN_BUDGET: int = 6000  # System prompt + packed history + user message
+
+    # LLM Connection Pool (shared by all agents via the LLM gateway)
+    LLM_POOL_MAX_CONNECTIONS: int = 100
+    LLM_POOL_MAX_KEEPALIVE: int = 20
+    LLM_POOL_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_REQUEST_TIMEOUT: float = 60.0
+    LLM_MAX_RETRIES: int = 2  # Retries after the first attempt, while the request deadline allows
+
+    # LLM Admission Control
+    LLM_MAX_IN_FLIGHT: int = 32
+    LLM_MAX_QUEUE: int = 256
+    LLM_QUEUE_TIMEOUT_SECONDS: float = 5.0
+    LLM_COALESCE_IDENTICAL: bool = True  # Share one upstream call between identical concurrent prompts
+
+    # LLM Deadlines, Retries & Circuit Breaker
+    CHAT_DEADLINE_SECONDS: float = 20.0  # End-to-end budget for a chat turn's LLM work
+    LLM_RETRY_BASE_DELAY: float = 0.25
+    LLM_RETRY_MAX_DELAY: float = 2.0
+    LLM_MIN_ATTEMPT_SECONDS: float = 1.0  # Don't start a retry with less of the deadline left
+    LLM_BREAKER_FAILURE_THRESHOLD: int = 5  # Consecutive failed attempts that open the breaker
+    LLM_BREAKER_RESET_SECONDS: float = 30.0
+
+    # LLM Completion Cache
+    COMPLETION_CACHE_ENABLED: bool = True
+    COMPLETION_CACHE_BACKEND: str = "memory"  # memory or sqlite
+    COMPLETION_CACHE_PATH: str = "lingoka_completions.db"
+    COMPLETION_CACHE_MAX_ENTRIES: int = 10000
+    COMPLETION_CACHE_TTL_SECONDS: float = 3600.0
+    COMPLETION_CACHE_HISTORY_WINDOW: int = 10
 
     # Speech Services
     WHISPER_MODEL: str = "whisper-1"
@@ -58,6 +120,10 @@ class Settings(BaseSettings):
     ENABLE_GAMIFICATION: bool = True
     ENABLE_ANALYTICS: bool = True
 
+    def data_path(self, path: str) -> str:
+        """Resolve a storage path against DATA_DIR; absolute paths are kept as they are"""
+        return os.path.join(os.path.expanduser(self.DATA_DIR), os.path.expanduser(path))
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
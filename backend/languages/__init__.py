@@ -1,6 +1,44 @@
 """
 LingoKa Language Modules
+Registry of language content, discovered by language code.
+
+Each language's content is authored under languages/data/<code>.json (or
+.yaml) and served from its compiled, memory-mapped content pack.
 """
+from typing import Callable, Dict, List
+from .packs import ContentPack, ContentPackError, get_pack_registry
 from .hiligaynon import HiligaynonModule, get_hiligaynon_module
 
-__all__ = ["HiligaynonModule", "get_hiligaynon_module"]
+# Language modules with teaching logic on top of their content pack
+LANGUAGE_MODULES: Dict[str, Callable[[], HiligaynonModule]] = {
+    HiligaynonModule.LANGUAGE_CODE: get_hiligaynon_module,
+}
+
+
+def available_languages() -> List[str]:
+    """Language codes with a content pack (compiled or buildable from source)"""
+    return get_pack_registry().available()
+
+
+def get_content_pack(code: str) -> ContentPack:
+    """Get the memory-mapped content pack for a language"""
+    return get_pack_registry().get(code)
+
+
+def get_language_module(code: str) -> HiligaynonModule:
+    """Get the process-wide language module for a language code"""
+    try:
+        return LANGUAGE_MODULES[code]()
+    except KeyError:
+        raise ContentPackError(f"no language module for {code!r}")
+
+
+__all__ = [
+    "ContentPack",
+    "ContentPackError",
+    "HiligaynonModule",
+    "available_languages",
+    "get_content_pack",
+    "get_hiligaynon_module",
+    "get_language_module",
+]
@@ -0,0 +1,30 @@
+"""
+LingoKa Content Pack Builder
+Compiles authored language content (languages/data/*.json|yaml) into
+binary content packs (<CONTENT_PACK_DIR>/*.lkpack).
+
+Run: python -m backend.languages.build_packs [source ...] [--out DIR]
+"""
+import argparse
+from pathlib import Path
+
+from .packs import PACK_SUFFIX, SOURCE_DIR, SOURCE_SUFFIXES, build_pack, default_pack_dir, load_source
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compile language content into binary content packs")
+    parser.add_argument("sources", nargs="*", help=f"source files (default: every file in {SOURCE_DIR})")
+    parser.add_argument("--out", default=None, help="output directory (default: CONTENT_PACK_DIR)")
+    args = parser.parse_args()
+    out = Path(args.out) if args.out else default_pack_dir()
+
+    sources = [Path(s) for s in args.sources] or sorted(
+        p for p in SOURCE_DIR.iterdir() if p.suffix in SOURCE_SUFFIXES
+    )
+    for source in sources:
+        path = build_pack(load_source(source), out / f"{source.stem}{PACK_SUFFIX}")
+        print(f"{source.name} -> {path} ({path.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
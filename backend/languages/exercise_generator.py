@@ -0,0 +1,238 @@
+"""
+LingoKa Exercise Generator
+Derives practice exercises from vocabulary and phrases, without the LLM.
+
+Every vocabulary word and phrase becomes a source item with an English
+prompt and a Hiligaynon answer. Distractors are chosen once per item when
+the generator is built: the items closest in length within the same group
+(part of speech for vocabulary, category for phrases), topped up from
+neighbouring groups when a group is small. Fill-in-the-blank variants are
+precomputed too, so producing an exercise is a seeded random pick plus
+string formatting.
+
+Generation is deterministic: the same seed and filters always yield the
+same exercises for a given content version.
+"""
+import random
+import re
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from .grading import answer_key
+from .hiligaynon import DifficultyLevel, Exercise, Phrase, VocabularyWord
+
+EXERCISE_TYPES = ("multiple_choice", "fill_blank", "translate", "matching")
+
+# Distractors kept per item, and how many a choice exercise shows
+DISTRACTOR_POOL_SIZE = 6
+CHOICE_DISTRACTORS = 3
+
+BLANK = "_____"
+
+# Words shorter than this (after normalization) are never blanked out
+MIN_BLANK_CHARS = 3
+
+_TOKEN = re.compile(r"^(\W*)(.*?)(\W*)$")
+
+
+class _Item(NamedTuple):
+    group: str
+    fallback_group: str
+    english: str
+    hiligaynon: str
+    note: Optional[str]
+    difficulty: DifficultyLevel
+    blanks: Tuple[Tuple[str, str], ...]  # (question, answer) fill-blank variants
+
+
+def _difficulty(text: str) -> DifficultyLevel:
+    """Longer answers are harder to produce"""
+    words = len(text.split())
+    if words <= 2:
+        return DifficultyLevel.BEGINNER
+    if words <= 4:
+        return DifficultyLevel.ELEMENTARY
+    return DifficultyLevel.INTERMEDIATE
+
+
+def _blank_out(sentence: str, translation: str, only: Optional[str] = None) -> Tuple[Tuple[str, str], ...]:
+    """Fill-blank variants of a sentence, one per blankable word (or only `only`)"""
+    tokens = sentence.split()
+    if len(tokens) < 2:
+        return ()
+    variants = []
+    for i, token in enumerate(tokens):
+        lead, word, trail = _TOKEN.match(token).groups()
+        key = answer_key(word)
+        if len(key) < MIN_BLANK_CHARS or (only is not None and key != answer_key(only)):
+            continue
+        question = " ".join(tokens[:i] + [f"{lead}{BLANK}{trail}"] + tokens[i + 1:])
+        variants.append((f"Complete: '{question}' ({translation})", word))
+    return tuple(variants)
+
+
+def _vocabulary_item(category: str, word: VocabularyWord) -> _Item:
+    blanks = ()
+    if word.example_sentence and word.example_translation:
+        blanks = _blank_out(word.example_sentence, word.example_translation, only=word.word)
+    note = f"Example: '{word.example_sentence}' ({word.example_translation})" if word.example_sentence else None
+    return _Item(
+        f"vocabulary:{word.part_of_speech}", f"vocabulary:{category}", word.english, word.word,
+        note, _difficulty(word.word), blanks
+    )
+
+
+def _phrase_item(category: str, phrase: Phrase) -> _Item:
+    note = phrase.context or (f"Literally: '{phrase.literal}'" if phrase.literal else None)
+    return _Item(
+        f"phrases:{category}", "phrases", phrase.english, phrase.hiligaynon,
+        note, _difficulty(phrase.hiligaynon), _blank_out(phrase.hiligaynon, phrase.english)
+    )
+
+
+def _by_length(members: Sequence[int], items: Sequence[_Item]) -> Tuple[List[int], List[int]]:
+    ordered = sorted(members, key=lambda i: (len(items[i].hiligaynon), i))
+    return ordered, [len(items[i].hiligaynon) for i in ordered]
+
+
+class ExerciseGenerator:
+    """Template-based exercise factory with precomputed distractor pools"""
+
+    def __init__(
+        self,
+        vocabulary: Mapping[str, Sequence[VocabularyWord]],
+        phrases: Mapping[str, Sequence[Phrase]],
+        pool_size: int = DISTRACTOR_POOL_SIZE
+    ):
+        items: List[_Item] = []
+        for category, words in vocabulary.items():
+            items.extend(_vocabulary_item(category, word) for word in words)
+        for category, category_phrases in phrases.items():
+            items.extend(_phrase_item(category, phrase) for phrase in category_phrases)
+        self._items: Tuple[_Item, ...] = tuple(items)
+        self._pools: Tuple[Tuple[int, ...], ...] = self._build_pools(pool_size)
+
+        # Every (item, exercise type) pair the generator can produce, by difficulty
+        pairs: Dict[Optional[DifficultyLevel], List[Tuple[int, str]]] = {None: []}
+        for index, item in enumerate(self._items):
+            for exercise_type in EXERCISE_TYPES:
+                if exercise_type == "fill_blank" and not item.blanks:
+                    continue
+                if exercise_type in ("multiple_choice", "matching") and len(self._pools[index]) < CHOICE_DISTRACTORS:
+                    continue
+                pairs[None].append((index, exercise_type))
+                pairs.setdefault(item.difficulty, []).append((index, exercise_type))
+        self._pairs = {difficulty: tuple(found) for difficulty, found in pairs.items()}
+        self._filtered: Dict[Tuple[Optional[DifficultyLevel], Optional[Tuple[str, ...]]], Tuple[Tuple[int, str], ...]] = {}
+
+    def _build_pools(self, pool_size: int) -> Tuple[Tuple[int, ...], ...]:
+        """Nearest-length distractors per item: own group first, then its fallback group"""
+        items = self._items
+        groups: Dict[str, List[int]] = {}
+        for index, item in enumerate(items):
+            groups.setdefault(item.group, []).append(index)
+            groups.setdefault(item.fallback_group, []).append(index)
+        ordered = {name: _by_length(members, items) for name, members in groups.items()}
+
+        pools = []
+        for index, item in enumerate(items):
+            taken = {answer_key(item.hiligaynon)}
+            glosses = {answer_key(item.english)}
+            pool: List[int] = []
+            for name in (item.group, item.fallback_group):
+                members, lengths = ordered[name]
+                self._take_nearest(members, lengths, len(item.hiligaynon), pool_size, pool, taken, glosses)
+                if len(pool) >= pool_size:
+                    break
+            pools.append(tuple(pool))
+        return tuple(pools)
+
+    def _take_nearest(
+        self,
+        members: List[int],
+        lengths: List[int],
+        length: int,
+        pool_size: int,
+        pool: List[int],
+        taken: set,
+        glosses: set
+    ) -> None:
+        """Add members closest in length to `length`, skipping duplicate answers or glosses"""
+        right = bisect_left(lengths, length)
+        left = right - 1
+        while len(pool) < pool_size and (left >= 0 or right < len(members)):
+            if right >= len(members) or (left >= 0 and length - lengths[left] <= lengths[right] - length):
+                candidate = members[left]
+                left -= 1
+            else:
+                candidate = members[right]
+                right += 1
+            item = self._items[candidate]
+            answer, gloss = answer_key(item.hiligaynon), answer_key(item.english)
+            if answer in taken or gloss in glosses:
+                continue
+            taken.add(answer)
+            glosses.add(gloss)
+            pool.append(candidate)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _candidates(
+        self,
+        difficulty: Optional[DifficultyLevel],
+        exercise_types: Optional[Iterable[str]]
+    ) -> Tuple[Tuple[int, str], ...]:
+        types = tuple(sorted(exercise_types)) if exercise_types is not None else None
+        key = (difficulty, types)
+        found = self._filtered.get(key)
+        if found is None:
+            pairs = self._pairs.get(difficulty, ())
+            found = self._filtered[key] = pairs if types is None else tuple(p for p in pairs if p[1] in types)
+        return found
+
+    def count(
+        self,
+        difficulty: Optional[DifficultyLevel] = None,
+        exercise_types: Optional[Iterable[str]] = None
+    ) -> int:
+        """How many distinct (item, type) combinations match the filters"""
+        return len(self._candidates(difficulty, exercise_types))
+
+    def generate(
+        self,
+        count: int,
+        seed: Union[int, random.Random, None] = None,
+        difficulty: Optional[DifficultyLevel] = None,
+        exercise_types: Optional[Iterable[str]] = None
+    ) -> List[Exercise]:
+        """Generate exercises; the same seed and filters give the same exercises"""
+        candidates = self._candidates(difficulty, exercise_types)
+        if not candidates or count <= 0:
+            return []
+        rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        return [self._build(*rng.choice(candidates), rng) for _ in range(count)]
+
+    def _build(self, index: int, exercise_type: str, rng: random.Random) -> Exercise:
+        item = self._items[index]
+        explanation = f"'{item.hiligaynon}' means '{item.english}'."
+        if item.note:
+            explanation += f" {item.note}"
+
+        if exercise_type == "fill_blank":
+            question, answer = rng.choice(item.blanks)
+            return Exercise("fill_blank", question, None, answer, explanation, item.difficulty)
+        if exercise_type == "translate":
+            return Exercise(
+                "translate", f"Translate to Hiligaynon: '{item.english}'", None,
+                item.hiligaynon, explanation, item.difficulty
+            )
+
+        distractors = [self._items[i] for i in rng.sample(self._pools[index], CHOICE_DISTRACTORS)]
+        if exercise_type == "matching":
+            options = [item.english] + [d.english for d in distractors]
+            question, answer = f"Match: '{item.hiligaynon}' means...", item.english
+        else:
+            options = [item.hiligaynon] + [d.hiligaynon for d in distractors]
+            question, answer = f"How do you say '{item.english}' in Hiligaynon?", item.hiligaynon
+        rng.shuffle(options)
+        return Exercise(exercise_type, question, tuple(options), answer, explanation, item.difficulty)
@@ -0,0 +1,157 @@
+"""
+LingoKa Answer Grading
+Tolerant, LLM-free grading of typed exercise answers.
+
+Answers and accepted answers are reduced to a compact key (the search
+normalization with spaces removed), so case, punctuation, diacritics,
+hyphens ("gab-i" vs "gabi") and spacing never count as mistakes. What is
+left is compared by edit distance: an answer within a small, length-scaled
+number of typos still counts as correct. Choice exercises also accept the
+option number, and an answer is only credited when the correct option is
+the closest one, so a typo can never turn into a different valid option.
+
+Answer keys, and the bitmasks the edit distance runs on, are computed once
+per exercise and cached.
+"""
+from functools import lru_cache
+from typing import Dict, NamedTuple, Optional, Tuple
+from .hiligaynon import Exercise
+from .search import normalize
+
+# Share of an answer's characters that may be typos (rounded down), so
+# answers under five characters must be exact
+MAX_TYPO_RATIO = 0.2
+
+CHOICE_TYPES = ("multiple_choice", "matching")
+
+# Exercise types with a typed answer the grader can check
+GRADABLE_TYPES = ("multiple_choice", "matching", "fill_blank", "translate")
+
+
+def answer_key(text: str) -> str:
+    """Normalize an answer for comparison"""
+    return normalize(text).replace(" ", "")
+
+
+@lru_cache(maxsize=8192)
+def _match_masks(target: str) -> Dict[str, int]:
+    """Bitmask of the positions each character occupies in target"""
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(target):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def edit_distance(text: str, target: str, limit: int) -> int:
+    """Levenshtein distance between text and target, or limit + 1 if it exceeds limit"""
+    if text == target:
+        return 0
+    if abs(len(text) - len(target)) > limit:
+        return limit + 1
+    if not target:
+        return min(len(text), limit + 1)
+    # Bit-parallel (Myers/Hyyrö) edit distance: one column of the DP table
+    # is held in the vertical delta bitvectors, so each character of text
+    # costs a handful of integer operations instead of a pass over target
+    masks = _match_masks(target)
+    full = (1 << len(target)) - 1
+    last = 1 << (len(target) - 1)
+    plus, minus, distance = full, 0, len(target)
+    for ch in text:
+        eq = masks.get(ch, 0)
+        xv = eq | minus
+        xh = (((eq & plus) + plus) ^ plus) | eq
+        h_plus = minus | ~(xh | plus)
+        h_minus = plus & xh
+        if h_plus & last:
+            distance += 1
+        elif h_minus & last:
+            distance -= 1
+        h_plus = (h_plus << 1) | 1
+        h_minus <<= 1
+        plus = (h_minus | ~(xv | h_plus)) & full
+        minus = h_plus & xv
+    return min(distance, limit + 1)
+
+
+def allowed_typos(key: str) -> int:
+    """Typos tolerated in an answer matching this key"""
+    return int(len(key) * MAX_TYPO_RATIO)
+
+
+class GradeResult(NamedTuple):
+    """Outcome of grading one answer"""
+    correct: bool
+    exact: bool
+    score: float  # similarity to the closest accepted answer, 0-1
+    matched: Optional[str]  # the accepted answer the response was credited for
+
+
+class _AnswerKeys(NamedTuple):
+    accepted: Tuple[Tuple[str, str], ...]  # (key, display text)
+    options: Tuple[str, ...]  # option keys, for choice exercises
+
+
+@lru_cache(maxsize=4096)
+def _answer_keys(exercise: Exercise) -> _AnswerKeys:
+    answers = (exercise.correct_answer,) + tuple(exercise.accepted_answers or ())
+    accepted = tuple((answer_key(answer), answer) for answer in answers)
+    options = tuple(answer_key(option) for option in exercise.options or ())
+    return _AnswerKeys(accepted, options)
+
+
+def _similarity(key: str, target: str) -> Tuple[int, float]:
+    """Edit distance and similarity (0-1), treating anything past half the target as no match"""
+    limit = max(allowed_typos(target), len(target) // 2)
+    distance = edit_distance(key, target, limit)
+    if distance > limit:
+        return distance, 0.0
+    return distance, 1.0 - distance / max(len(key), len(target), 1)
+
+
+def _grade_choice(keys: _AnswerKeys, key: str) -> GradeResult:
+    correct_key, correct_text = keys.accepted[0]
+    # Option numbers ("2") pick the option directly
+    if key.isdigit() and 1 <= int(key) <= len(keys.options):
+        key = keys.options[int(key) - 1]
+    if key in keys.options:
+        hit = key == correct_key
+        return GradeResult(hit, hit, 1.0 if hit else 0.0, correct_text if hit else None)
+
+    distance, score = _similarity(key, correct_key)
+    if distance > allowed_typos(correct_key):
+        return GradeResult(False, False, score, None)
+    # A typo only counts if no other option is at least as close
+    for option in keys.options:
+        if option != correct_key and edit_distance(key, option, distance) <= distance:
+            return GradeResult(False, False, score, None)
+    return GradeResult(True, False, score, correct_text)
+
+
+def grade_answer(exercise: Exercise, answer: str) -> GradeResult:
+    """Grade a typed answer against an exercise's accepted answers"""
+    keys = _answer_keys(exercise)
+    key = answer_key(answer)
+    if exercise.exercise_type in CHOICE_TYPES and keys.options:
+        return _grade_choice(keys, key)
+
+    best = GradeResult(False, False, 0.0, None)
+    for accepted, text in keys.accepted:
+        if key == accepted:
+            return GradeResult(True, True, 1.0, text)
+        distance, score = _similarity(key, accepted)
+        if distance <= allowed_typos(accepted):
+            if not best.correct or score > best.score:
+                best = GradeResult(True, False, score, text)
+        elif not best.correct and score > best.score:
+            best = GradeResult(False, False, score, None)
+    return best
+
+
+def review_grade(result: GradeResult) -> int:
+    """SM-2 quality (0-5) for a graded answer"""
+    if result.exact:
+        return 5
+    if result.correct:
+        return 4
+    return 2 if result.score >= 0.5 else 1
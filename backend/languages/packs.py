@@ -0,0 +1,466 @@
+"""
+LingoKa Content Packs
+Compiled binary language content, memory-mapped and decoded on access.
+
+Language content is authored as JSON or YAML under languages/data/ and
+compiled into a .lkpack file in a cache directory outside the package
+(CONTENT_PACK_DIR, relative to DATA_DIR). Workers memory-map the pack
+read-only, so every worker on a host shares the same pages through the OS
+page cache, and records are only decoded when they are first read.
+
+Pack layout (little-endian):
+
+    header      magic "LKPK", u16 format version, u16 section count,
+                u32 string table offset, u32 list table offset
+    sections    per section: name, u16 field count, field names, field
+                types (one byte each), u32 record count, u32 data offset
+    records     fixed-width rows of u32 slots, one per field
+    lists       u32 count followed by u32 list offsets, then u32 items
+    strings     u32 count followed by u32 offsets, then UTF-8 data
+
+Field types: "s" a string id, "o" a string id or NONE, "l" a list id (a
+list of string ids, decoded as a tuple) or NONE. Every string is stored
+once. An empty list is stored as a record section with no fields and no
+records, so it reads back as empty records or as an empty document. A value
+that is not a list of flat records (lesson plans, guides) is stored as a
+single "json" section holding one JSON document.
+
+Build: python -m backend.languages.build_packs [source ...]
+"""
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from ..config.settings import get_settings
+
+MAGIC = b"LKPK"
+FORMAT_VERSION = 2
+NONE = 0xFFFFFFFF
+
+JSON_FIELD = "json"
+SECTION_SEPARATOR = "/"
+
+LANGUAGES_DIR = Path(__file__).resolve().parent
+SOURCE_DIR = LANGUAGES_DIR / "data"
+PACK_SUFFIX = ".lkpack"
+SOURCE_SUFFIXES = (".json", ".yaml", ".yml")
+
+_HEADER = struct.Struct("<4sHHII")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+
+
+class ContentPackError(Exception):
+    """Raised when a pack cannot be built or read"""
+
+
+def default_pack_dir() -> Path:
+    """Where compiled packs are cached: CONTENT_PACK_DIR, resolved against DATA_DIR"""
+    settings = get_settings()
+    return Path(settings.data_path(settings.CONTENT_PACK_DIR))
+
+
+def pack_format_version(path: Union[str, Path]) -> Optional[int]:
+    """Format version in a pack file's header, or None if it is not a content pack"""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    magic, version = _HEADER.unpack(header)[:2]
+    return version if magic == MAGIC else None
+
+
+# ===================
+# BUILDING
+# ===================
+
+def load_source(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load language content authored as JSON or YAML"""
+    path = Path(path)
+    with open(path, encoding="utf-8") as f:
+        if path.suffix in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ContentPackError(f"PyYAML is required to build {path.name}")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+class _Tables:
+    """Deduplicated string and list tables collected while building"""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.string_ids: Dict[str, int] = {}
+        self.lists: List[Tuple[int, ...]] = []
+        self.list_ids: Dict[Tuple[int, ...], int] = {}
+
+    def string(self, value: str) -> int:
+        if not isinstance(value, str):
+            raise ContentPackError(f"expected a string, got {value!r}")
+        sid = self.string_ids.get(value)
+        if sid is None:
+            sid = self.string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return sid
+
+    def list(self, values: List[str]) -> int:
+        items = tuple(self.string(v) for v in values)
+        lid = self.list_ids.get(items)
+        if lid is None:
+            lid = self.list_ids[items] = len(self.lists)
+            self.lists.append(items)
+        return lid
+
+
+def _is_record_list(value: Any) -> bool:
+    # An empty list counts, so an empty section or category stays a record section
+    return isinstance(value, list) and all(isinstance(v, dict) for v in value)
+
+
+def _field_types(records: List[Dict[str, Any]]) -> Tuple[List[str], str]:
+    """Infer field names (first-seen order) and their slot types"""
+    names: List[str] = []
+    for record in records:
+        for name in record:
+            if name not in names:
+                names.append(name)
+    types = []
+    for name in names:
+        values = [record.get(name) for record in records]
+        if any(isinstance(v, list) for v in values):
+            types.append("l")
+        elif any(v is None for v in values):
+            types.append("o")
+        else:
+            types.append("s")
+    return names, "".join(types)
+
+
+def _sections(source: Dict[str, Any]) -> Iterator[Tuple[str, List[str], str, List[Dict[str, Any]]]]:
+    """Flatten source content into (name, fields, types, records) sections"""
+    for key, value in source.items():
+        if _is_record_list(value):
+            names, types = _field_types(value)
+            yield key, names, types, value
+        elif isinstance(value, dict) and value and all(_is_record_list(v) for v in value.values()):
+            for sub, records in value.items():
+                names, types = _field_types(records)
+                yield f"{key}{SECTION_SEPARATOR}{sub}", names, types, records
+        else:
+            yield key, [JSON_FIELD], "s", [{JSON_FIELD: json.dumps(value, ensure_ascii=False)}]
+
+
+def _directory(sections: List[Tuple[str, List[str], str, List[List[int]]]], data_offsets: List[int]) -> bytes:
+    directory = bytearray()
+    for (name, fields, types, rows), data_offset in zip(sections, data_offsets):
+        encoded = name.encode("utf-8")
+        directory += _U16.pack(len(encoded)) + encoded + _U16.pack(len(fields))
+        for field in fields:
+            encoded = field.encode("utf-8")
+            directory += _U16.pack(len(encoded)) + encoded
+        directory += types.encode("ascii")
+        directory += _U32_PAIR.pack(len(rows), data_offset)
+    return bytes(directory)
+
+
+def build_pack(source: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """Compile language content into a pack file (written atomically)"""
+    tables = _Tables()
+    sections = []
+    for name, fields, types, records in _sections(source):
+        rows = []
+        for record in records:
+            row = []
+            for field, kind in zip(fields, types):
+                value = record.get(field)
+                if value is None:
+                    if kind == "s":
+                        raise ContentPackError(f"{name}.{field} is required")
+                    row.append(NONE)
+                elif kind == "l":
+                    row.append(tables.list(value))
+                else:
+                    row.append(tables.string(value))
+            rows.append(row)
+        sections.append((name, fields, types, rows))
+
+    # Directory entries are fixed once the data offsets are known, and
+    # their size does not depend on the offsets
+    directory_size = len(_directory(sections, [0] * len(sections)))
+    offset = _HEADER.size + directory_size
+    data = bytearray()
+    data_offsets = []
+    for _, fields, _, rows in sections:
+        data_offsets.append(offset + len(data))
+        for row in rows:
+            data += struct.pack(f"<{len(fields)}I", *row)
+    directory = _directory(sections, data_offsets)
+
+    list_offset = offset + len(data)
+    lists = bytearray(_U32.pack(len(tables.lists)))
+    cursor = 0
+    for items in tables.lists:
+        lists += _U32.pack(cursor)
+        cursor += len(items)
+    lists += _U32.pack(cursor)
+    for items in tables.lists:
+        lists += struct.pack(f"<{len(items)}I", *items)
+
+    string_offset = list_offset + len(lists)
+    encoded_strings = [s.encode("utf-8") for s in tables.strings]
+    strings = bytearray(_U32.pack(len(encoded_strings)))
+    cursor = 0
+    for encoded in encoded_strings:
+        strings += _U32.pack(cursor)
+        cursor += len(encoded)
+    strings += _U32.pack(cursor)
+    strings += b"".join(encoded_strings)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), string_offset, list_offset)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + directory + data + lists + strings)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return path
+
+
+# ===================
+# READING
+# ===================
+
+class RecordSection(Sequence):
+    """
+    Read-only sequence of records backed by the pack's mapped pages.
+
+    Records are decoded into `factory(**fields)` on first access and kept,
+    so repeated reads return the same object.
+    """
+
+    def __init__(
+        self,
+        pack: "ContentPack",
+        name: str,
+        fields: Tuple[str, ...],
+        types: str,
+        count: int,
+        offset: int,
+        factory: Callable[..., Any] = dict
+    ):
+        self.pack = pack
+        self.name = name
+        self.fields = fields
+        self.types = types
+        self.factory = factory
+        self._count = count
+        self._offset = offset
+        self._row = struct.Struct(f"<{len(fields)}I")
+        self._decoded: List[Any] = [None] * count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"{self.name} index out of range")
+        record = self._decoded[index]
+        if record is None:
+            record = self._decoded[index] = self.factory(**self.decode(index))
+        return record
+
+    def decode(self, index: int) -> Dict[str, Any]:
+        """Decode one record's raw fields"""
+        slots = self._row.unpack_from(self.pack.buffer, self._offset + index * self._row.size)
+        pack = self.pack
+        record = {}
+        for field, kind, slot in zip(self.fields, self.types, slots):
+            if slot == NONE:
+                record[field] = None
+            elif kind == "l":
+                record[field] = pack.list(slot)
+            else:
+                record[field] = pack.string(slot)
+        return record
+
+
+class ContentPack:
+    """A compiled content pack, memory-mapped read-only"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self.buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, section_count, self._string_offset, self._list_offset = _HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ContentPackError(f"{self.path.name} is not a version {FORMAT_VERSION} content pack")
+
+        self._string_count = _U32.unpack_from(self.buffer, self._string_offset)[0]
+        self._string_data = self._string_offset + _U32.size * (self._string_count + 2)
+        self._list_count = _U32.unpack_from(self.buffer, self._list_offset)[0]
+        self._list_items = self._list_offset + _U32.size * (self._list_count + 2)
+        self._strings: Dict[int, str] = {}
+
+        self._sections: Dict[str, Tuple[Tuple[str, ...], str, int, int]] = {}
+        position = _HEADER.size
+        for _ in range(section_count):
+            name, position = self._read_text(position)
+            field_count = _U16.unpack_from(self.buffer, position)[0]
+            position += _U16.size
+            fields = []
+            for _ in range(field_count):
+                field, position = self._read_text(position)
+                fields.append(field)
+            types = self.buffer[position:position + field_count].decode("ascii")
+            position += field_count
+            count, offset = _U32_PAIR.unpack_from(self.buffer, position)
+            position += _U32_PAIR.size
+            self._sections[name] = (tuple(fields), types, count, offset)
+
+    def _read_text(self, position: int) -> Tuple[str, int]:
+        length = _U16.unpack_from(self.buffer, position)[0]
+        start = position + _U16.size
+        return self.buffer[start:start + length].decode("utf-8"), start + length
+
+    def string(self, sid: int) -> str:
+        """Decode a string from the string table (decoded strings are kept)"""
+        value = self._strings.get(sid)
+        if value is None:
+            start, end = _U32_PAIR.unpack_from(self.buffer, self._string_offset + _U32.size * (sid + 1))
+            value = self._strings[sid] = self.buffer[self._string_data + start:self._string_data + end].decode("utf-8")
+        return value
+
+    def list(self, lid: int) -> Tuple[str, ...]:
+        """Decode a list of strings from the list table"""
+        start, end = _U32_PAIR.unpack_from(self.buffer, self._list_offset + _U32.size * (lid + 1))
+        ids = struct.unpack_from(f"<{end - start}I", self.buffer, self._list_items + _U32.size * start)
+        return tuple(self.string(sid) for sid in ids)
+
+    def section_names(self) -> List[str]:
+        """Names of every section, in source order"""
+        return list(self._sections)
+
+    def has_section(self, name: str) -> bool:
+        return name in self._sections
+
+    def records(self, name: str, factory: Callable[..., Any] = dict) -> RecordSection:
+        """Lazily decoded records of a section"""
+        try:
+            fields, types, count, offset = self._sections[name]
+        except KeyError:
+            raise ContentPackError(f"{self.path.name} has no section {name!r}")
+        return RecordSection(self, name, fields, types, count, offset, factory)
+
+    def group(self, prefix: str, factory: Callable[..., Any] = dict) -> Dict[str, RecordSection]:
+        """Record sections nested under a prefix (e.g. vocabulary/<category>), in source order"""
+        start = prefix + SECTION_SEPARATOR
+        return {
+            name[len(start):]: self.records(name, factory)
+            for name in self._sections if name.startswith(start)
+        }
+
+    def document(self, name: str) -> Any:
+        """Decode a section stored as a single JSON document"""
+        section = self.records(name)
+        if not section.fields and not len(section):
+            return []
+        if section.fields != (JSON_FIELD,):
+            raise ContentPackError(f"section {name!r} is not a JSON document")
+        return json.loads(section.decode(0)[JSON_FIELD])
+
+    def close(self) -> None:
+        self.buffer.close()
+
+
+# ===================
+# REGISTRY
+# ===================
+
+def _source_path(source_dir: Path, code: str) -> Optional[Path]:
+    for suffix in SOURCE_SUFFIXES:
+        path = source_dir / f"{code}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+class PackRegistry:
+    """
+    Content packs discovered by language code.
+
+    A pack is looked up as <pack_dir>/<code>.lkpack. When the authored
+    source (data/<code>.json|yaml) is newer than the compiled pack, the
+    pack was built by a different FORMAT_VERSION, or it has not been built
+    yet, it is compiled on first use.
+    """
+
+    def __init__(self, source_dir: Path = SOURCE_DIR, pack_dir: Optional[Path] = None):
+        self.source_dir = source_dir
+        self.pack_dir = pack_dir if pack_dir is not None else default_pack_dir()
+        self._packs: Dict[str, ContentPack] = {}
+        self._lock = threading.Lock()
+
+    def available(self) -> List[str]:
+        """Language codes with a compiled pack or an authored source"""
+        codes = {p.stem for p in self.pack_dir.glob(f"*{PACK_SUFFIX}")} if self.pack_dir.exists() else set()
+        if self.source_dir.exists():
+            codes.update(p.stem for p in self.source_dir.iterdir() if p.suffix in SOURCE_SUFFIXES)
+        return sorted(codes)
+
+    def pack_path(self, code: str) -> Path:
+        return self.pack_dir / f"{code}{PACK_SUFFIX}"
+
+    def get(self, code: str) -> ContentPack:
+        """Get the memory-mapped pack for a language, compiling it if stale"""
+        pack = self._packs.get(code)
+        if pack is not None:
+            return pack
+        with self._lock:
+            pack = self._packs.get(code)
+            if pack is None:
+                pack = self._packs[code] = ContentPack(self._ensure_built(code))
+        return pack
+
+    def _is_stale(self, path: Path, source: Path) -> bool:
+        return (
+            not path.exists()
+            or path.stat().st_mtime < source.stat().st_mtime
+            or pack_format_version(path) != FORMAT_VERSION
+        )
+
+    def _ensure_built(self, code: str) -> Path:
+        path = self.pack_path(code)
+        source = _source_path(self.source_dir, code)
+        if source is not None and self._is_stale(path, source):
+            build_pack(load_source(source), path)
+        if not path.exists():
+            raise ContentPackError(f"no content pack for language {code!r}")
+        return path
+
+
+_registry: Optional[PackRegistry] = None
+
+
+def get_pack_registry() -> PackRegistry:
+    """Get the process-wide content pack registry"""
+    global _registry
+    if _registry is None:
+        _registry = PackRegistry()
+    return _registry
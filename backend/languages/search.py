@@ -0,0 +1,165 @@
+"""
+LingoKa Content Search
+Ranked, typo-tolerant search over phrases and vocabulary.
+
+Every searchable field (Hiligaynon text, English gloss, example sentence)
+is normalized (case-folded, diacritics and hyphens stripped) and split into
+character trigrams. An inverted index maps each trigram to the fields that
+contain it. A query only scans the postings of its rarest trigrams to find
+candidates, since any field sharing enough of the query's trigrams must
+contain at least one of them; candidates are then scored exactly, so
+latency tracks the number of plausible matches rather than lexicon size.
+"""
+import heapq
+import math
+import unicodedata
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Minimum share of the query's trigrams a field must contain to match
+MIN_CONTAINMENT = 0.5
+
+# Bonuses for whole-text and prefix matches after normalization
+EXACT_MATCH_BONUS = 0.5
+PREFIX_MATCH_BONUS = 0.2
+
+# Upper bound on candidate fields scored per query
+MAX_CANDIDATES = 500
+
+
+def normalize(text: str) -> str:
+    """Case-fold, strip diacritics, drop hyphens/apostrophes and collapse punctuation"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    chars = []
+    for ch in decomposed:
+        if unicodedata.combining(ch) or ch in "-'’":
+            continue
+        chars.append(ch if ch.isalnum() else " ")
+    return " ".join("".join(chars).split())
+
+
+def trigrams(normalized: str) -> Tuple[str, ...]:
+    """Distinct padded character trigrams of normalized text"""
+    grams = {}
+    for word in normalized.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams[padded[i:i + 3]] = None
+    return tuple(grams)
+
+
+class SearchResult(NamedTuple):
+    """A ranked search hit"""
+    kind: str
+    item: Any
+    score: float
+    field: str
+
+
+class _Field(NamedTuple):
+    doc: int
+    name: str
+    weight: float
+    text: str
+    size: int
+
+
+class TrigramIndex:
+    """Character-trigram inverted index over weighted document fields"""
+
+    def __init__(self):
+        self._docs: List[Tuple[str, Any]] = []
+        self._fields: List[_Field] = []
+        self._field_grams: List[Tuple[str, ...]] = []
+        self._field_kinds: List[str] = []
+        self._postings: Dict[str, array] = {}
+        self._grams: Dict[str, str] = {}
+
+    def add(self, kind: str, item: Any, fields: Iterable[Tuple[str, Optional[str], float]]) -> None:
+        """Index an item under (field name, text, weight) fields; empty texts are skipped"""
+        doc = len(self._docs)
+        self._docs.append((kind, item))
+        for name, text, weight in fields:
+            if not text:
+                continue
+            normalized = normalize(text)
+            grams = trigrams(normalized)
+            if not grams:
+                continue
+            field_id = len(self._fields)
+            canonical = []
+            for gram in grams:
+                postings = self._postings.get(gram)
+                if postings is None:
+                    postings = self._postings[gram] = array("I")
+                    self._grams[gram] = gram
+                postings.append(field_id)
+                # Share one string object per trigram across all fields
+                canonical.append(self._grams[gram])
+            self._fields.append(_Field(doc, name, weight, normalized, len(grams)))
+            self._field_grams.append(tuple(canonical))
+            self._field_kinds.append(kind)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def search(self, query: str, limit: int = 10, kinds: Optional[Sequence[str]] = None) -> List[SearchResult]:
+        """Top results for a query, best first"""
+        normalized = normalize(query)
+        query_grams = trigrams(normalized)
+        if not query_grams or limit <= 0:
+            return []
+
+        # A field sharing at least `needed` of the query's trigrams must
+        # contain one of its (known - needed + 1) rarest, so only those
+        # postings are scanned for candidates. Once the candidate budget is
+        # spent, common trigrams are skipped: fields matching only on them
+        # would rank below the candidates already found. Fields of other
+        # kinds are dropped first, so they never use up the budget.
+        known = sorted((g for g in query_grams if g in self._postings), key=lambda g: len(self._postings[g]))
+        needed = max(1, math.ceil(MIN_CONTAINMENT * len(query_grams)))
+        if len(known) < needed:
+            return []
+        wanted = frozenset(kinds) if kinds is not None else None
+        field_kinds = self._field_kinds
+        candidates = set()
+        for gram in known[:len(known) - needed + 1]:
+            postings = self._postings[gram]
+            if wanted is not None:
+                postings = [field_id for field_id in postings if field_kinds[field_id] in wanted]
+            if candidates and len(candidates) + len(postings) > MAX_CANDIDATES:
+                break
+            candidates.update(postings)
+
+        # Overlap for every candidate is counted with C-level map() calls;
+        # only candidates that clear the threshold reach the Python scoring
+        query_set = frozenset(query_grams)
+        query_size = len(query_grams)
+        candidate_ids = list(candidates)
+        overlaps = map(len, map(query_set.intersection, map(self._field_grams.__getitem__, candidate_ids)))
+        best: Dict[int, Tuple[float, str]] = {}
+        for field_id, shared in zip(candidate_ids, overlaps):
+            if shared < needed:
+                continue
+            field = self._fields[field_id]
+            containment = shared / query_size
+            jaccard = shared / (query_size + field.size - shared)
+            score = 0.6 * containment + 0.4 * jaccard
+            if field.text == normalized:
+                score += EXACT_MATCH_BONUS
+            elif field.text.startswith(normalized):
+                score += PREFIX_MATCH_BONUS
+            score *= field.weight
+            current = best.get(field.doc)
+            if current is None or score > current[0]:
+                best[field.doc] = (score, field.name)
+
+        top = heapq.nlargest(limit, best.items(), key=lambda entry: entry[1][0])
+        return [
+            SearchResult(self._docs[doc][0], self._docs[doc][1], round(score, 4), name)
+            for doc, (score, name) in top
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        """Index size"""
+        return {"documents": len(self._docs), "fields": len(self._fields), "trigrams": len(self._postings)}
@@ -2,26 +2,70 @@
 LingoKa - AI-Powered Language Learning Platform
 Main FastAPI Application
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, List, Optional
+from fastapi.responses import Response, StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+import json
+import time
 import uuid
 from datetime import datetime
 
 from .config.settings import get_settings
-from .models.user import UserProfile, UserSession, UserProgress
+from .models.user import UserProfile, UserSession, UserProgress, ReviewBatch, ReviewItems
 from .models.message import ChatRequest, ChatResponse, ChatMessage, MessageRole
+from .models.content import content_model
+from .models.exercise import BatchGradeRequest, ExerciseAnswer
 from .agents.director import DirectorAgent, route_user_message
 from .agents.conversation import ConversationAgent
+from .languages.hiligaynon import DifficultyLevel, Exercise, get_hiligaynon_module
+from .languages.grading import GRADABLE_TYPES, review_grade
+from .services.llm_gateway import get_llm_gateway, close_llm_gateway
+from .services.llm_admission import LLMPriority, get_llm_admission
+from .services.llm_resilience import CircuitBreaker, Deadline, get_circuit_breaker, get_retry_policy
+from .services.single_flight import get_single_flight
+from .services.completion_cache import get_completion_cache
+from .services.template_cache import get_template_cache
+from .services.session_store import SessionState, get_session_store
+from .services.session_locks import get_session_locks
+from .services.metrics import REGISTRY, CHAT_ROUTED_TOTAL, CHAT_STAGE_SECONDS, MetricsRegistry
+from .services.review_scheduler import ReviewState, get_review_scheduler
+from .services.exercise_sessions import GradedAnswer, get_exercise_sessions
+from .services.lesson_catalog import get_lesson_catalog
+from .services.payloads import (
+    CHAT_RESPONSE_ADAPTER, USER_PROFILE_ADAPTER, FastJSONResponse, make_payload, model_response, payload_response
+)
 
 # Initialize settings
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources at startup and release them at shutdown"""
+    # One pooled LLM gateway per process, borrowed by every agent
+    get_llm_gateway()
+    # Content indexes, rendered templates and the lesson catalog are built
+    # on first use, so a worker only decodes the pack records it serves
+
+    # Expire idle sessions and flush queued writes in the background
+    session_store.start(settings.SESSION_SWEEP_INTERVAL_SECONDS)
+    review_scheduler.start()
+    exercise_sessions.start(settings.EXERCISE_SWEEP_INTERVAL_SECONDS)
+    yield
+    await exercise_sessions.stop()
+    await review_scheduler.stop()
+    await session_store.stop()
+    await close_llm_gateway()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    description="AI-Powered Multi-Agent Language Learning Platform"
+    description="AI-Powered Multi-Agent Language Learning Platform",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -34,42 +78,118 @@ app.add_middleware(
 )
 
 # In-memory storage (replace with Firestore in production)
-active_sessions: Dict[str, UserSession] = {}
-user_profiles: Dict[str, UserProfile] = {}
-conversation_histories: Dict[str, List[ChatMessage]] = {}
+session_store = get_session_store()
+
+# Serializes turns within a session
+session_locks = get_session_locks()
+
+# Spaced-repetition review decks
+review_scheduler = get_review_scheduler()
+
+# Issued exercises awaiting answers
+exercise_sessions = get_exercise_sessions()
+
+# Pre-serialized lesson documents
+lesson_catalog = get_lesson_catalog()
 
 # Agent instances
 director_agent = DirectorAgent()
 
+# Shared language content
+hiligaynon = get_hiligaynon_module()
 
-@app.get("/")
+SEARCH_KINDS = ("phrase", "vocabulary")
+MAX_SEARCH_RESULTS = 50
+MAX_REVIEW_RESULTS = 200
+KNOWN_WORDS_LIMIT = 50
+MAX_GENERATED_EXERCISES = 100
+
+
+@app.get("/", response_class=FastJSONResponse)
 async def root():
     """Health check endpoint"""
-    return {
+    return FastJSONResponse({
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "status": "active",
         "timestamp": datetime.utcnow().isoformat()
-    }
+    })
+
+
+# Static parts of the health report, fixed at startup
+HEALTH_AGENTS = {
+    "director": "active",
+    "conversation": "active",
+    "pronunciation": "not_implemented",
+    "reading": "not_implemented",
+    "writing": "not_implemented",
+    "progress": "not_implemented"
+}
+HEALTH_SERVICES = {
+    "openai": "configured" if settings.OPENAI_API_KEY else "missing",
+    "anthropic": "configured" if settings.ANTHROPIC_API_KEY else "missing",
+    "elevenlabs": "configured" if settings.ELEVENLABS_API_KEY else "missing"
+}
 
 
-@app.get("/health")
+@app.get("/health", response_class=FastJSONResponse)
 async def health_check():
     """Detailed health check"""
-    return {
+    return FastJSONResponse({
         "status": "healthy",
-        "agents": {
-            "director": "active",
-            "conversation": "active",
-            "pronunciation": "not_implemented",
-            "reading": "not_implemented",
-            "writing": "not_implemented",
-            "progress": "not_implemented"
-        },
-        "services": {
-            "openai": "configured" if settings.OPENAI_API_KEY else "missing",
-            "elevenlabs": "configured" if settings.ELEVENLABS_API_KEY else "missing"
-        }
+        "agents": HEALTH_AGENTS,
+        "services": HEALTH_SERVICES,
+        "caches": _cache_stats(),
+        "session_store": session_store.stats(),
+        "session_locks": session_locks.stats(),
+        "reviews": review_scheduler.stats(),
+        "exercises": exercise_sessions.stats(),
+        "llm": _llm_stats()
+    })
+
+
+def _llm_stats() -> Dict[str, Dict]:
+    """Circuit breaker state, retries, admission queue and coalescing metrics for outbound LLM calls"""
+    single_flight = get_single_flight()
+    return {
+        "circuit_breaker": get_circuit_breaker().stats(),
+        "retries": get_retry_policy().stats(),
+        "admission": get_llm_admission().stats(),
+        "coalescing": single_flight.stats() if single_flight else {"enabled": False}
+    }
+
+
+# Sizes and states sampled when /metrics is scraped
+REGISTRY.gauge(
+    "lingoka_session_store_size",
+    "Live entries in the session store",
+    lambda: {(kind,): count for kind, count in session_store.stats().items() if kind in ("sessions", "history_messages", "profiles")},
+    ("kind",)
+)
+REGISTRY.gauge("lingoka_session_locks", "Sessions with a turn in progress or waiting", lambda: session_locks.stats()["locks"])
+REGISTRY.gauge("lingoka_llm_in_flight", "LLM calls holding an admission slot", lambda: get_llm_admission().in_flight)
+REGISTRY.gauge("lingoka_llm_queued", "LLM calls waiting for an admission slot", lambda: get_llm_admission().queued)
+REGISTRY.gauge(
+    "lingoka_llm_circuit_state",
+    "LLM circuit breaker state (1 for the current state)",
+    lambda: {(state,): float(get_circuit_breaker().state == state) for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)},
+    ("state",)
+)
+
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus text exposition of request-path metrics"""
+    return Response(REGISTRY.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
+
+def _cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters for the response caches"""
+    completion_cache = get_completion_cache()
+    return {
+        "templates": get_template_cache().stats(),
+        "lessons": lesson_catalog.stats(),
+        "completions": completion_cache.stats() if completion_cache else {"enabled": False}
     }
 
 
@@ -86,118 +206,255 @@ async def chat(request: ChatRequest):
     """
     
     try:
-        # Get or create session
-        session_id = request.session_id or str(uuid.uuid4())
-        
-        if session_id not in active_sessions:
-            active_sessions[session_id] = UserSession(
-                session_id=session_id,
-                user_id=request.user_id,
-                conversation_history=[],
-                current_agent="director"
-            )
-        
-        session = active_sessions[session_id]
-        
-        # Get conversation history
-        history = conversation_histories.get(session_id, [])
-        
-        # Get user context
-        user_context = None
-        if request.user_id in user_profiles:
-            profile = user_profiles[request.user_id]
-            user_context = {
-                "level": profile.current_level,
-                "target_language": profile.target_language,
-                "known_words": [],  # Would come from UserProgress
-                "current_streak": profile.current_streak
-            }
-        
-        # Route message through Director Agent
-        routing_decision = await director_agent.route_message(
-            message=request.message,
-            conversation_history=history,
-            user_context=user_context
-        )
+        # The LLM work below must finish within this request's deadline
+        deadline = Deadline(settings.CHAT_DEADLINE_SECONDS)
+        session_id = _request_session_id(request)
         
-        # Get response from appropriate specialist agent
-        response = await _get_agent_response(
-            agent_name=routing_decision.target_agent,
-            message=request.message,
-            conversation_history=history,
-            user_context=user_context,
-            session_id=session_id
-        )
-        
-        # Update session
-        session.current_agent = routing_decision.target_agent
-        session.conversation_history.append({
-            "role": "user",
-            "content": request.message,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        session.conversation_history.append({
-            "role": "assistant",
-            "content": response.message,
-            "timestamp": datetime.utcnow().isoformat(),
-            "agent": routing_decision.target_agent
-        })
-        
-        # Update conversation history
-        if session_id not in conversation_histories:
-            conversation_histories[session_id] = []
-        
-        conversation_histories[session_id].extend([
-            ChatMessage(role=MessageRole.USER, content=request.message),
-            ChatMessage(role=MessageRole.ASSISTANT, content=response.message)
-        ])
+        # One turn at a time per session, so quick successive messages can't interleave
+        async with session_locks.hold(session_id) as waited:
+            CHAT_STAGE_SECONDS.observe(waited, "session_lock")
+            
+            # Get or create session, its history and the user's context
+            with CHAT_STAGE_SECONDS.time("session"):
+                state = await _get_or_create_session(request, session_id)
+                history = state.history
+                user_context = await _build_user_context(request.user_id)
+            
+            # Route message through Director Agent
+            with CHAT_STAGE_SECONDS.time("route"):
+                routing_decision = await director_agent.route_message(
+                    message=request.message,
+                    conversation_history=history,
+                    user_context=user_context
+                )
+            CHAT_ROUTED_TOTAL.inc(routing_decision.target_agent)
+            
+            # Get response from appropriate specialist agent
+            with CHAT_STAGE_SECONDS.time("dispatch"):
+                response = await _get_agent_response(
+                    agent_name=routing_decision.target_agent,
+                    message=request.message,
+                    conversation_history=history,
+                    user_context=user_context,
+                    session_id=session_id,
+                    use_cache=not request.bypass_cache,
+                    priority=_request_priority(request),
+                    deadline=deadline
+                )
+            
+            # Update session and conversation history
+            with CHAT_STAGE_SECONDS.time("history"):
+                await _record_turn(state, routing_decision.target_agent, request.message, response.message)
         
         # Set session ID in response
         response.session_id = session_id
         response.routed_to = routing_decision.target_agent
         response.confidence = routing_decision.confidence
         
-        return response
+        with CHAT_STAGE_SECONDS.time("serialize"):
+            return model_response(CHAT_RESPONSE_ADAPTER, response)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat processing error: {str(e)}")
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    Streaming chat endpoint (Server-Sent Events).
+    
+    Emits one `token` event per text chunk as the agent produces it, then a
+    trailing `done` event with the full ChatResponse (session_id, routed_to,
+    vocabulary, feedback). History is persisted once the stream completes.
+    The session's lock is held until then, so turns on one session stream
+    one after the other.
+    """
+    
+    deadline = Deadline(settings.CHAT_DEADLINE_SECONDS)
+    session_id = _request_session_id(request)
+    
+    async def event_stream():
+        try:
+            async with session_locks.hold(session_id):
+                state = await _get_or_create_session(request, session_id)
+                history = state.history
+                user_context = await _build_user_context(request.user_id)
+                
+                routing_decision = await director_agent.route_message(
+                    message=request.message,
+                    conversation_history=history,
+                    user_context=user_context
+                )
+                CHAT_ROUTED_TOTAL.inc(routing_decision.target_agent)
+                
+                async for item in _get_agent_response_stream(
+                    agent_name=routing_decision.target_agent,
+                    message=request.message,
+                    conversation_history=history,
+                    user_context=user_context,
+                    session_id=session_id,
+                    use_cache=not request.bypass_cache,
+                    priority=_request_priority(request),
+                    deadline=deadline
+                ):
+                    if isinstance(item, ChatResponse):
+                        await _record_turn(state, routing_decision.target_agent, request.message, item.message)
+                        
+                        item.session_id = session_id
+                        item.routed_to = routing_decision.target_agent
+                        item.confidence = routing_decision.confidence
+                        yield _sse_event("done", item.model_dump_json())
+                    else:
+                        yield _sse_event("token", json.dumps({"delta": item}))
+        
+        except Exception as e:
+            yield _sse_event("error", json.dumps({"detail": f"Chat processing error: {str(e)}"}))
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _request_priority(request: ChatRequest) -> LLMPriority:
+    """Chat sent from inside a lesson (metadata lesson_id) is served ahead of casual chat"""
+    return LLMPriority.LESSON if request.metadata.get("lesson_id") else LLMPriority.CHAT
+
+
+def _sse_event(event: str, data: str) -> str:
+    """Format a single Server-Sent Event"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def _request_session_id(request: ChatRequest) -> str:
+    """The request's session id, or a fresh one when it starts a new session"""
+    return request.session_id if request.session_id is not None else str(uuid.uuid4())
+
+
+async def _get_or_create_session(request: ChatRequest, session_id: str) -> SessionState:
+    """Look up the request's session, creating it if needed"""
+    
+    if request.session_id is None:
+        return await session_store.create(session_id, request.user_id)
+    
+    return await session_store.get_or_create(session_id, request.user_id)
+
+
+async def _build_user_context(user_id: Optional[str]) -> Optional[Dict]:
+    """Build the agent-facing context for a user, if we know them"""
+    
+    profile = await session_store.get_profile(user_id)
+    if profile is None:
+        return None
+    
+    return {
+        "user_id": profile.user_id,
+        "level": profile.current_level,
+        "target_language": profile.target_language,
+        "known_words": await review_scheduler.known_items(profile.user_id, KNOWN_WORDS_LIMIT),
+        "current_streak": profile.current_streak
+    }
+
+
+async def _record_turn(
+    state: SessionState,
+    agent_name: str,
+    user_message: str,
+    assistant_message: str
+) -> None:
+    """Append a completed user/assistant turn to the session's history"""
+    
+    now = int(time.time())
+    await session_store.record_turn(state, agent_name, [
+        (MessageRole.USER, user_message, None, now),
+        (MessageRole.ASSISTANT, assistant_message, agent_name, now)
+    ])
+
+
 async def _get_agent_response(
     agent_name: str,
     message: str,
     conversation_history: List[ChatMessage],
     user_context: Dict,
-    session_id: str
+    session_id: str,
+    use_cache: bool = True,
+    priority: LLMPriority = LLMPriority.CHAT,
+    deadline: Optional[Deadline] = None
 ) -> ChatResponse:
     """Route to appropriate specialist agent and get response"""
     
     # Currently only Conversation Agent is implemented
     if agent_name == "conversation":
-        agent = ConversationAgent(
-            target_language=user_context.get("target_language", "hiligaynon") if user_context else "hiligaynon",
-            user_level=user_context.get("level", "beginner") if user_context else "beginner"
-        )
+        agent = _build_conversation_agent(user_context, use_cache, priority, deadline)
         return await agent.respond(message, conversation_history, user_context)
     
     # Fallback to conversation agent for unimplemented agents
     elif agent_name in ["pronunciation", "reading", "writing", "progress"]:
         # Return placeholder response
-        return ChatResponse(
-            message=f"The {agent_name} agent is coming soon! For now, let's practice conversation. {message}",
-            agent_type=agent_name,
-            session_id=session_id,
-            routed_to=agent_name,
-            confidence=0.5,
-            feedback={"status": "agent_not_implemented"}
-        )
+        return _placeholder_response(agent_name, message, session_id)
     
     else:
         # Unknown agent, fallback to conversation
-        agent = ConversationAgent()
+        agent = ConversationAgent(use_cache=use_cache, priority=priority, deadline=deadline)
         return await agent.respond(message, conversation_history, user_context)
 
 
+async def _get_agent_response_stream(
+    agent_name: str,
+    message: str,
+    conversation_history: List[ChatMessage],
+    user_context: Dict,
+    session_id: str,
+    use_cache: bool = True,
+    priority: LLMPriority = LLMPriority.CHAT,
+    deadline: Optional[Deadline] = None
+) -> AsyncIterator[Union[str, ChatResponse]]:
+    """Streaming counterpart of _get_agent_response: yields text chunks, then the ChatResponse"""
+    
+    if agent_name in ["pronunciation", "reading", "writing", "progress"]:
+        response = _placeholder_response(agent_name, message, session_id)
+        yield response.message
+        yield response
+        return
+    
+    if agent_name == "conversation":
+        agent = _build_conversation_agent(user_context, use_cache, priority, deadline)
+    else:
+        agent = ConversationAgent(use_cache=use_cache, priority=priority, deadline=deadline)
+    
+    async for item in agent.respond_stream(message, conversation_history, user_context):
+        yield item
+
+
+def _build_conversation_agent(
+    user_context: Optional[Dict],
+    use_cache: bool = True,
+    priority: LLMPriority = LLMPriority.CHAT,
+    deadline: Optional[Deadline] = None
+) -> ConversationAgent:
+    """Build a Conversation Agent configured for the user's language and level"""
+    return ConversationAgent(
+        target_language=user_context.get("target_language", "hiligaynon") if user_context else "hiligaynon",
+        user_level=user_context.get("level", "beginner") if user_context else "beginner",
+        use_cache=use_cache,
+        priority=priority,
+        deadline=deadline
+    )
+
+
+def _placeholder_response(agent_name: str, message: str, session_id: str) -> ChatResponse:
+    """Placeholder response for agents that are not implemented yet"""
+    return ChatResponse(
+        message=f"The {agent_name} agent is coming soon! For now, let's practice conversation. {message}",
+        agent_type=agent_name,
+        session_id=session_id,
+        routed_to=agent_name,
+        confidence=0.5,
+        feedback={"status": "agent_not_implemented"}
+    )
+
+
 @app.post("/users", response_model=UserProfile)
 async def create_user(
     email: str,
@@ -217,48 +474,267 @@ async def create_user(
         target_language=target_language
     )
     
-    user_profiles[user_id] = profile
+    await session_store.set_profile(profile)
     
-    return profile
+    return model_response(USER_PROFILE_ADAPTER, profile)
 
 
 @app.get("/users/{user_id}", response_model=UserProfile)
 async def get_user(user_id: str):
     """Get user profile"""
     
-    if user_id not in user_profiles:
+    profile = await session_store.get_profile(user_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    return model_response(USER_PROFILE_ADAPTER, profile)
+
+
+async def _require_profile(user_id: str) -> UserProfile:
+    """Get a user profile or fail with 404"""
+    
+    profile = await session_store.get_profile(user_id)
+    if profile is None:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return user_profiles[user_id]
+    return profile
+
+
+def _review_view(state: ReviewState) -> Dict:
+    """API shape of a card's scheduling state"""
+    return {
+        "item": state.item,
+        "due_at": datetime.utcfromtimestamp(state.due).isoformat(),
+        "interval_days": state.interval_days,
+        "ease": state.ease,
+        "repetitions": state.repetitions,
+        "lapses": state.lapses
+    }
+
+
+@app.get("/users/{user_id}/reviews/due")
+async def get_due_reviews(user_id: str, limit: int = settings.REVIEW_DUE_LIMIT):
+    """Items due for spaced-repetition review, most overdue first"""
+    
+    await _require_profile(user_id)
+    due = await review_scheduler.due(user_id, max(1, min(limit, MAX_REVIEW_RESULTS)))
+    
+    return {
+        "user_id": user_id,
+        "total_due": await review_scheduler.count_due(user_id),
+        "reviews": [_review_view(state) for state in due]
+    }
+
+
+@app.post("/users/{user_id}/reviews")
+async def record_reviews(user_id: str, batch: ReviewBatch):
+    """Record a batch of graded reviews (e.g. a finished quiz) and reschedule the items"""
+    
+    await _require_profile(user_id)
+    states = await review_scheduler.record_reviews(
+        user_id, [(review.item, review.grade) for review in batch.reviews]
+    )
+    
+    return {
+        "user_id": user_id,
+        "reviews": [_review_view(state) for state in states]
+    }
+
+
+@app.post("/users/{user_id}/reviews/items")
+async def add_review_items(user_id: str, request: ReviewItems):
+    """Start scheduling new items for review; they are due immediately"""
+    
+    await _require_profile(user_id)
+    added = await review_scheduler.add_items(user_id, request.items)
+    
+    return {"user_id": user_id, "added": added}
+
+
+def _exercise_filters(difficulty: Optional[str], exercise_type: Optional[str]) -> Tuple[Optional[DifficultyLevel], Tuple[str, ...]]:
+    """Validate exercise filters from a request"""
+    
+    if difficulty is not None and difficulty not in [level.value for level in DifficultyLevel]:
+        raise HTTPException(status_code=400, detail=f"difficulty must be one of: {', '.join(level.value for level in DifficultyLevel)}")
+    if exercise_type is not None and exercise_type not in GRADABLE_TYPES:
+        raise HTTPException(status_code=400, detail=f"exercise_type must be one of: {', '.join(GRADABLE_TYPES)}")
+    
+    return (DifficultyLevel(difficulty) if difficulty else None), ((exercise_type,) if exercise_type else GRADABLE_TYPES)
+
+
+def _issued_view(exercise_id: str, exercise: Exercise) -> Dict:
+    """API shape of an issued exercise, without its answer"""
+    return {
+        "exercise_id": exercise_id,
+        "exercise_type": exercise.exercise_type,
+        "question": exercise.question,
+        "options": exercise.options,
+        "difficulty": exercise.difficulty.value,
+        "expires_in_seconds": settings.EXERCISE_TTL_SECONDS
+    }
+
+
+@app.post("/exercises")
+async def issue_exercise(
+    difficulty: Optional[str] = None,
+    exercise_type: Optional[str] = None,
+    user_id: Optional[str] = None
+):
+    """Issue a random hand-written or generated exercise; its answer is kept server-side until graded"""
+    
+    level, types = _exercise_filters(difficulty, exercise_type)
+    exercise = hiligaynon.get_random_exercise(level, types)
+    # get_random_exercise falls back to a default exercise when nothing matches
+    if exercise.exercise_type not in types or (level is not None and exercise.difficulty != level):
+        raise HTTPException(status_code=404, detail="No matching exercises")
+    
+    return _issued_view(await exercise_sessions.issue(exercise, user_id), exercise)
+
+
+@app.post("/exercises/generate")
+async def issue_generated_exercises(
+    count: int = 10,
+    seed: Optional[int] = None,
+    difficulty: Optional[str] = None,
+    exercise_type: Optional[str] = None,
+    user_id: Optional[str] = None
+):
+    """Issue a quiz of generated exercises; the same seed and filters give the same quiz"""
+    
+    level, types = _exercise_filters(difficulty, exercise_type)
+    exercises = hiligaynon.generate_exercises(max(1, min(count, MAX_GENERATED_EXERCISES)), seed, level, types)
+    if not exercises:
+        raise HTTPException(status_code=404, detail="No matching exercises")
+    exercise_ids = await exercise_sessions.issue_many(exercises, user_id)
+    
+    return {
+        "seed": seed,
+        "exercises": [_issued_view(exercise_id, exercise) for exercise_id, exercise in zip(exercise_ids, exercises)]
+    }
+
+
+def _graded_view(graded: GradedAnswer) -> Dict:
+    """API shape of a graded answer; the answer is revealed once graded"""
+    exercise = graded.pending.exercise
+    return {
+        "exercise_id": graded.exercise_id,
+        "found": True,
+        "correct": graded.result.correct,
+        "exact": graded.result.exact,
+        "score": round(graded.result.score, 4),
+        "matched_answer": graded.result.matched,
+        "correct_answer": exercise.correct_answer,
+        "explanation": exercise.explanation
+    }
+
+
+async def _record_exercise_reviews(graded: List[GradedAnswer]) -> None:
+    """Feed graded answers from known users into their review schedules"""
+    
+    by_user: Dict[str, List[Tuple[str, int]]] = {}
+    for answer in graded:
+        if answer.pending.user_id is not None:
+            by_user.setdefault(answer.pending.user_id, []).append(
+                (answer.pending.exercise.correct_answer, review_grade(answer.result))
+            )
+    for user_id, reviews in by_user.items():
+        await review_scheduler.record_reviews(user_id, reviews)
+
+
+@app.post("/exercises/{exercise_id}/grade")
+async def grade_exercise(exercise_id: str, request: ExerciseAnswer):
+    """Grade an answer to an issued exercise"""
+    
+    graded = await exercise_sessions.grade(exercise_id, request.answer)
+    if graded is None:
+        raise HTTPException(status_code=404, detail="Exercise not found or expired")
+    
+    await _record_exercise_reviews([graded])
+    
+    return _graded_view(graded)
+
+
+@app.post("/exercises/grade/batch")
+async def grade_exercise_batch(request: BatchGradeRequest):
+    """Grade many answers in one call; unknown or expired exercises are reported, not fatal"""
+    
+    results = await exercise_sessions.grade_batch([(item.exercise_id, item.answer) for item in request.answers])
+    graded = [result for result in results if result is not None]
+    await _record_exercise_reviews(graded)
+    
+    return {
+        "graded": len(graded),
+        "correct": sum(result.result.correct for result in graded),
+        "results": [
+            _graded_view(result) if result is not None else {"exercise_id": item.exercise_id, "found": False}
+            for item, result in zip(request.answers, results)
+        ]
+    }
+
+
+@app.get("/lessons")
+async def list_lessons(level: Optional[str] = None, if_none_match: Optional[str] = Header(None)):
+    """Lesson catalog, optionally for one level (cached bytes, ETag-validated)"""
+    
+    payload = lesson_catalog.lesson_list(level)
+    if payload is None:
+        raise HTTPException(status_code=400, detail=f"level must be one of: {', '.join(level.value for level in DifficultyLevel)}")
+    
+    return payload_response(payload, if_none_match)
+
+
+@app.get("/lessons/{lesson_id}")
+async def get_lesson(lesson_id: str, if_none_match: Optional[str] = Header(None)):
+    """A lesson with its vocabulary, cultural note and exercises expanded (cached bytes, ETag-validated)"""
+    
+    payload = lesson_catalog.lesson(lesson_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    
+    return payload_response(payload, if_none_match)
+
+
+@app.post("/lessons/{lesson_id}/exercises")
+async def issue_lesson_exercises(lesson_id: str, user_id: Optional[str] = None):
+    """Issue a lesson's exercises for answering through the exercise grading endpoints"""
+    
+    exercises = hiligaynon.get_lesson_exercises(lesson_id)
+    if exercises is None:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    gradable = [(position, exercise) for position, exercise in enumerate(exercises) if exercise.exercise_type in GRADABLE_TYPES]
+    exercise_ids = await exercise_sessions.issue_many([exercise for _, exercise in gradable], user_id)
+    
+    return {
+        "lesson_id": lesson_id,
+        "exercises": [
+            dict(_issued_view(exercise_id, exercise), position=position)
+            for exercise_id, (position, exercise) in zip(exercise_ids, gradable)
+        ]
+    }
 
 
 @app.get("/sessions/{session_id}")
 async def get_session(session_id: str):
     """Get session details"""
     
-    if session_id not in active_sessions:
+    state = await session_store.get(session_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return active_sessions[session_id]
+    return state.session_view()
 
 
 @app.get("/sessions/{session_id}/history")
 async def get_session_history(session_id: str):
     """Get conversation history for a session"""
     
-    if session_id not in conversation_histories:
+    state = await session_store.get(session_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
     return {
         "session_id": session_id,
-        "messages": [
-            {
-                "role": msg.role,
-                "content": msg.content,
-                "timestamp": msg.timestamp.isoformat()
-            }
-            for msg in conversation_histories[session_id]
-        ]
+        "messages": state.history.as_messages()
     }
 
 
@@ -266,51 +742,80 @@ async def get_session_history(session_id: str):
 async def end_session(session_id: str):
     """End a session"""
     
-    if session_id in active_sessions:
-        session = active_sessions[session_id]
-        session.is_active = False
-        session.ended_at = datetime.utcnow()
-        
+    # Ending a session frees its in-memory state; the final state is persisted.
+    # A turn still in progress on the session finishes first.
+    async with session_locks.hold(session_id):
+        state = await session_store.end(session_id)
+    if state is not None:
         return {"message": "Session ended", "session_id": session_id}
     
     raise HTTPException(status_code=404, detail="Session not found")
 
 
-@app.get("/agents")
-async def list_agents():
-    """List all available agents and their status"""
+@app.get("/search")
+async def search_content(q: str, limit: int = 10, kind: Optional[str] = None):
+    """Ranked, typo-tolerant search over Hiligaynon phrases and vocabulary"""
+    
+    if kind is not None and kind not in SEARCH_KINDS:
+        raise HTTPException(status_code=400, detail=f"kind must be one of: {', '.join(SEARCH_KINDS)}")
+    
+    results = hiligaynon.search(q, max(1, min(limit, MAX_SEARCH_RESULTS)), kinds=(kind,) if kind else None)
+    
     return {
-        "director": {
-            "name": "Director Agent",
-            "status": "active",
-            "description": "Routes messages to specialist agents"
-        },
-        "conversation": {
-            "name": "Conversation Practice Agent",
-            "status": "active",
-            "description": "Handles dialogue practice and general conversation"
-        },
-        "pronunciation": {
-            "name": "Pronunciation Coach Agent",
-            "status": "planned",
-            "description": "Provides pronunciation feedback and coaching"
-        },
-        "reading": {
-            "name": "Reading Comprehension Agent",
-            "status": "planned",
-            "description": "Handles reading practice and comprehension"
-        },
-        "writing": {
-            "name": "Writing Tutor Agent",
-            "status": "planned",
-            "description": "Provides writing feedback and exercises"
-        },
-        "progress": {
-            "name": "Progress Tracker Agent",
-            "status": "planned",
-            "description": "Tracks and reports user progress"
-        }
+        "query": q,
+        "results": [
+            {
+                "kind": result.kind,
+                "score": result.score,
+                "matched_field": result.field,
+                "entry": content_model(result.item).model_dump()
+            }
+            for result in results
+        ]
+    }
+
+
+AGENT_CATALOG = {
+    "director": {
+        "name": "Director Agent",
+        "status": "active",
+        "description": "Routes messages to specialist agents"
+    },
+    "conversation": {
+        "name": "Conversation Practice Agent",
+        "status": "active",
+        "description": "Handles dialogue practice and general conversation"
+    },
+    "pronunciation": {
+        "name": "Pronunciation Coach Agent",
+        "status": "planned",
+        "description": "Provides pronunciation feedback and coaching"
+    },
+    "reading": {
+        "name": "Reading Comprehension Agent",
+        "status": "planned",
+        "description": "Handles reading practice and comprehension"
+    },
+    "writing": {
+        "name": "Writing Tutor Agent",
+        "status": "planned",
+        "description": "Provides writing feedback and exercises"
+    },
+    "progress": {
+        "name": "Progress Tracker Agent",
+        "status": "planned",
+        "description": "Tracks and reports user progress"
     }
+}
+
+# The agent list never changes at runtime, so it is encoded once
+AGENTS_PAYLOAD = make_payload(AGENT_CATALOG)
+
+
+@app.get("/agents")
+async def list_agents(if_none_match: Optional[str] = Header(None)):
+    """List all available agents and their status"""
+    return payload_response(AGENTS_PAYLOAD, if_none_match)
 
 
 if __name__ == "__main__":
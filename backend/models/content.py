@@ -0,0 +1,71 @@
+"""
+LingoKa Content Models
+API representations of language content records.
+
+Content is held internally as lightweight tuple-backed records
+(languages/hiligaynon.py); these models are only built when content
+leaves the API.
+"""
+from pydantic import BaseModel, ConfigDict
+from typing import Any, List, Optional, Type
+from ..languages.hiligaynon import CulturalNote, DifficultyLevel, Exercise, Phrase, VocabularyWord
+
+
+class PhraseModel(BaseModel):
+    """A phrase with translation and pronunciation"""
+    model_config = ConfigDict(from_attributes=True)
+
+    hiligaynon: str
+    english: str
+    pronunciation: str
+    literal: Optional[str] = None
+    context: Optional[str] = None
+    audio_id: Optional[str] = None
+
+
+class VocabularyWordModel(BaseModel):
+    """A vocabulary word with details"""
+    model_config = ConfigDict(from_attributes=True)
+
+    word: str
+    english: str
+    pronunciation: str
+    part_of_speech: str
+    example_sentence: Optional[str] = None
+    example_translation: Optional[str] = None
+
+
+class CulturalNoteModel(BaseModel):
+    """Cultural context information"""
+    model_config = ConfigDict(from_attributes=True)
+
+    title: str
+    content: str
+    related_phrases: List[str] = []
+
+
+class ExerciseModel(BaseModel):
+    """Practice exercise"""
+    model_config = ConfigDict(from_attributes=True)
+
+    exercise_type: str
+    question: str
+    options: Optional[List[str]] = None
+    correct_answer: str
+    explanation: str
+    difficulty: DifficultyLevel = DifficultyLevel.BEGINNER
+    accepted_answers: Optional[List[str]] = None
+
+
+CONTENT_MODELS = {
+    Phrase: PhraseModel,
+    VocabularyWord: VocabularyWordModel,
+    CulturalNote: CulturalNoteModel,
+    Exercise: ExerciseModel,
+}
+
+
+def content_model(record: Any) -> BaseModel:
+    """Convert a content record into its API model"""
+    model: Type[BaseModel] = CONTENT_MODELS[type(record)]
+    return model.model_validate(record)
@@ -0,0 +1,23 @@
+"""
+LingoKa Exercise Models
+"""
+from pydantic import BaseModel, Field
+from typing import List
+
+MAX_BATCH_ANSWERS = 1000
+
+
+class ExerciseAnswer(BaseModel):
+    """An answer to an issued exercise"""
+    answer: str
+
+
+class BatchAnswer(BaseModel):
+    """One answer in a batch"""
+    exercise_id: str
+    answer: str
+
+
+class BatchGradeRequest(BaseModel):
+    """Answers to grade in one call"""
+    answers: List[BatchAnswer] = Field(max_length=MAX_BATCH_ANSWERS)
@@ -28,6 +28,7 @@ class ChatRequest(BaseModel):
     session_id: Optional[str] = None
     language: str = "japanese"
     include_audio: bool = False
+    bypass_cache: bool = False
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
@@ -43,4 +44,5 @@ class ChatResponse(BaseModel):
     suggestions: List[str] = Field(default_factory=list)
     vocabulary: List[Dict[str, str]] = Field(default_factory=list)
     grammar_notes: List[str] = Field(default_factory=list)
+    usage: Optional[Dict[str, int]] = None  # Prompt/completion token accounting for LLM replies
     timestamp: datetime = Field(default_factory=datetime.utcnow)
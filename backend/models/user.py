@@ -61,3 +61,19 @@ class UserProgress(BaseModel):
     strong_areas: List[str] = Field(default_factory=list)
     last_practice_at: Optional[datetime] = None
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ReviewGrade(BaseModel):
+    """Result of reviewing one item, graded 0 (forgot) to 5 (perfect recall)"""
+    item: str
+    grade: int = Field(ge=0, le=5)
+
+
+class ReviewBatch(BaseModel):
+    """Review results from a finished quiz or practice round"""
+    reviews: List[ReviewGrade]
+
+
+class ReviewItems(BaseModel):
+    """Items to start scheduling for review"""
+    items: List[str]
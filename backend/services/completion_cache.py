@@ -0,0 +1,249 @@
+"""
+LingoKa Completion Cache
+LRU + TTL cache for LLM conversation completions.
+
+Identical prompts from learners at the same level with the same recent
+history are answered from the cache instead of calling the LLM again. The
+storage backend is pluggable: an in-process LRU for a single worker, or a
+local SQLite file that survives restarts and can be shared between workers
+on the same machine. SQLite I/O runs in a worker thread, and the file is
+trimmed back to its size limit in batches rather than on every insert.
+"""
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from ..config.settings import get_settings
+from ..models.message import ChatMessage
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?]+$")
+
+
+class CompletionCacheBackend:
+    """Storage interface for cached completions"""
+
+    async def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set(self, key: str, value: str) -> None:
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class InMemoryCompletionCache(CompletionCacheBackend):
+    """Bounded in-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCompletionCache(CompletionCacheBackend):
+    """
+    Local on-disk LRU with per-entry expiry, backed by SQLite.
+
+    Inserts are counted, and once trim_every of them have accumulated the
+    expired and least recently used rows beyond max_entries are deleted in
+    one pass, so the file holds at most max_entries + trim_every rows. The
+    row count is kept up to date alongside, so len() never queries the file.
+    """
+
+    def __init__(self, path: str, max_entries: int, ttl_seconds: float, trim_every: Optional[int] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.trim_every = trim_every or max(1, max_entries // 10)
+        self._inserts = 0
+        self.trims = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS completions_lru ON completions (last_access)")
+        self._rows = self._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] < now:
+                self._rows -= self._conn.execute("DELETE FROM completions WHERE key = ?", (key,)).rowcount
+                return None
+            self._conn.execute("UPDATE completions SET last_access = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO completions (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            ).rowcount
+            if inserted:
+                self._rows += 1
+            else:
+                self._conn.execute(
+                    "UPDATE completions SET value = ?, expires_at = ?, last_access = ? WHERE key = ?",
+                    (value, now + self.ttl_seconds, now, key)
+                )
+            self._inserts += 1
+            if self._inserts >= self.trim_every:
+                self._trim(now)
+
+    def _trim(self, now: float) -> None:
+        """Drop expired rows and the least recently used beyond max_entries; callers hold self._lock"""
+        self._inserts = 0
+        self.trims += 1
+        self._rows -= self._conn.execute("DELETE FROM completions WHERE expires_at < ?", (now,)).rowcount
+        self._rows -= self._conn.execute(
+            "DELETE FROM completions WHERE key IN ("
+            " SELECT key FROM completions ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        ).rowcount
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM completions")
+            self._inserts = 0
+            self._rows = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    def __len__(self) -> int:
+        return self._rows
+
+
+class CompletionCache:
+    """
+    Completion cache front-end.
+
+    Builds cache keys from the normalized message, the user's level and a
+    hash of the recent history window, and keeps hit/miss counters.
+    """
+
+    def __init__(self, backend: CompletionCacheBackend, history_window: int = 10):
+        self.backend = backend
+        self.history_window = history_window
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_message(message: str) -> str:
+        """Case-fold, collapse whitespace and drop trailing punctuation"""
+        return _TRAILING_PUNCTUATION.sub("", _WHITESPACE.sub(" ", message.strip().lower()))
+
+    def make_key(
+        self,
+        message: str,
+        user_level: str,
+        conversation_history: List[ChatMessage] = None,
+        model: str = ""
+    ) -> str:
+        """Build the cache key for a prompt"""
+        history = hashlib.sha256()
+        for msg in (conversation_history or [])[-self.history_window:]:
+            role = msg.role.value if hasattr(msg.role, 'value') else msg.role
+            history.update(f"{role}\x1f{msg.content}\x1e".encode())
+
+        key = "\x1f".join([
+            model,
+            getattr(user_level, "value", user_level),
+            self.normalize_message(message),
+            history.hexdigest()
+        ])
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a completion, counting the hit or miss"""
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        """Store a completion"""
+        await self.backend.set(key, value)
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counters"""
+        return {"entries": len(self.backend), "hits": self.hits, "misses": self.misses}
+
+
+_completion_cache: Optional[CompletionCache] = None
+
+
+def get_completion_cache() -> Optional[CompletionCache]:
+    """Get the process-wide completion cache, or None when caching is disabled"""
+    global _completion_cache
+    settings = get_settings()
+    if not settings.COMPLETION_CACHE_ENABLED:
+        return None
+    if _completion_cache is None:
+        if settings.COMPLETION_CACHE_BACKEND == "sqlite":
+            backend: CompletionCacheBackend = SQLiteCompletionCache(
+                settings.data_path(settings.COMPLETION_CACHE_PATH),
+                settings.COMPLETION_CACHE_MAX_ENTRIES,
+                settings.COMPLETION_CACHE_TTL_SECONDS
+            )
+        else:
+            backend = InMemoryCompletionCache(
+                settings.COMPLETION_CACHE_MAX_ENTRIES,
+                settings.COMPLETION_CACHE_TTL_SECONDS
+            )
+        _completion_cache = CompletionCache(backend, settings.COMPLETION_CACHE_HISTORY_WINDOW)
+    return _completion_cache
@@ -0,0 +1,192 @@
+"""
+LingoKa Conversation History
+Compact per-session conversation history.
+
+Each session keeps exactly one history: a bounded ring buffer stored as
+parallel arrays. Roles and agent names are interned to small integer codes,
+timestamps are integer epoch seconds, and turns that fall out of the hot
+window can be zlib-compressed. Each turn's token count is computed once
+when it is appended, so prompt packing never re-tokenizes history. API
+views (session details, history listings) are rendered from it on demand.
+"""
+import time
+import zlib
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+from ..models.message import MessageRole
+from .tokens import count_tokens
+
+_ROLES: List[MessageRole] = list(MessageRole)
+_ROLE_CODES: Dict[MessageRole, int] = {role: code for code, role in enumerate(_ROLES)}
+
+# Agent names are interned process-wide; code 0 means "no agent"
+_AGENT_NAMES: List[Optional[str]] = [None]
+_AGENT_CODES: Dict[str, int] = {}
+
+
+def _agent_code(agent: Optional[str]) -> int:
+    if agent is None:
+        return 0
+    code = _AGENT_CODES.get(agent)
+    if code is None:
+        code = len(_AGENT_NAMES)
+        _AGENT_NAMES.append(agent)
+        _AGENT_CODES[agent] = code
+    return code
+
+
+class HistoryEntry(NamedTuple):
+    """A single turn, decoded from the history buffer"""
+    role: MessageRole
+    content: str
+    timestamp: int
+    agent: Optional[str] = None
+    tokens: int = 0
+
+
+class ConversationHistory:
+    """
+    Bounded ring buffer of conversation turns.
+
+    Supports len(), iteration and indexing/slicing (history[-10:]) like a
+    list of messages; entries expose .role and .content the same way
+    ChatMessage does.
+    """
+
+    __slots__ = ("capacity", "hot_messages", "compress_min_chars",
+                 "_roles", "_agents", "_timestamps", "_tokens", "_contents", "_head")
+
+    def __init__(self, capacity: int, hot_messages: int = 20, compress_min_chars: Optional[int] = 256):
+        self.capacity = capacity
+        self.hot_messages = hot_messages
+        self.compress_min_chars = compress_min_chars
+        self._roles = array("B")
+        self._agents = array("H")
+        self._timestamps = array("q")
+        self._tokens = array("I")
+        self._contents: List[Union[str, bytes]] = []
+        self._head = 0
+
+    def append(
+        self,
+        role: MessageRole,
+        content: str,
+        agent: Optional[str] = None,
+        timestamp: Optional[int] = None,
+        tokens: Optional[int] = None
+    ) -> None:
+        """Append a turn, overwriting the oldest once the buffer is full"""
+        role_code = _ROLE_CODES[MessageRole(role)]
+        agent_code = _agent_code(agent)
+        ts = int(time.time()) if timestamp is None else timestamp
+        token_count = count_tokens(content) if tokens is None else tokens
+
+        if len(self._contents) < self.capacity:
+            self._roles.append(role_code)
+            self._agents.append(agent_code)
+            self._timestamps.append(ts)
+            self._tokens.append(token_count)
+            self._contents.append(content)
+        else:
+            slot = self._head
+            self._roles[slot] = role_code
+            self._agents[slot] = agent_code
+            self._timestamps[slot] = ts
+            self._tokens[slot] = token_count
+            self._contents[slot] = content
+            self._head = (slot + 1) % self.capacity
+
+        self._compress_cold()
+
+    def _compress_cold(self) -> None:
+        """Compress the turn that just left the hot window"""
+        if self.compress_min_chars is None or len(self._contents) <= self.hot_messages:
+            return
+        slot = self._slot(len(self._contents) - self.hot_messages - 1)
+        content = self._contents[slot]
+        if isinstance(content, str) and len(content) >= self.compress_min_chars:
+            self._contents[slot] = zlib.compress(content.encode("utf-8"))
+
+    def _slot(self, index: int) -> int:
+        return (self._head + index) % len(self._contents)
+
+    def _entry(self, index: int) -> HistoryEntry:
+        slot = self._slot(index)
+        content = self._contents[slot]
+        if isinstance(content, bytes):
+            content = zlib.decompress(content).decode("utf-8")
+        return HistoryEntry(
+            _ROLES[self._roles[slot]],
+            content,
+            self._timestamps[slot],
+            _AGENT_NAMES[self._agents[slot]],
+            self._tokens[slot]
+        )
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        for i in range(len(self._contents)):
+            yield self._entry(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self._entry(i) for i in range(*key.indices(len(self._contents)))]
+        if key < 0:
+            key += len(self._contents)
+        if not 0 <= key < len(self._contents):
+            raise IndexError("history index out of range")
+        return self._entry(key)
+
+    def recent_within_budget(self, budget: int, per_message_overhead: int = 0) -> int:
+        """Number of most recent turns whose cached token counts fit within budget"""
+        used = 0
+        count = 0
+        for index in range(len(self._contents) - 1, -1, -1):
+            used += self._tokens[self._slot(index)] + per_message_overhead
+            if used > budget:
+                break
+            count += 1
+        return count
+
+    # Serialization
+
+    def to_rows(self) -> List[List[Any]]:
+        """Serialize turns as [role, content, timestamp, agent, tokens] rows"""
+        return [[entry.role.value, entry.content, entry.timestamp, entry.agent, entry.tokens] for entry in self]
+
+    def extend_rows(self, rows: List[List[Any]]) -> None:
+        """Append turns from serialized rows (rows stored without a token count are counted now)"""
+        for row in rows:
+            role, content, timestamp, agent = row[:4]
+            tokens = row[4] if len(row) > 4 else None
+            self.append(MessageRole(role), content, agent=agent, timestamp=timestamp, tokens=tokens)
+
+    # Views
+
+    def as_messages(self) -> List[Dict[str, Any]]:
+        """Render the /sessions/{id}/history message view"""
+        return [
+            {
+                "role": entry.role,
+                "content": entry.content,
+                "timestamp": datetime.utcfromtimestamp(entry.timestamp).isoformat()
+            }
+            for entry in self
+        ]
+
+    def as_session_history(self) -> List[Dict[str, Any]]:
+        """Render the UserSession.conversation_history view"""
+        turns = []
+        for entry in self:
+            turn = {
+                "role": entry.role.value,
+                "content": entry.content,
+                "timestamp": datetime.utcfromtimestamp(entry.timestamp).isoformat()
+            }
+            if entry.agent is not None:
+                turn["agent"] = entry.agent
+            turns.append(turn)
+        return turns
@@ -0,0 +1,242 @@
+"""
+LingoKa Exercise Sessions
+Issued exercises awaiting an answer, kept server-side so answers never
+travel to the client.
+
+Each issued exercise gets an opaque id mapped to the exercise record in a
+BoundedStore, so issuing and grading are O(1) and unanswered exercises
+expire after an idle TTL or are evicted once the store is full. Grading
+consumes the pending entry; answers are checked locally by the tolerant
+grader, never by the LLM. A background sweeper drops expired exercises.
+
+When several workers share one DocumentStore, pending exercises are kept
+there instead, so an answer can be graded by any worker. Grading claims
+the exercise with a versioned delete, so it is graded at most once.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from ..config.settings import get_settings
+from ..languages.grading import GradeResult, grade_answer
+from ..languages.hiligaynon import DifficultyLevel, Exercise
+from .session_store import BoundedStore, SharedSessionStore, get_session_store
+from .storage import Document, DocumentStore
+
+
+class PendingExercise(NamedTuple):
+    """An issued exercise waiting for its answer"""
+    exercise: Exercise
+    user_id: Optional[str]
+    issued_at: int
+
+    def to_document(self) -> Document:
+        return {
+            "exercise": dict(self.exercise._asdict(), difficulty=self.exercise.difficulty.value),
+            "user_id": self.user_id,
+            "issued_at": self.issued_at
+        }
+
+    @classmethod
+    def from_document(cls, doc: Document) -> "PendingExercise":
+        fields: Dict[str, Any] = dict(doc["exercise"])
+        fields["difficulty"] = DifficultyLevel(fields["difficulty"])
+        for name in ("options", "accepted_answers"):
+            if fields.get(name) is not None:
+                fields[name] = tuple(fields[name])
+        return cls(Exercise(**fields), doc["user_id"], doc["issued_at"])
+
+
+class GradedAnswer(NamedTuple):
+    """A graded answer together with the exercise it answered"""
+    exercise_id: str
+    pending: PendingExercise
+    result: GradeResult
+
+
+class ExerciseSessionStore:
+    """Pending exercises keyed by id, with idle expiry and a size cap"""
+
+    def __init__(self, max_pending: int = 100000, ttl_seconds: Optional[float] = 3600.0):
+        self.ttl_seconds = ttl_seconds
+        self._pending: BoundedStore[PendingExercise] = BoundedStore(max_pending, ttl_seconds)
+        self._sweeper: Optional[asyncio.Task] = None
+        self.issued = 0
+        self.graded = 0
+        self.correct = 0
+        self.missing = 0
+
+    async def issue(self, exercise: Exercise, user_id: Optional[str] = None) -> str:
+        """Hold an exercise's answer server-side and return the id to answer it with"""
+        return (await self.issue_many([exercise], user_id))[0]
+
+    async def issue_many(self, exercises: Sequence[Exercise], user_id: Optional[str] = None) -> List[str]:
+        """Issue several exercises at once, e.g. a quiz; returns their ids in order"""
+        issued_at = int(time.time())
+        exercise_ids = []
+        for exercise in exercises:
+            exercise_id = uuid.uuid4().hex
+            self._pending.set(exercise_id, PendingExercise(exercise, user_id, issued_at))
+            exercise_ids.append(exercise_id)
+        self.issued += len(exercise_ids)
+        return exercise_ids
+
+    async def get(self, exercise_id: str) -> Optional[PendingExercise]:
+        """Look up a pending exercise without grading it"""
+        return self._pending.get(exercise_id)
+
+    async def _claim(self, exercise_id: str) -> Optional[PendingExercise]:
+        """Remove a pending exercise so it can be graded; None if it is unknown or expired"""
+        pending = self._pending.get(exercise_id)
+        if pending is not None:
+            self._pending.pop(exercise_id)
+        return pending
+
+    async def grade(self, exercise_id: str, answer: str) -> Optional[GradedAnswer]:
+        """Grade an answer and retire the exercise; None if it is unknown or expired"""
+        pending = await self._claim(exercise_id)
+        if pending is None:
+            self.missing += 1
+            return None
+        result = grade_answer(pending.exercise, answer)
+        self.graded += 1
+        self.correct += result.correct
+        return GradedAnswer(exercise_id, pending, result)
+
+    async def grade_batch(self, answers: Sequence[Tuple[str, str]]) -> List[Optional[GradedAnswer]]:
+        """Grade many (exercise id, answer) pairs, in order"""
+        return [await self.grade(exercise_id, answer) for exercise_id, answer in answers]
+
+    async def sweep(self) -> int:
+        """Drop expired exercises"""
+        return self._pending.sweep()
+
+    def start(self, sweep_interval_seconds: float) -> None:
+        """Start the expiry sweeper"""
+        if self._sweeper is None and self.ttl_seconds is not None:
+            self._sweeper = asyncio.create_task(self._sweep_forever(sweep_interval_seconds))
+
+    async def stop(self) -> None:
+        """Stop the expiry sweeper"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    async def _sweep_forever(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.sweep()
+            except Exception:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        """Pending count and grading counters"""
+        return {
+            "pending": len(self._pending),
+            "issued": self.issued,
+            "graded": self.graded,
+            "correct": self.correct,
+            "missing": self.missing,
+            "expired": self._pending.expired,
+            "evicted": self._pending.evicted
+        }
+
+
+class SharedExerciseSessionStore(ExerciseSessionStore):
+    """
+    Pending exercises for several worker processes sharing one DocumentStore.
+
+    Nothing is cached: issuing writes the exercise through, and grading
+    reads it and deletes it with a version check, so whichever worker
+    receives the answer can grade it and a second grading finds nothing.
+    Expired exercises are deleted by the sweeper.
+    """
+
+    def __init__(self, store: DocumentStore, collection: str = "exercises", **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.collection = collection
+        self.expired = 0
+
+    async def issue_many(self, exercises: Sequence[Exercise], user_id: Optional[str] = None) -> List[str]:
+        """Write several exercises through in one batch; returns their ids in order"""
+        issued_at = int(time.time())
+        exercise_ids = [uuid.uuid4().hex for _ in exercises]
+        await self.store.commit([
+            (self.collection, exercise_id, PendingExercise(exercise, user_id, issued_at).to_document())
+            for exercise_id, exercise in zip(exercise_ids, exercises)
+        ])
+        self.issued += len(exercise_ids)
+        return exercise_ids
+
+    def _is_expired(self, pending: PendingExercise) -> bool:
+        return self.ttl_seconds is not None and time.time() - pending.issued_at > self.ttl_seconds
+
+    async def get(self, exercise_id: str) -> Optional[PendingExercise]:
+        """Look up a pending exercise without grading it"""
+        doc = await self.store.get_document(self.collection, exercise_id)
+        if doc is None:
+            return None
+        pending = PendingExercise.from_document(doc)
+        return None if self._is_expired(pending) else pending
+
+    async def _claim(self, exercise_id: str) -> Optional[PendingExercise]:
+        """Delete a pending exercise from the shared store, unless another worker got it first"""
+        doc, version = await self.store.get_versioned(self.collection, exercise_id)
+        if doc is None or not await self.store.compare_and_delete(self.collection, exercise_id, version):
+            return None
+        pending = PendingExercise.from_document(doc)
+        if self._is_expired(pending):
+            self.expired += 1
+            return None
+        return pending
+
+    async def sweep(self) -> int:
+        """Delete exercises issued longer than the TTL ago"""
+        if self.ttl_seconds is None:
+            return 0
+        removed = await self.store.delete_older_than(self.collection, time.time() - self.ttl_seconds)
+        self.expired += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Grading counters (pending exercises live in the shared store)"""
+        return {
+            "issued": self.issued,
+            "graded": self.graded,
+            "correct": self.correct,
+            "missing": self.missing,
+            "expired": self.expired
+        }
+
+
+_exercise_sessions: Optional[ExerciseSessionStore] = None
+
+
+def get_exercise_sessions() -> ExerciseSessionStore:
+    """Get the process-wide store of pending exercises"""
+    global _exercise_sessions
+    if _exercise_sessions is None:
+        settings = get_settings()
+        session_store = get_session_store()
+        if isinstance(session_store, SharedSessionStore):
+            # Multi-worker mode: any worker may receive the answer
+            _exercise_sessions = SharedExerciseSessionStore(
+                session_store.store,
+                collection=settings.FIRESTORE_COLLECTION_EXERCISES,
+                ttl_seconds=settings.EXERCISE_TTL_SECONDS
+            )
+        else:
+            _exercise_sessions = ExerciseSessionStore(
+                max_pending=settings.EXERCISE_MAX_PENDING,
+                ttl_seconds=settings.EXERCISE_TTL_SECONDS
+            )
+    return _exercise_sessions
@@ -0,0 +1,133 @@
+"""
+LingoKa Lesson Catalog
+Fully expanded lesson documents, serialized once per content version.
+
+Lesson plans reference their vocabulary by text, their cultural note by
+title and their exercises by position. The catalog resolves all of these
+once, builds the summary list (per level too) and every lesson's detail
+document, and keeps them only as pre-encoded payloads with strong ETags.
+Requests pick a payload by key; nothing is re-serialized until the
+content changes.
+
+Exercise answers are left out: lesson exercises are answered through the
+exercise session API like any other exercise.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from ..languages.hiligaynon import DifficultyLevel, Exercise, HiligaynonModule, get_hiligaynon_module
+from ..models.content import content_model
+from .payloads import StaticPayload, make_payload
+
+# Rough pacing used for the catalog's duration and XP estimates
+MINUTES_PER_VOCABULARY_ITEM = 1
+MINUTES_PER_EXERCISE = 2
+XP_PER_EXERCISE = 10
+
+_LEVEL_ORDER = {level: rank for rank, level in enumerate(DifficultyLevel)}
+
+
+def _lesson_level(exercises: Tuple[Exercise, ...]) -> DifficultyLevel:
+    """A lesson is as hard as its hardest exercise"""
+    if not exercises:
+        return DifficultyLevel.BEGINNER
+    return max((exercise.difficulty for exercise in exercises), key=_LEVEL_ORDER.__getitem__)
+
+
+def _exercise_view(position: int, exercise: Exercise) -> Dict[str, Any]:
+    return {
+        "position": position,
+        "type": exercise.exercise_type,
+        "question": exercise.question,
+        "options": list(exercise.options) if exercise.options else None,
+        "difficulty": exercise.difficulty.value
+    }
+
+
+class LessonCatalog:
+    """Pre-serialized lesson list and lesson documents for one language module"""
+
+    def __init__(self, module: HiligaynonModule):
+        self.module = module
+        self._content_version: Optional[int] = None
+        self._lists: Dict[Optional[str], StaticPayload] = {}
+        self._lessons: Dict[str, StaticPayload] = {}
+        self.builds = 0
+
+    def _resolve_vocabulary(self, text: str) -> Dict[str, Any]:
+        record = self.module.get_phrase(text) or self.module.get_vocabulary_word(text)
+        if record is None:
+            return {"hiligaynon": text}
+        return content_model(record).model_dump(mode="json")
+
+    def _documents(self) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """(summary, detail) for every lesson, in authoring order"""
+        documents = []
+        for lesson_id, lesson in self.module.get_lessons().items():
+            exercises = self.module.get_lesson_exercises(lesson_id) or ()
+            vocabulary = lesson.get("vocabulary", ())
+            summary = {
+                "id": lesson_id,
+                "title": lesson.get("title", lesson_id),
+                "description": lesson.get("description", ""),
+                "topic": lesson.get("topic", ""),
+                "level": _lesson_level(exercises).value,
+                "objectives": list(lesson.get("objectives", ())),
+                "vocabulary_count": len(vocabulary),
+                "exercise_count": len(exercises),
+                "duration_minutes": len(vocabulary) * MINUTES_PER_VOCABULARY_ITEM + len(exercises) * MINUTES_PER_EXERCISE,
+                "xp_reward": len(exercises) * XP_PER_EXERCISE,
+                # Per-user progress is not part of the shared catalog
+                "is_completed": False,
+                "progress_percent": 0
+            }
+            note = self.module.get_cultural_note(lesson["cultural_note"]) if lesson.get("cultural_note") else None
+            detail = dict(
+                summary,
+                vocabulary=[self._resolve_vocabulary(text) for text in vocabulary],
+                cultural_note=content_model(note).model_dump(mode="json") if note else None,
+                exercises=[_exercise_view(position, exercise) for position, exercise in enumerate(exercises)]
+            )
+            documents.append((summary, detail))
+        return documents
+
+    def _refresh(self) -> None:
+        version = self.module.content_version()
+        if version == self._content_version:
+            return
+        documents = self._documents()
+        summaries = [summary for summary, _ in documents]
+        lists: Dict[Optional[str], StaticPayload] = {None: make_payload(summaries)}
+        for level in DifficultyLevel:
+            lists[level.value] = make_payload([summary for summary in summaries if summary["level"] == level.value])
+        self._lists = lists
+        self._lessons = {detail["id"]: make_payload(detail) for _, detail in documents}
+        self._content_version = version
+        self.builds += 1
+
+    def lesson_list(self, level: Optional[str] = None) -> Optional[StaticPayload]:
+        """Summary list of every lesson, or of one level's; None for an unknown level"""
+        self._refresh()
+        return self._lists.get(level)
+
+    def lesson(self, lesson_id: str) -> Optional[StaticPayload]:
+        """A lesson's expanded document, or None if there is no such lesson"""
+        self._refresh()
+        return self._lessons.get(lesson_id)
+
+    def stats(self) -> Dict[str, int]:
+        """Catalog size and rebuild count"""
+        return {
+            "lessons": len(self._lessons),
+            "bytes": sum(len(payload.body) for payload in self._lessons.values()),
+            "builds": self.builds
+        }
+
+
+_lesson_catalog: Optional[LessonCatalog] = None
+
+
+def get_lesson_catalog() -> LessonCatalog:
+    """Get the process-wide lesson catalog"""
+    global _lesson_catalog
+    if _lesson_catalog is None:
+        _lesson_catalog = LessonCatalog(get_hiligaynon_module())
+    return _lesson_catalog
@@ -0,0 +1,179 @@
+"""
+LingoKa LLM Admission Control
+Bounds how many LLM calls are in flight and queues the rest by priority.
+
+Every upstream completion takes a slot first. When all slots are busy the
+caller waits in a bounded queue, ordered by priority class (an active
+lesson ahead of casual chat) and then by arrival. A caller that cannot be
+queued, waits past the queue deadline, or is displaced by a higher-priority
+arrival while the queue is full gets AdmissionRejected straight away, so
+the agent can degrade to its offline response instead of piling more load
+onto a saturated upstream.
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+from ..config.settings import get_settings
+
+
+class LLMPriority(IntEnum):
+    """Admission priority classes; lower values are served first"""
+    LESSON = 0
+    CHAT = 1
+
+
+class AdmissionRejected(Exception):
+    """No LLM slot could be granted: the queue is full or the wait timed out"""
+
+
+class LLMAdmission:
+    """Concurrency limiter with a bounded, priority-ordered wait queue"""
+
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._queued = 0
+        self._queues: Dict[LLMPriority, Deque[asyncio.Future]] = {priority: deque() for priority in LLMPriority}
+        self.max_queued = 0
+        self.admitted = dict.fromkeys(LLMPriority, 0)
+        self.rejected = dict.fromkeys(LLMPriority, 0)
+        self.timed_out = dict.fromkeys(LLMPriority, 0)
+        self._wait_total = dict.fromkeys(LLMPriority, 0.0)
+        self._wait_max = dict.fromkeys(LLMPriority, 0.0)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: LLMPriority = LLMPriority.CHAT,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[float]:
+        """Hold an in-flight slot for the duration of the block; yields the seconds spent queued"""
+        waited = await self.acquire(priority, timeout)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    async def acquire(self, priority: LLMPriority = LLMPriority.CHAT, timeout: Optional[float] = None) -> float:
+        """Wait for an in-flight slot (at most timeout, if sooner than the queue deadline); returns the seconds spent queued"""
+        if self._in_flight < self.max_in_flight and not self._queued:
+            self._in_flight += 1
+            self._admit(priority, 0.0)
+            return 0.0
+        if self._queued >= self.max_queue and not self._displace_below(priority):
+            self.rejected[priority] += 1
+            raise AdmissionRejected("LLM wait queue is full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._queues[priority]
+        queue.append(waiter)
+        self._queued += 1
+        self.max_queued = max(self.max_queued, self._queued)
+        start = time.monotonic()
+        wait = self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+        try:
+            await asyncio.wait_for(waiter, wait)
+        except asyncio.TimeoutError:
+            self._abandon(queue, waiter)
+            self.timed_out[priority] += 1
+            raise AdmissionRejected(f"waited over {wait:.2f}s for an LLM slot")
+        except asyncio.CancelledError:
+            self._abandon(queue, waiter)
+            raise
+        waited = time.monotonic() - start
+        self._admit(priority, waited)
+        return waited
+
+    def release(self) -> None:
+        """Return a slot, handing it straight to the next waiter if there is one"""
+        for queue in self._queues.values():
+            while queue:
+                waiter = queue.popleft()
+                self._queued -= 1
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+        self._in_flight -= 1
+
+    def _admit(self, priority: LLMPriority, waited: float) -> None:
+        self.admitted[priority] += 1
+        self._wait_total[priority] += waited
+        if waited > self._wait_max[priority]:
+            self._wait_max[priority] = waited
+
+    def _abandon(self, queue: Deque[asyncio.Future], waiter: asyncio.Future) -> None:
+        """Clean up after a waiter that stopped waiting"""
+        if waiter.done() and not waiter.cancelled():
+            # The slot was handed over just as the wait ended; pass it on
+            self.release()
+            return
+        try:
+            queue.remove(waiter)
+            self._queued -= 1
+        except ValueError:
+            pass
+
+    def _displace_below(self, priority: LLMPriority) -> bool:
+        """Reject the newest waiter of a lower priority class to make room"""
+        for lower in reversed(LLMPriority):
+            if lower <= priority:
+                return False
+            queue = self._queues[lower]
+            if queue:
+                waiter = queue.pop()
+                self._queued -= 1
+                self.rejected[lower] += 1
+                waiter.set_exception(AdmissionRejected("displaced by a higher-priority LLM call"))
+                return True
+        return False
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def stats(self) -> Dict[str, Any]:
+        """Slot usage, queue depth and per-priority wait metrics"""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": self._queued,
+            "max_queued": self.max_queued,
+            "priorities": {
+                priority.name.lower(): {
+                    "queued": len(self._queues[priority]),
+                    "admitted": self.admitted[priority],
+                    "rejected": self.rejected[priority],
+                    "timed_out": self.timed_out[priority],
+                    "mean_wait_ms": round(self._wait_total[priority] / self.admitted[priority] * 1e3, 2)
+                    if self.admitted[priority] else 0.0,
+                    "max_wait_ms": round(self._wait_max[priority] * 1e3, 2)
+                }
+                for priority in LLMPriority
+            }
+        }
+
+
+_admission: Optional[LLMAdmission] = None
+
+
+def get_llm_admission() -> LLMAdmission:
+    """Get the process-wide LLM admission controller"""
+    global _admission
+    if _admission is None:
+        settings = get_settings()
+        _admission = LLMAdmission(
+            settings.LLM_MAX_IN_FLIGHT,
+            settings.LLM_MAX_QUEUE,
+            settings.LLM_QUEUE_TIMEOUT_SECONDS
+        )
+    return _admission
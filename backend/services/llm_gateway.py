@@ -0,0 +1,99 @@
+"""
+LingoKa LLM Gateway
+Process-wide owner of pooled HTTP connections to the LLM providers.
+
+Agents borrow provider clients from the gateway instead of building their
+own, so every request reuses the same keep-alive connection pool instead of
+paying for a fresh pool and TLS handshake.
+"""
+from typing import Optional, Any
+import httpx
+from openai import AsyncOpenAI
+from ..config.settings import Settings, get_settings
+
+
+class LLMGateway:
+    """
+    Shared LLM gateway.
+
+    Owns a single pooled httpx.AsyncClient and hands out provider clients
+    (OpenAI, Anthropic) that are bound to it. Provider clients are created
+    lazily and only when the corresponding API key is configured.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.settings = settings or get_settings()
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.settings.LLM_POOL_MAX_CONNECTIONS,
+                max_keepalive_connections=self.settings.LLM_POOL_MAX_KEEPALIVE,
+                keepalive_expiry=self.settings.LLM_POOL_KEEPALIVE_EXPIRY
+            ),
+            timeout=httpx.Timeout(
+                self.settings.LLM_REQUEST_TIMEOUT,
+                connect=self.settings.LLM_CONNECT_TIMEOUT
+            )
+        )
+        self._openai: Optional[AsyncOpenAI] = None
+        self._anthropic: Optional[Any] = None
+
+    @property
+    def openai(self) -> Optional[AsyncOpenAI]:
+        """OpenAI client bound to the shared pool, or None if no key is configured"""
+        if self._openai is None and self.settings.OPENAI_API_KEY:
+            self._openai = AsyncOpenAI(
+                api_key=self.settings.OPENAI_API_KEY,
+                base_url=self.settings.OPENAI_BASE_URL,
+                # Retried by the agents' deadline-aware retry policy instead
+                max_retries=0,
+                http_client=self.http_client
+            )
+        return self._openai
+
+    @property
+    def anthropic(self) -> Optional[Any]:
+        """Anthropic client bound to the shared pool, or None if unavailable"""
+        if self._anthropic is None and self.settings.ANTHROPIC_API_KEY:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError:
+                return None
+            self._anthropic = AsyncAnthropic(
+                api_key=self.settings.ANTHROPIC_API_KEY,
+                # Retried by the agents' deadline-aware retry policy instead
+                max_retries=0,
+                http_client=self.http_client
+            )
+        return self._anthropic
+
+    def status(self) -> dict:
+        """Describe which providers are configured"""
+        return {
+            "openai": "configured" if self.settings.OPENAI_API_KEY else "missing",
+            "anthropic": "configured" if self.settings.ANTHROPIC_API_KEY else "missing",
+            "max_connections": self.settings.LLM_POOL_MAX_CONNECTIONS,
+            "max_keepalive_connections": self.settings.LLM_POOL_MAX_KEEPALIVE
+        }
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool"""
+        await self.http_client.aclose()
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the process-wide LLM gateway, creating it on first use"""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway()
+    return _gateway
+
+
+async def close_llm_gateway() -> None:
+    """Close the process-wide LLM gateway, if one was created"""
+    global _gateway
+    if _gateway is not None:
+        await _gateway.aclose()
+        _gateway = None
@@ -0,0 +1,253 @@
+"""
+LingoKa LLM Resilience
+Deadlines, jittered retries and a circuit breaker for upstream LLM calls.
+
+A chat request gets one end-to-end Deadline when it arrives. Everything
+it waits on downstream (the admission queue, each LLM attempt, the pause
+between attempts) is bounded by the time that deadline has left, so a slow
+provider costs a request at most its deadline rather than a full client
+timeout per attempt.
+
+Failed attempts are retried with full-jitter exponential backoff, but only
+for transient errors and only while enough of the deadline remains for
+another attempt to finish. Every attempt reports to a shared
+CircuitBreaker: after a run of consecutive failures it opens, and calls
+fail fast with CircuitOpen (the agents answer offline) until a cooldown
+has passed and a single probe call gets through successfully.
+"""
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Dict, Optional, TypeVar, Union
+import openai
+from ..config.settings import get_settings
+
+T = TypeVar("T")
+
+# HTTP statuses worth another attempt: timeouts, conflicts, rate limits and server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+class DeadlineExceeded(Exception):
+    """The request ran out of time before the LLM call could finish"""
+
+
+class CircuitOpen(Exception):
+    """The circuit breaker is open: upstream is considered unhealthy"""
+
+
+class Deadline:
+    """A point in time by which a request must be answered"""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, seconds: float):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether a failed LLM call may succeed if tried again"""
+    if isinstance(exc, (asyncio.TimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code in RETRYABLE_STATUS_CODES or exc.status_code >= 500
+    return False
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed: calls go through. open: calls are refused until reset_timeout
+    has passed. half_open: one probe call is let through; its success closes
+    the breaker, its failure or cancellation opens it again. A probe that
+    never reports back is followed by another one a cooldown later.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.opened = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return self.CLOSED
+        return self.HALF_OPEN if self._probing else self.OPEN
+
+    def blocked(self) -> bool:
+        """Whether calls are being refused right now, without using up a probe"""
+        if self._opened_at is None:
+            return False
+        # Past the cooldown since opening, or since a probe that never reported back
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return False
+        self.short_circuited += 1
+        return True
+
+    def allow(self) -> bool:
+        """Whether a call may go upstream now; past the cooldown this lets the probe through"""
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_timeout:
+            self._opened_at = now
+            self._probing = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_abandoned(self) -> None:
+        """A call was cancelled before upstream answered; an abandoned probe counts as a failure"""
+        if self._probing:
+            self.record_failure()
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or (self._opened_at is None and self._failures >= self.failure_threshold):
+            self._opened_at = time.monotonic()
+            self._probing = False
+            self.opened += 1
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        """Breaker state and trip counters"""
+        retry_in = 0.0
+        if self._opened_at is not None:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "opened": self.opened,
+            "short_circuited": self.short_circuited,
+            "retry_in_seconds": round(retry_in, 1)
+        }
+
+
+class RetryPolicy:
+    """Bounded, deadline-aware retries with full-jitter exponential backoff"""
+
+    def __init__(
+        self,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        min_attempt_seconds: float,
+        rng: Optional[random.Random] = None
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_attempt_seconds = min_attempt_seconds
+        self._rng = rng or random.Random()
+        self.attempts = 0
+        self.retries = 0
+        self.failures = 0
+        self.deadline_exceeded = 0
+
+    def backoff(self, retry: int) -> float:
+        """Pause before the given retry (0-based): uniform in [0, min(max_delay, base_delay * 2**retry)]"""
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    async def call(
+        self,
+        attempt: Callable[[float], Awaitable[T]],
+        deadline: Deadline,
+        breaker: CircuitBreaker
+    ) -> T:
+        """Run attempt(timeout) until it succeeds, retries run out or the deadline would be missed"""
+        retry = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpen("LLM circuit breaker is open")
+            timeout = deadline.remaining()
+            if timeout <= 0:
+                self.deadline_exceeded += 1
+                raise DeadlineExceeded("request deadline passed before the LLM call")
+            self.attempts += 1
+            try:
+                result = await asyncio.wait_for(attempt(timeout), timeout)
+            except asyncio.CancelledError:
+                # The caller went away (e.g. a stream client disconnected) mid-attempt
+                breaker.record_abandoned()
+                raise
+            except Exception as exc:
+                if isinstance(exc, openai.APIStatusError) and not is_retryable(exc):
+                    # The provider answered; the request itself was refused
+                    breaker.record_success()
+                    self.failures += 1
+                    raise
+                breaker.record_failure()
+                delay = self.backoff(retry)
+                if (
+                    not is_retryable(exc)
+                    or retry >= self.max_retries
+                    or deadline.remaining() - delay < self.min_attempt_seconds
+                ):
+                    self.failures += 1
+                    if isinstance(exc, (asyncio.TimeoutError, openai.APITimeoutError)) and deadline.expired:
+                        self.deadline_exceeded += 1
+                        raise DeadlineExceeded("request deadline passed during the LLM call") from exc
+                    raise
+                retry += 1
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            breaker.record_success()
+            return result
+
+    def stats(self) -> Dict[str, int]:
+        """Attempt, retry and failure counters"""
+        return {
+            "attempts": self.attempts,
+            "retries": self.retries,
+            "failures": self.failures,
+            "deadline_exceeded": self.deadline_exceeded
+        }
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_retry_policy: Optional[RetryPolicy] = None
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide LLM circuit breaker"""
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        settings = get_settings()
+        _circuit_breaker = CircuitBreaker(settings.LLM_BREAKER_FAILURE_THRESHOLD, settings.LLM_BREAKER_RESET_SECONDS)
+    return _circuit_breaker
+
+
+def get_retry_policy() -> RetryPolicy:
+    """Get the process-wide LLM retry policy"""
+    global _retry_policy
+    if _retry_policy is None:
+        settings = get_settings()
+        _retry_policy = RetryPolicy(
+            settings.LLM_MAX_RETRIES,
+            settings.LLM_RETRY_BASE_DELAY,
+            settings.LLM_RETRY_MAX_DELAY,
+            settings.LLM_MIN_ATTEMPT_SECONDS
+        )
+    return _retry_policy
@@ -0,0 +1,94 @@
+"""
+LingoKa Response Payloads
+Fast JSON encoding for hot endpoints and pre-serialized static bodies.
+
+Responses can opt out of FastAPI's jsonable_encoder + stdlib json path:
+FastJSONResponse encodes plain content with orjson (stdlib json when it is
+not installed), and model_response dumps a Pydantic model straight to
+bytes through a TypeAdapter built once at import.
+
+Content that only changes with the language module's content version (or
+never) is encoded to bytes once and served as-is. Each body carries a
+strong ETag derived from its bytes, so clients revalidating with
+If-None-Match get an empty 304 instead of the full document.
+"""
+import hashlib
+import json
+from typing import Any, NamedTuple, Optional
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from ..models.message import ChatResponse
+from ..models.user import UserProfile
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Built once: constructing a TypeAdapter compiles the model's serializer
+CHAT_RESPONSE_ADAPTER = TypeAdapter(ChatResponse)
+USER_PROFILE_ADAPTER = TypeAdapter(UserProfile)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode JSON-compatible content to compact UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(adapter: TypeAdapter, value: Any, status_code: int = 200) -> Response:
+    """Serialize a model through its prebuilt TypeAdapter, skipping jsonable_encoder"""
+    return Response(content=adapter.dump_json(value), status_code=status_code, media_type="application/json")
+
+
+# Static content may be reused by browsers and proxies but must be revalidated
+STATIC_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+
+
+class StaticPayload(NamedTuple):
+    """A serialized JSON body and its strong ETag"""
+    body: bytes
+    etag: str
+
+
+def make_payload(content: Any) -> StaticPayload:
+    """Serialize JSON-compatible content once"""
+    body = dumps(content)
+    return StaticPayload(body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison, per RFC 9110)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def payload_response(
+    payload: StaticPayload,
+    if_none_match: Optional[str] = None,
+    cache_control: str = STATIC_CACHE_CONTROL
+) -> Response:
+    """200 with the cached body, or 304 if the client already has it"""
+    headers = {"ETag": payload.etag, "Cache-Control": cache_control}
+    if etag_matches(if_none_match, payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
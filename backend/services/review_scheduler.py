@@ -0,0 +1,452 @@
+"""
+LingoKa Review Scheduler
+SM-2 spaced-repetition scheduling for every user's vocabulary and phrases.
+
+Each user's cards live in one flat array of unsigned 32-bit words, four
+per card (item id, due time, interval in days, packed ease/repetitions/
+lapses), so a card costs 16 bytes plus its slot in the user's item index.
+Item keys are interned to small integers shared by all users.
+
+Due cards are answered from a per-user min-heap keyed on due time, built on
+first use. Rescheduling a card pushes a fresh heap entry instead of
+searching for the old one; stale entries are recognised by their due time
+no longer matching the card and dropped as they surface, and the heap is
+rebuilt once they outnumber live cards. Fetching the next k due cards is
+therefore O(k log n) regardless of deck size.
+
+With a write-behind writer attached, decks are persisted after each batch
+of reviews and reloaded on demand, so only recently active users are kept
+in memory. When several workers share one DocumentStore, the shared
+scheduler instead revalidates its cached deck on every request and writes
+with compare-and-set, re-applying a batch on top of another worker's write.
+"""
+import base64
+import heapq
+import time
+from array import array
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+from ..config.settings import get_settings
+from .session_locks import SessionLocks
+from .session_store import BoundedStore, SharedSessionStore, get_session_store
+from .storage import Document, DocumentStore, WriteBehindWriter
+
+T = TypeVar("T")
+
+# SM-2 constants
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_GRADE = 3
+MAX_GRADE = 5
+FIRST_INTERVAL_DAYS = 1
+SECOND_INTERVAL_DAYS = 6
+MAX_INTERVAL_DAYS = 3650
+
+DAY_SECONDS = 86400
+
+# Due times are stored as u32 epoch seconds
+_MAX_DUE = 0xFFFFFFFF
+
+# Card layout: four u32 words per card
+_ITEM, _DUE, _INTERVAL, _META = range(4)
+_STRIDE = 4
+
+# Heap entries pack (due, slot) into one int so heapq compares plain ints
+_SLOT_BITS = 24
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+
+
+def _pack_meta(ease: float, repetitions: int, lapses: int) -> int:
+    """Ease in hundredths (16 bits), repetitions and lapses (8 bits each, saturating)"""
+    return (round(ease * 100) << 16) | (min(repetitions, 255) << 8) | min(lapses, 255)
+
+
+def _unpack_meta(meta: int) -> Tuple[float, int, int]:
+    return (meta >> 16) / 100, (meta >> 8) & 0xFF, meta & 0xFF
+
+
+class ReviewState(NamedTuple):
+    """Scheduling state of one card"""
+    item: str
+    due: int
+    interval_days: int
+    ease: float
+    repetitions: int
+    lapses: int
+
+
+class ItemCatalog:
+    """Interns item keys to dense integer ids shared by every deck"""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._keys: List[str] = []
+
+    def intern(self, key: str) -> int:
+        item_id = self._ids.get(key)
+        if item_id is None:
+            item_id = self._ids[key] = len(self._keys)
+            self._keys.append(key)
+        return item_id
+
+    def id_of(self, key: str) -> Optional[int]:
+        return self._ids.get(key)
+
+    def key(self, item_id: int) -> str:
+        return self._keys[item_id]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class ReviewDeck:
+    """One user's cards with a lazily built due-time heap"""
+
+    __slots__ = ("_cards", "_slots", "_heap", "_strongest")
+
+    def __init__(self):
+        self._cards = array("I")
+        self._slots: Dict[int, int] = {}
+        self._heap: Optional[List[int]] = None
+        # (limit, slots) of the last strength ranking, until a review changes it
+        self._strongest: Optional[Tuple[int, List[int]]] = None
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, item_id: int) -> bool:
+        return item_id in self._slots
+
+    def add(self, item_id: int, due: int) -> bool:
+        """Add a new card due at `due`; existing cards are left alone"""
+        if item_id in self._slots:
+            return False
+        slot = len(self._slots)
+        if slot > _SLOT_MASK:
+            raise ValueError("Review deck is full")
+        self._slots[item_id] = slot
+        self._cards.extend((item_id, due, 0, _pack_meta(INITIAL_EASE, 0, 0)))
+        self._push(slot, due)
+        return True
+
+    def review(self, item_id: int, grade: int, now: int) -> int:
+        """Apply one SM-2 review to a card (adding it first if new) and return its slot"""
+        if item_id not in self._slots:
+            self.add(item_id, now)
+        slot = self._slots[item_id]
+        base = slot * _STRIDE
+        cards = self._cards
+        ease, repetitions, lapses = _unpack_meta(cards[base + _META])
+        interval = cards[base + _INTERVAL]
+
+        if grade < PASSING_GRADE:
+            repetitions = 0
+            lapses += 1
+            interval = FIRST_INTERVAL_DAYS
+        else:
+            repetitions += 1
+            if repetitions == 1:
+                interval = FIRST_INTERVAL_DAYS
+            elif repetitions == 2:
+                interval = SECOND_INTERVAL_DAYS
+            else:
+                interval = min(MAX_INTERVAL_DAYS, round(interval * ease))
+        miss = MAX_GRADE - grade
+        ease = max(MIN_EASE, ease + 0.1 - miss * (0.08 + miss * 0.02))
+
+        due = min(now + interval * DAY_SECONDS, _MAX_DUE)
+        cards[base + _DUE] = due
+        cards[base + _INTERVAL] = interval
+        cards[base + _META] = _pack_meta(ease, repetitions, lapses)
+        self._push(slot, due)
+        self._strongest = None
+        return slot
+
+    def state(self, slot: int) -> Tuple[int, int, int, float, int, int]:
+        """(item id, due, interval, ease, repetitions, lapses) of a slot"""
+        base = slot * _STRIDE
+        item_id, due, interval, meta = self._cards[base:base + _STRIDE]
+        return (item_id, due, interval) + _unpack_meta(meta)
+
+    # Due queue
+
+    def _push(self, slot: int, due: int) -> None:
+        heap = self._heap
+        if heap is None:
+            return
+        heapq.heappush(heap, (due << _SLOT_BITS) | slot)
+        # Rescheduling leaves the old entry behind; compact once they dominate
+        if len(heap) > 2 * len(self._slots) + 64:
+            self._heap = None
+
+    def _build_heap(self) -> List[int]:
+        cards = self._cards
+        heap = [(cards[slot * _STRIDE + _DUE] << _SLOT_BITS) | slot for slot in range(len(self._slots))]
+        heapq.heapify(heap)
+        self._heap = heap
+        return heap
+
+    def due(self, now: int, limit: int) -> List[int]:
+        """Slots of up to `limit` cards due at or before `now`, most overdue first"""
+        heap = self._heap if self._heap is not None else self._build_heap()
+        cards = self._cards
+        found: Dict[int, int] = {}
+        while heap and len(found) < limit:
+            entry = heap[0]
+            due = entry >> _SLOT_BITS
+            if due > now:
+                break
+            heapq.heappop(heap)
+            slot = entry & _SLOT_MASK
+            # Stale, or a duplicate of a card rescheduled to the same time
+            if cards[slot * _STRIDE + _DUE] == due and slot not in found:
+                found[slot] = entry
+        # Live entries go back: reading the queue does not consume it
+        for entry in found.values():
+            heapq.heappush(heap, entry)
+        return list(found)
+
+    def count_due(self, now: int) -> int:
+        """Number of cards due at or before `now`"""
+        cards = self._cards
+        return sum(1 for due in cards[_DUE::_STRIDE] if due <= now)
+
+    def slots_by_strength(self, limit: int) -> List[int]:
+        """Slots of up to `limit` learned cards, longest interval first (kept until the next review)"""
+        cached = self._strongest
+        if cached is not None and cached[0] >= limit:
+            return cached[1][:limit]
+        intervals = self._cards[_INTERVAL::_STRIDE]
+        repetitions = [(meta >> 8) & 0xFF for meta in self._cards[_META::_STRIDE]]
+        learned = (slot for slot, count in enumerate(repetitions) if count)
+        strongest = heapq.nlargest(limit, learned, key=intervals.__getitem__)
+        self._strongest = (limit, strongest)
+        return strongest
+
+    # Persistence
+
+    def to_document(self, catalog: ItemCatalog) -> Document:
+        cards = self._cards
+        state = array("I")
+        for slot in range(len(self._slots)):
+            base = slot * _STRIDE
+            state.extend(cards[base + 1:base + _STRIDE])
+        return {
+            "items": [catalog.key(item_id) for item_id in cards[_ITEM::_STRIDE]],
+            "cards": base64.b64encode(state.tobytes()).decode("ascii")
+        }
+
+    @classmethod
+    def from_document(cls, doc: Document, catalog: ItemCatalog) -> "ReviewDeck":
+        state = array("I")
+        state.frombytes(base64.b64decode(doc["cards"]))
+        deck = cls()
+        for slot, key in enumerate(doc["items"]):
+            item_id = catalog.intern(key)
+            deck._slots[item_id] = slot
+            deck._cards.append(item_id)
+            deck._cards.extend(state[slot * 3:slot * 3 + 3])
+        return deck
+
+
+class ReviewScheduler:
+    """Spaced-repetition decks for every user, kept in memory and written behind"""
+
+    def __init__(
+        self,
+        max_decks: int = 100000,
+        writer: Optional[WriteBehindWriter] = None,
+        collection: str = "progress"
+    ):
+        self.writer = writer
+        self.collection = collection
+        self.catalog = ItemCatalog()
+        self._decks: BoundedStore[ReviewDeck] = BoundedStore(max_decks)
+        self.reviews_recorded = 0
+
+    async def _deck(self, user_id: str, create: bool = False) -> Optional[ReviewDeck]:
+        """Get a user's deck from memory, falling back to persistent storage"""
+        deck = self._decks.get(user_id)
+        if deck is None:
+            doc = None
+            if self.writer is not None:
+                producer = self.writer.pending(self.collection, user_id)
+                doc = producer() if producer is not None else await self.writer.store.get_document(self.collection, user_id)
+            if doc is not None:
+                deck = ReviewDeck.from_document(doc, self.catalog)
+            elif create:
+                deck = ReviewDeck()
+            else:
+                return None
+            self._decks.set(user_id, deck)
+        return deck
+
+    def _enqueue(self, user_id: str, deck: ReviewDeck) -> None:
+        """Queue a deck for persistence"""
+        if self.writer is not None:
+            self.writer.enqueue(self.collection, user_id, lambda: deck.to_document(self.catalog))
+
+    async def _update(self, user_id: str, change: Callable[[ReviewDeck], T]) -> Tuple[ReviewDeck, T]:
+        """Apply a change to a user's deck, persisting it if the change reports doing anything"""
+        deck = await self._deck(user_id, create=True)
+        result = change(deck)
+        if result:
+            self._enqueue(user_id, deck)
+        return deck, result
+
+    def _state(self, deck: ReviewDeck, slot: int) -> ReviewState:
+        item_id, due, interval, ease, repetitions, lapses = deck.state(slot)
+        return ReviewState(self.catalog.key(item_id), due, interval, ease, repetitions, lapses)
+
+    async def add_items(self, user_id: str, items: Iterable[str], now: Optional[int] = None) -> int:
+        """Start learning new items, due immediately; returns how many were new"""
+        due = int(time.time()) if now is None else now
+        keys = list(items)
+        _, added = await self._update(
+            user_id, lambda deck: sum(deck.add(self.catalog.intern(item), due) for item in keys)
+        )
+        return added
+
+    async def record_reviews(
+        self,
+        user_id: str,
+        reviews: Sequence[Tuple[str, int]],
+        now: Optional[int] = None
+    ) -> List[ReviewState]:
+        """Apply a batch of (item, grade 0-5) results, e.g. a finished quiz, and persist once"""
+        for item, grade in reviews:
+            if not 0 <= grade <= MAX_GRADE:
+                raise ValueError(f"Grade for {item!r} must be between 0 and {MAX_GRADE}")
+        now = int(time.time()) if now is None else now
+        deck, slots = await self._update(
+            user_id, lambda deck: [deck.review(self.catalog.intern(item), grade, now) for item, grade in reviews]
+        )
+        self.reviews_recorded += len(slots)
+        return [self._state(deck, slot) for slot in slots]
+
+    async def due(self, user_id: str, limit: int = 20, now: Optional[int] = None) -> List[ReviewState]:
+        """The next `limit` items due for review, most overdue first"""
+        deck = await self._deck(user_id)
+        if deck is None or limit <= 0:
+            return []
+        now = int(time.time()) if now is None else now
+        return [self._state(deck, slot) for slot in deck.due(now, limit)]
+
+    async def count_due(self, user_id: str, now: Optional[int] = None) -> int:
+        """How many items are due for review"""
+        deck = await self._deck(user_id)
+        if deck is None:
+            return 0
+        return deck.count_due(int(time.time()) if now is None else now)
+
+    async def known_items(self, user_id: str, limit: int = 50) -> List[str]:
+        """Items the user has recalled at least once, best retained first"""
+        deck = await self._deck(user_id)
+        if deck is None:
+            return []
+        return [self.catalog.key(deck.state(slot)[0]) for slot in deck.slots_by_strength(limit)]
+
+    def start(self) -> None:
+        """Start the write-behind flusher"""
+        if self.writer is not None:
+            self.writer.start()
+
+    async def stop(self) -> None:
+        """Flush pending deck writes"""
+        if self.writer is not None:
+            await self.writer.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """Deck, card and review counters"""
+        return {
+            "decks": len(self._decks),
+            "cards": sum(len(deck) for deck in self._decks.values()),
+            "items": len(self.catalog),
+            "decks_evicted": self._decks.evicted,
+            "reviews_recorded": self.reviews_recorded
+        }
+
+
+class SharedReviewScheduler(ReviewScheduler):
+    """
+    Review scheduler for several worker processes sharing one DocumentStore.
+
+    Like SharedSessionStore, memory only caches decks: each request
+    revalidates the cached copy against the stored version, and changes are
+    written straight through with compare-and-set. If another worker
+    updated the deck in the meantime, the change is re-applied to the fresh
+    copy and retried, so concurrent reviews are never lost. Within a worker,
+    updates to one deck take turns so they don't conflict with each other.
+    """
+
+    MAX_WRITE_ATTEMPTS = 5
+
+    def __init__(self, store: DocumentStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self._versions: Dict[str, int] = {}
+        self._locks = SessionLocks()
+        self.write_conflicts = 0
+
+    async def _deck(self, user_id: str, create: bool = False) -> Optional[ReviewDeck]:
+        """Get the latest version of a user's deck"""
+        deck = self._decks.get(user_id)
+        cached = self._versions.get(user_id)
+        if deck is not None and cached is not None and cached == await self.store.get_version(self.collection, user_id):
+            return deck
+        doc, version = await self.store.get_versioned(self.collection, user_id)
+        if doc is None:
+            self._decks.pop(user_id)
+            self._versions.pop(user_id, None)
+            # A new deck is only cached once its first write succeeds
+            return ReviewDeck() if create else None
+        self._versions[user_id] = version
+        deck = ReviewDeck.from_document(doc, self.catalog)
+        self._decks.set(user_id, deck)
+        return deck
+
+    async def _update(self, user_id: str, change: Callable[[ReviewDeck], T]) -> Tuple[ReviewDeck, T]:
+        """Apply a change to a user's deck and write it through, re-applying it on top of concurrent writes"""
+        async with self._locks.hold(user_id):
+            deck = await self._deck(user_id, create=True)
+            for _ in range(self.MAX_WRITE_ATTEMPTS):
+                result = change(deck)
+                if not result:
+                    return deck, result
+                version = await self.store.compare_and_set(
+                    self.collection, user_id, deck.to_document(self.catalog), self._versions.get(user_id)
+                )
+                if version is not None:
+                    self._versions[user_id] = version
+                    self._decks.set(user_id, deck)
+                    return deck, result
+
+                self.write_conflicts += 1
+                # The cached copy now holds a change that was never stored
+                self._decks.pop(user_id)
+                deck = await self._deck(user_id, create=True)
+        raise RuntimeError(f"Could not save review deck for {user_id}: too many concurrent writes")
+
+    def stats(self) -> Dict[str, int]:
+        """Deck, card, review and write-conflict counters"""
+        stats = super().stats()
+        stats["write_conflicts"] = self.write_conflicts
+        return stats
+
+
+_review_scheduler: Optional[ReviewScheduler] = None
+
+
+def get_review_scheduler() -> ReviewScheduler:
+    """Get the process-wide review scheduler"""
+    global _review_scheduler
+    if _review_scheduler is None:
+        settings = get_settings()
+        session_store = get_session_store()
+        options = dict(max_decks=settings.REVIEW_MAX_DECKS, collection=settings.FIRESTORE_COLLECTION_PROGRESS)
+        if isinstance(session_store, SharedSessionStore):
+            # Multi-worker mode: decks are written through the shared store like sessions
+            _review_scheduler = SharedReviewScheduler(session_store.store, **options)
+        else:
+            # Share the session store's write-behind queue
+            _review_scheduler = ReviewScheduler(writer=session_store.writer, **options)
+    return _review_scheduler
@@ -0,0 +1,96 @@
+"""
+LingoKa Session Locks
+Per-session async locks that serialize a session's turns.
+
+A chat turn reads a session's history, awaits the agent and then appends
+to the history. Holding the session's lock for the whole turn makes two
+quick messages on one session run one after the other, in arrival order,
+each seeing the turn before it. Locks exist only while a session has a
+turn running or waiting, so different sessions never contend and idle
+sessions cost nothing.
+
+Locks are per process. Across workers (SHARED_STATE) session writes are
+already kept consistent by the store's compare-and-set retries.
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+
+class _KeyLock:
+    """A lock and the number of tasks holding or waiting for it"""
+
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.users = 0
+
+
+class SessionLocks:
+    """Keyed asyncio locks, created on first use and dropped when no task needs them"""
+
+    def __init__(self):
+        self._locks: Dict[str, _KeyLock] = {}
+        self.acquired = 0
+        self.contended = 0
+        self.max_locks = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[float]:
+        """Hold a key's lock for the block; yields the seconds spent waiting for it"""
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = _KeyLock()
+            self.max_locks = max(self.max_locks, len(self._locks))
+        entry.users += 1
+        try:
+            contended = entry.lock.locked()
+            start = time.monotonic()
+            await entry.lock.acquire()
+            try:
+                waited = time.monotonic() - start
+                self._record(contended, waited)
+                yield waited
+            finally:
+                entry.lock.release()
+        finally:
+            entry.users -= 1
+            if not entry.users:
+                del self._locks[key]
+
+    def _record(self, contended: bool, waited: float) -> None:
+        self.acquired += 1
+        if contended:
+            self.contended += 1
+            self._wait_total += waited
+            if waited > self._wait_max:
+                self._wait_max = waited
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def stats(self) -> Dict[str, float]:
+        """Live locks and lock-wait metrics"""
+        return {
+            "locks": len(self._locks),
+            "max_locks": self.max_locks,
+            "acquired": self.acquired,
+            "contended": self.contended,
+            "mean_wait_ms": round(self._wait_total / self.contended * 1e3, 2) if self.contended else 0.0,
+            "max_wait_ms": round(self._wait_max * 1e3, 2)
+        }
+
+
+_session_locks: Optional[SessionLocks] = None
+
+
+def get_session_locks() -> SessionLocks:
+    """Get the process-wide session locks"""
+    global _session_locks
+    if _session_locks is None:
+        _session_locks = SessionLocks()
+    return _session_locks
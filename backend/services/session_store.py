@@ -0,0 +1,455 @@
+"""
+LingoKa Session Store
+Bounded, evicting in-memory storage for sessions, their conversation
+history and user profiles.
+
+Sessions expire after an idle TTL and the least recently used session is
+evicted once the store is full. Each session's history is capped, and a
+background sweeper removes expired sessions so a long-running worker's
+memory stays flat.
+
+With a persistent DocumentStore attached, memory acts as a read-through
+cache: misses are loaded from storage, and changes are queued on a
+write-behind writer instead of being written on the request path.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Generic, Iterator, List, Optional, Tuple, TypeVar
+from ..config.settings import get_settings
+from ..models.message import MessageRole
+from ..models.user import UserProfile, UserSession
+from .conversation_history import ConversationHistory
+from .storage import Document, DocumentStore, SQLiteDocumentStore, WriteBehindWriter
+
+V = TypeVar("V")
+
+# A message to append to history: (role, content, agent, epoch timestamp)
+Turn = Tuple[MessageRole, str, Optional[str], int]
+
+
+class BoundedStore(Generic[V]):
+    """LRU-ordered mapping with an optional idle TTL and a maximum size"""
+
+    def __init__(self, max_entries: int, idle_ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+        self.evicted = 0
+        self.expired = 0
+
+    def get(self, key: str) -> Optional[V]:
+        """Get a live entry and mark it as recently used"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        last_used, value = entry
+        now = time.monotonic()
+        if self.idle_ttl_seconds is not None and now - last_used > self.idle_ttl_seconds:
+            del self._entries[key]
+            self.expired += 1
+            return None
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        """Insert or replace an entry, evicting the least recently used if full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evicted += 1
+
+    def pop(self, key: str) -> Optional[V]:
+        """Remove an entry, returning its value"""
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def values(self) -> Iterator[V]:
+        """Iterate over stored values without touching recency"""
+        return (value for _, value in self._entries.values())
+
+    def sweep(self) -> int:
+        """Remove every entry idle for longer than the TTL"""
+        if self.idle_ttl_seconds is None:
+            return 0
+        cutoff = time.monotonic() - self.idle_ttl_seconds
+        removed = 0
+        # Entries are in recency order, so expired ones are at the front
+        while self._entries:
+            key, (last_used, _) = next(iter(self._entries.items()))
+            if last_used > cutoff:
+                break
+            del self._entries[key]
+            removed += 1
+        self.expired += removed
+        return removed
+
+
+class SessionState:
+    """A session together with its conversation history"""
+
+    __slots__ = ("session", "history")
+
+    def __init__(self, session: UserSession, history: ConversationHistory):
+        self.session = session
+        self.history = history
+
+    def session_view(self) -> UserSession:
+        """Render the session with its conversation history filled in"""
+        return self.session.model_copy(update={"conversation_history": self.history.as_session_history()})
+
+
+def _apply_turn(state: SessionState, agent_name: str, turns: List[Turn]) -> None:
+    state.session.current_agent = agent_name
+    for role, content, agent, timestamp in turns:
+        state.history.append(role, content, agent=agent, timestamp=timestamp)
+
+
+def _end_session(state: SessionState) -> None:
+    state.session.is_active = False
+    state.session.ended_at = datetime.utcnow()
+
+
+class SessionStore:
+    """
+    Session and profile storage with bounded memory.
+
+    - Sessions: idle TTL, max-sessions cap with LRU eviction
+    - History: ring buffer of max_history messages per session
+    - Profiles: max-profiles cap with LRU eviction
+    """
+
+    def __init__(
+        self,
+        max_sessions: int,
+        idle_ttl_seconds: float,
+        max_history: int,
+        max_profiles: int,
+        hot_history: int = 20,
+        compress_min_chars: Optional[int] = 256,
+        writer: Optional[WriteBehindWriter] = None,
+        sessions_collection: str = "sessions",
+        users_collection: str = "users"
+    ):
+        self.max_history = max_history
+        self.hot_history = hot_history
+        self.compress_min_chars = compress_min_chars
+        self.writer = writer
+        self.sessions_collection = sessions_collection
+        self.users_collection = users_collection
+        self._sessions: BoundedStore[SessionState] = BoundedStore(max_sessions, idle_ttl_seconds)
+        self._profiles: BoundedStore[UserProfile] = BoundedStore(max_profiles)
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def _load(self, collection: str, doc_id: str) -> Optional[Document]:
+        """Read a document through the write-behind queue, then storage"""
+        if self.writer is None:
+            return None
+        producer = self.writer.pending(collection, doc_id)
+        if producer is not None:
+            return producer()
+        return await self.writer.store.get_document(collection, doc_id)
+
+    # Sessions
+
+    def _new_history(self) -> ConversationHistory:
+        return ConversationHistory(self.max_history, self.hot_history, self.compress_min_chars)
+
+    async def get(self, session_id: str) -> Optional[SessionState]:
+        """Get a session from memory, falling back to persistent storage"""
+        state = self._sessions.get(session_id)
+        if state is None:
+            doc = await self._load(self.sessions_collection, session_id)
+            # A concurrent request may have loaded or created the session meanwhile; keep its live state
+            state = self._sessions.get(session_id)
+            if state is None and doc is not None:
+                state = self._state_from_document(doc, self._new_history())
+                self._sessions.set(session_id, state)
+        return state
+
+    async def get_or_create(self, session_id: str, user_id: Optional[str] = None) -> SessionState:
+        """Get a session, creating it if needed"""
+        state = await self.get(session_id)
+        if state is None:
+            state = await self.create(session_id, user_id)
+        return state
+
+    def _new_state(self, session_id: str, user_id: Optional[str]) -> SessionState:
+        return SessionState(
+            UserSession(
+                session_id=session_id,
+                user_id=user_id,
+                current_agent="director"
+            ),
+            self._new_history()
+        )
+
+    @staticmethod
+    def _state_from_document(doc: Document, history: ConversationHistory) -> SessionState:
+        history.extend_rows(doc["history"])
+        return SessionState(UserSession(**doc["session"]), history)
+
+    @staticmethod
+    def _session_document(state: SessionState) -> Document:
+        return {
+            "session": state.session.model_dump(mode="json", exclude={"conversation_history"}),
+            "history": state.history.to_rows()
+        }
+
+    async def create(self, session_id: str, user_id: Optional[str] = None) -> SessionState:
+        """Create a brand-new session"""
+        state = self._new_state(session_id, user_id)
+        self._sessions.set(session_id, state)
+        self._enqueue(state)
+        return state
+
+    def _enqueue(self, state: SessionState) -> None:
+        """Queue a session for persistence"""
+        if self.writer is not None:
+            self.writer.enqueue(self.sessions_collection, state.session.session_id, lambda: self._session_document(state))
+
+    async def record_turn(self, state: SessionState, agent_name: str, turns: List[Turn]) -> SessionState:
+        """Append a completed turn's messages to a session and persist it"""
+        _apply_turn(state, agent_name, turns)
+        self._enqueue(state)
+        return state
+
+    async def end(self, session_id: str) -> Optional[SessionState]:
+        """Mark a session as ended and free it from memory, persisting its final state"""
+        state = await self.get(session_id)
+        if state is not None:
+            _end_session(state)
+            self._sessions.pop(session_id)
+            self._enqueue(state)
+        return state
+
+    def sweep(self) -> int:
+        """Remove expired sessions"""
+        return self._sessions.sweep()
+
+    # Profiles
+
+    async def get_profile(self, user_id: Optional[str]) -> Optional[UserProfile]:
+        """Get a user profile from memory, falling back to persistent storage"""
+        if user_id is None:
+            return None
+        profile = self._profiles.get(user_id)
+        if profile is None:
+            doc = await self._load(self.users_collection, user_id)
+            profile = self._profiles.get(user_id)
+            if profile is None and doc is not None:
+                profile = UserProfile(**doc)
+                self._profiles.set(user_id, profile)
+        return profile
+
+    async def set_profile(self, profile: UserProfile) -> None:
+        """Store a user profile"""
+        self._profiles.set(profile.user_id, profile)
+        if self.writer is not None:
+            self.writer.enqueue(self.users_collection, profile.user_id, lambda: profile.model_dump(mode="json"))
+
+    # Background tasks
+
+    def start(self, sweep_interval_seconds: float) -> None:
+        """Start the expiry sweeper and the write-behind flusher"""
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_forever(sweep_interval_seconds))
+        if self.writer is not None:
+            self.writer.start()
+
+    async def stop(self) -> None:
+        """Stop background tasks, flushing pending writes"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+        if self.writer is not None:
+            await self.writer.stop()
+
+    async def _sweep_forever(self, interval_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            self.sweep()
+
+    # Metrics
+
+    def stats(self) -> Dict[str, int]:
+        """Store size and eviction counters"""
+        stats = {
+            "sessions": len(self._sessions),
+            "history_messages": sum(len(state.history) for state in self._sessions.values()),
+            "sessions_evicted": self._sessions.evicted,
+            "sessions_expired": self._sessions.expired,
+            "profiles": len(self._profiles),
+            "profiles_evicted": self._profiles.evicted
+        }
+        if self.writer is not None:
+            stats["write_behind"] = self.writer.stats()
+        return stats
+
+
+class SharedSessionStore(SessionStore):
+    """
+    Session store for running several worker processes against one
+    DocumentStore.
+
+    Memory only caches documents: every read revalidates the cached copy
+    against the stored version, so whichever worker receives a session's
+    next message sees its latest state. Writes go straight to storage with
+    compare-and-set; if another worker updated the session in the meantime,
+    the turn is re-applied to the fresh copy and retried.
+    """
+
+    MAX_WRITE_ATTEMPTS = 5
+
+    def __init__(self, store: DocumentStore, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self._versions: Dict[Tuple[str, str], int] = {}
+        self.write_conflicts = 0
+
+    async def _load_versioned(self, collection: str, doc_id: str) -> Tuple[Optional[Document], Optional[int]]:
+        doc, version = await self.store.get_versioned(collection, doc_id)
+        if version is None:
+            self._versions.pop((collection, doc_id), None)
+        else:
+            self._versions[(collection, doc_id)] = version
+        return doc, version
+
+    async def _is_current(self, collection: str, doc_id: str) -> bool:
+        """Check whether the cached copy of a document is still the stored version"""
+        cached = self._versions.get((collection, doc_id))
+        return cached is not None and cached == await self.store.get_version(collection, doc_id)
+
+    async def get(self, session_id: str) -> Optional[SessionState]:
+        """Get the latest state of a session"""
+        state = self._sessions.get(session_id)
+        if state is not None and await self._is_current(self.sessions_collection, session_id):
+            return state
+        doc, _ = await self._load_versioned(self.sessions_collection, session_id)
+        if doc is None:
+            self._sessions.pop(session_id)
+            return None
+        state = self._state_from_document(doc, self._new_history())
+        self._sessions.set(session_id, state)
+        return state
+
+    async def create(self, session_id: str, user_id: Optional[str] = None) -> SessionState:
+        """Create a brand-new session, or return the one another worker just created"""
+        state = self._new_state(session_id, user_id)
+        version = await self.store.compare_and_set(
+            self.sessions_collection, session_id, self._session_document(state), None
+        )
+        if version is None:
+            return await self.get(session_id)
+        self._versions[(self.sessions_collection, session_id)] = version
+        self._sessions.set(session_id, state)
+        return state
+
+    async def _write(self, state: SessionState, apply: Callable[[SessionState], None]) -> SessionState:
+        """Write an updated session, re-applying the change on top of concurrent writes"""
+        session_id = state.session.session_id
+        key = (self.sessions_collection, session_id)
+        for _ in range(self.MAX_WRITE_ATTEMPTS):
+            version = await self.store.compare_and_set(
+                self.sessions_collection, session_id, self._session_document(state), self._versions.get(key)
+            )
+            if version is not None:
+                self._versions[key] = version
+                self._sessions.set(session_id, state)
+                return state
+
+            self.write_conflicts += 1
+            doc, _ = await self._load_versioned(self.sessions_collection, session_id)
+            fresh = self._state_from_document(doc, self._new_history()) if doc else self._new_state(session_id, state.session.user_id)
+            apply(fresh)
+            state = fresh
+        raise RuntimeError(f"Could not save session {session_id}: too many concurrent writes")
+
+    async def record_turn(self, state: SessionState, agent_name: str, turns: List[Turn]) -> SessionState:
+        """Append a completed turn's messages to a session and write it through"""
+        _apply_turn(state, agent_name, turns)
+        return await self._write(state, lambda fresh: _apply_turn(fresh, agent_name, turns))
+
+    async def end(self, session_id: str) -> Optional[SessionState]:
+        """Mark a session as ended and free it from memory"""
+        state = await self.get(session_id)
+        if state is not None:
+            _end_session(state)
+            state = await self._write(state, _end_session)
+            self._sessions.pop(session_id)
+            self._versions.pop((self.sessions_collection, session_id), None)
+        return state
+
+    async def get_profile(self, user_id: Optional[str]) -> Optional[UserProfile]:
+        """Get the latest version of a user profile"""
+        if user_id is None:
+            return None
+        profile = self._profiles.get(user_id)
+        if profile is not None and await self._is_current(self.users_collection, user_id):
+            return profile
+        doc, _ = await self._load_versioned(self.users_collection, user_id)
+        if doc is None:
+            self._profiles.pop(user_id)
+            return None
+        profile = UserProfile(**doc)
+        self._profiles.set(user_id, profile)
+        return profile
+
+    async def set_profile(self, profile: UserProfile) -> None:
+        """Write a user profile through to storage"""
+        await self.store.commit([(self.users_collection, profile.user_id, profile.model_dump(mode="json"))])
+        # Force a revalidating read next time rather than guessing the new version
+        self._versions.pop((self.users_collection, profile.user_id), None)
+        self._profiles.set(profile.user_id, profile)
+
+    def stats(self) -> Dict[str, int]:
+        """Store size, eviction and write-conflict counters"""
+        stats = super().stats()
+        stats["write_conflicts"] = self.write_conflicts
+        return stats
+
+
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Get the process-wide session store"""
+    global _session_store
+    if _session_store is None:
+        settings = get_settings()
+        options = dict(
+            max_sessions=settings.SESSION_MAX_ACTIVE,
+            idle_ttl_seconds=settings.SESSION_IDLE_TTL_SECONDS,
+            max_history=settings.SESSION_MAX_HISTORY_MESSAGES,
+            max_profiles=settings.MAX_USER_PROFILES,
+            hot_history=settings.SESSION_HISTORY_HOT_MESSAGES,
+            compress_min_chars=settings.SESSION_HISTORY_COMPRESS_MIN_CHARS,
+            sessions_collection=settings.FIRESTORE_COLLECTION_SESSIONS,
+            users_collection=settings.FIRESTORE_COLLECTION_USERS
+        )
+        if settings.SHARED_STATE:
+            # Multi-worker mode: every worker reads and writes through the shared file
+            _session_store = SharedSessionStore(SQLiteDocumentStore(settings.data_path(settings.STORAGE_SQLITE_PATH)), **options)
+        else:
+            writer = None
+            if settings.STORAGE_BACKEND == "sqlite":
+                writer = WriteBehindWriter(
+                    SQLiteDocumentStore(settings.data_path(settings.STORAGE_SQLITE_PATH)),
+                    flush_interval=settings.STORAGE_FLUSH_INTERVAL_SECONDS,
+                    max_batch_size=settings.STORAGE_MAX_BATCH_SIZE
+                )
+            _session_store = SessionStore(writer=writer, **options)
+    return _session_store
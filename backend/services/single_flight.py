@@ -0,0 +1,72 @@
+"""
+LingoKa Single-Flight
+Coalesces concurrent identical LLM calls into one upstream request.
+
+When many learners send the same prompt at once (a class typing the same
+exercise), only the first caller's request goes upstream; everyone who
+arrives while it is in flight awaits the same result. Unlike the
+completion cache this works before the first response has landed, and it
+keeps nothing once the call finishes.
+"""
+import asyncio
+import hashlib
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from ..config.settings import get_settings
+
+T = TypeVar("T")
+
+
+def prompt_fingerprint(model: str, messages: List[Dict[str, str]], **params) -> str:
+    """Identity of an upstream completion: model, sampling parameters and the exact messages"""
+    digest = hashlib.sha256(model.encode())
+    for name in sorted(params):
+        digest.update(f"\x1d{name}={params[name]}".encode())
+    for message in messages:
+        digest.update(f"\x1e{message['role']}\x1f{message['content']}".encode())
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key"""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """Run call, or join the identical one already in flight; returns (result, coalesced)"""
+        task = self._calls.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self.coalesced += 1
+        else:
+            self.leaders += 1
+            # A separate task, so one caller going away doesn't cancel it for the rest
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task), coalesced
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so abandoned failures aren't logged as unhandled
+
+    def stats(self) -> Dict[str, int]:
+        """In-flight calls and coalescing counters"""
+        return {"in_flight": len(self._calls), "leaders": self.leaders, "coalesced": self.coalesced}
+
+
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Get the process-wide single-flight group, or None when coalescing is disabled"""
+    global _single_flight
+    if not get_settings().LLM_COALESCE_IDENTICAL:
+        return None
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
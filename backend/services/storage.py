@@ -0,0 +1,353 @@
+"""
+LingoKa Persistent Storage
+Firestore-shaped document storage with a local SQLite implementation.
+
+Documents live in named collections and are addressed by id, mirroring the
+Firestore client (collection(...).document(...).get()/set()/delete()), so
+the SQLite stand-in can be swapped for Firestore in production. Writes from
+the request path go through a write-behind queue that coalesces repeated
+writes to the same document and flushes them in batched transactions off
+the request path.
+
+Every document carries a version number that increases on each write.
+Versions back the shared-state mode used when several worker processes
+serve the same sessions: a worker revalidates its cached copy with a cheap
+version read and writes with compare-and-set.
+"""
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Document = Dict[str, Any]
+DocumentKey = Tuple[str, str]  # (collection, document id)
+DocumentProducer = Callable[[], Optional[Document]]
+
+
+class DocumentStore:
+    """Storage interface shaped after the Firestore client"""
+
+    def collection(self, name: str) -> "CollectionReference":
+        return CollectionReference(self, name)
+
+    async def get_document(self, collection: str, doc_id: str) -> Optional[Document]:
+        """Read a single document"""
+        raise NotImplementedError
+
+    async def commit(self, writes: List[Tuple[str, str, Optional[Document]]]) -> None:
+        """Apply a batch of writes in one transaction; a None document is a delete"""
+        raise NotImplementedError
+
+    async def get_version(self, collection: str, doc_id: str) -> Optional[int]:
+        """Read a document's version, or None if it does not exist"""
+        raise NotImplementedError
+
+    async def get_versioned(self, collection: str, doc_id: str) -> Tuple[Optional[Document], Optional[int]]:
+        """Read a document together with its version"""
+        raise NotImplementedError
+
+    async def compare_and_set(
+        self,
+        collection: str,
+        doc_id: str,
+        data: Document,
+        expected_version: Optional[int]
+    ) -> Optional[int]:
+        """
+        Write a document only if its version still matches expected_version
+        (None means "must not exist yet"). Returns the new version, or None
+        if another writer got there first.
+        """
+        raise NotImplementedError
+
+    async def compare_and_delete(self, collection: str, doc_id: str, expected_version: int) -> bool:
+        """Delete a document only if its version still matches; False if it changed or is gone"""
+        raise NotImplementedError
+
+    async def delete_older_than(self, collection: str, cutoff: float) -> int:
+        """Delete every document in a collection last written before the epoch time cutoff"""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release any resources held by the store"""
+
+
+class CollectionReference:
+    """A named collection of documents"""
+
+    def __init__(self, store: DocumentStore, name: str):
+        self.store = store
+        self.name = name
+
+    def document(self, doc_id: str) -> "DocumentReference":
+        return DocumentReference(self.store, self.name, doc_id)
+
+
+class DocumentReference:
+    """A single document within a collection"""
+
+    def __init__(self, store: DocumentStore, collection: str, doc_id: str):
+        self.store = store
+        self.collection = collection
+        self.id = doc_id
+
+    async def get(self) -> Optional[Document]:
+        return await self.store.get_document(self.collection, self.id)
+
+    async def set(self, data: Document) -> None:
+        await self.store.commit([(self.collection, self.id, data)])
+
+    async def delete(self) -> None:
+        await self.store.commit([(self.collection, self.id, None)])
+
+
+class SQLiteDocumentStore(DocumentStore):
+    """Local SQLite document store in WAL mode (stand-in for Firestore)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Opened on first use, so building the store (e.g. importing the app) touches no files
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """The open connection; callers hold self._lock"""
+        if self._connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Several worker processes may share the file
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " collection TEXT NOT NULL,"
+                " doc_id TEXT NOT NULL,"
+                " data TEXT NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " version INTEGER NOT NULL DEFAULT 1,"
+                " PRIMARY KEY (collection, doc_id))"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(documents)")}
+            if "version" not in columns:
+                conn.execute("ALTER TABLE documents ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+            self._connection = conn
+        return self._connection
+
+    def _get(self, collection: str, doc_id: str) -> Optional[Document]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM documents WHERE collection = ? AND doc_id = ?",
+                (collection, doc_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _get_version(self, collection: str, doc_id: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version FROM documents WHERE collection = ? AND doc_id = ?",
+                (collection, doc_id)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _get_versioned(self, collection: str, doc_id: str) -> Tuple[Optional[Document], Optional[int]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, version FROM documents WHERE collection = ? AND doc_id = ?",
+                (collection, doc_id)
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else (None, None)
+
+    def _compare_and_set(
+        self,
+        collection: str,
+        doc_id: str,
+        data: Document,
+        expected_version: Optional[int]
+    ) -> Optional[int]:
+        payload = json.dumps(data)
+        with self._lock:
+            if expected_version is None:
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO documents (collection, doc_id, data, updated_at, version) VALUES (?, ?, ?, ?, 1)",
+                    (collection, doc_id, payload, time.time())
+                )
+                return 1 if cursor.rowcount == 1 else None
+            cursor = self._conn.execute(
+                "UPDATE documents SET data = ?, updated_at = ?, version = version + 1"
+                " WHERE collection = ? AND doc_id = ? AND version = ?",
+                (payload, time.time(), collection, doc_id, expected_version)
+            )
+            return expected_version + 1 if cursor.rowcount == 1 else None
+
+    def _compare_and_delete(self, collection: str, doc_id: str, expected_version: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM documents WHERE collection = ? AND doc_id = ? AND version = ?",
+                (collection, doc_id, expected_version)
+            )
+            return cursor.rowcount == 1
+
+    def _delete_older_than(self, collection: str, cutoff: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM documents WHERE collection = ? AND updated_at < ?",
+                (collection, cutoff)
+            )
+            return cursor.rowcount
+
+    def _commit(self, writes: List[Tuple[str, str, Optional[Document]]]) -> None:
+        now = time.time()
+        upserts = [(c, d, json.dumps(data), now) for c, d, data in writes if data is not None]
+        deletes = [(c, d) for c, d, data in writes if data is None]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT INTO documents (collection, doc_id, data, updated_at) VALUES (?, ?, ?, ?)"
+                        " ON CONFLICT (collection, doc_id) DO UPDATE SET"
+                        " data = excluded.data, updated_at = excluded.updated_at, version = version + 1",
+                        upserts
+                    )
+                if deletes:
+                    self._conn.executemany(
+                        "DELETE FROM documents WHERE collection = ? AND doc_id = ?",
+                        deletes
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def get_document(self, collection: str, doc_id: str) -> Optional[Document]:
+        return await asyncio.to_thread(self._get, collection, doc_id)
+
+    async def commit(self, writes: List[Tuple[str, str, Optional[Document]]]) -> None:
+        if writes:
+            await asyncio.to_thread(self._commit, writes)
+
+    async def get_version(self, collection: str, doc_id: str) -> Optional[int]:
+        return await asyncio.to_thread(self._get_version, collection, doc_id)
+
+    async def get_versioned(self, collection: str, doc_id: str) -> Tuple[Optional[Document], Optional[int]]:
+        return await asyncio.to_thread(self._get_versioned, collection, doc_id)
+
+    async def compare_and_set(
+        self,
+        collection: str,
+        doc_id: str,
+        data: Document,
+        expected_version: Optional[int]
+    ) -> Optional[int]:
+        return await asyncio.to_thread(self._compare_and_set, collection, doc_id, data, expected_version)
+
+    async def compare_and_delete(self, collection: str, doc_id: str, expected_version: int) -> bool:
+        return await asyncio.to_thread(self._compare_and_delete, collection, doc_id, expected_version)
+
+    async def delete_older_than(self, collection: str, cutoff: float) -> int:
+        return await asyncio.to_thread(self._delete_older_than, collection, cutoff)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class WriteBehindWriter:
+    """
+    Write-behind queue in front of a DocumentStore.
+
+    Writes are queued as producers that build the document at flush time,
+    so repeated writes to the same document between flushes are coalesced
+    and serialization happens off the request path. A background task
+    flushes every flush_interval seconds, or sooner once max_batch_size
+    documents are pending.
+    """
+
+    def __init__(self, store: DocumentStore, flush_interval: float, max_batch_size: int):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[DocumentKey, DocumentProducer] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.flushed = 0
+        self.batches = 0
+        self.errors = 0
+
+    def enqueue(self, collection: str, doc_id: str, producer: DocumentProducer) -> None:
+        """Queue a write; the producer returns the document (or None to delete)"""
+        key = (collection, doc_id)
+        self._pending.pop(key, None)
+        self._pending[key] = producer
+        if self._wakeup is not None and len(self._pending) >= self.max_batch_size:
+            self._wakeup.set()
+
+    def pending(self, collection: str, doc_id: str) -> Optional[DocumentProducer]:
+        """Get the queued producer for a document, if a write is pending"""
+        return self._pending.get((collection, doc_id))
+
+    async def flush(self) -> None:
+        """Write every pending document in batched transactions"""
+        while self._pending:
+            keys = list(self._pending)[:self.max_batch_size]
+            producers = [self._pending.pop(key) for key in keys]
+            try:
+                writes = [(c, d, producer()) for (c, d), producer in zip(keys, producers)]
+                await self.store.commit(writes)
+            except Exception:
+                # Put the batch back (unless newer writes replaced it) and retry next round
+                self.errors += 1
+                for key, producer in zip(keys, producers):
+                    self._pending.setdefault(key, producer)
+                raise
+            self.flushed += len(writes)
+            self.batches += 1
+
+    def start(self) -> None:
+        """Start the background flusher"""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._flush_forever())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write out everything still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            self._wakeup = None
+        await self.flush()
+
+    async def _flush_forever(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Write-behind flush failed; %d documents left pending", len(self._pending))
+
+    def stats(self) -> Dict[str, int]:
+        """Queue depth and flush counters"""
+        return {
+            "pending": len(self._pending),
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "errors": self.errors
+        }
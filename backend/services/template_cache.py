@@ -0,0 +1,66 @@
+"""
+LingoKa Template Cache
+Memoized renderings of the deterministic teaching responses.
+
+Template handlers (greetings, numbers, pronunciation) produce the same
+markdown and vocabulary for a given topic, level and language, so they are
+rendered once and served from memory. Entries are tagged with the language
+module's content version and the whole cache is dropped when it changes.
+"""
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class RenderedTemplate(NamedTuple):
+    """A pre-rendered teaching response"""
+    message: str
+    vocabulary: List[Dict[str, str]]
+
+
+TemplateKey = Tuple[str, str, str]  # (topic, user_level, language)
+
+
+class TemplateCache:
+    """Cache of rendered templates keyed by (topic, user_level, language)"""
+
+    def __init__(self):
+        self._entries: Dict[TemplateKey, RenderedTemplate] = {}
+        self._content_version: Optional[int] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        key: TemplateKey,
+        content_version: int,
+        render: Callable[[], RenderedTemplate]
+    ) -> RenderedTemplate:
+        """Return the cached rendering for key, rendering it on first use"""
+        if content_version != self._content_version:
+            self._entries.clear()
+            self._content_version = content_version
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = render()
+            self._entries[key] = entry
+        else:
+            self.hits += 1
+        return entry
+
+    def clear(self) -> None:
+        """Drop every cached rendering"""
+        self._entries.clear()
+        self._content_version = None
+
+    def stats(self) -> Dict[str, int]:
+        """Cache size and hit/miss counters"""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_template_cache = TemplateCache()
+
+
+def get_template_cache() -> TemplateCache:
+    """Get the process-wide template cache"""
+    return _template_cache
@@ -0,0 +1,126 @@
+"""
+LingoKa Token Budgeting
+Token counting and budget-based packing of chat history into LLM prompts.
+
+Counts come from tiktoken when it is installed and its encoding can be
+loaded, and fall back to a characters-per-token estimate otherwise.
+History messages carry their token count from the moment they are
+recorded, so packing a prompt walks cached integers instead of
+re-tokenizing the conversation on every turn.
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+from ..config.settings import get_settings
+
+# Per-message framing in the chat format (role, separators) and reply priming
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+# Rough ratio for English/Hiligaynon text when no tokenizer is available
+CHARS_PER_TOKEN = 4
+
+_counter: Optional[Callable[[str], int]] = None
+
+
+def _estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _get_counter() -> Callable[[str], int]:
+    global _counter
+    if _counter is None:
+        try:
+            import tiktoken
+            try:
+                encoding = tiktoken.encoding_for_model(get_settings().DEFAULT_MODEL)
+            except KeyError:
+                encoding = tiktoken.get_encoding("cl100k_base")
+            # Learner text is plain text: "<|endoftext|>" is counted, not rejected
+            _counter = lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception:
+            # Not installed, or the BPE file can't be fetched (e.g. an offline host)
+            _counter = _estimate_tokens
+    return _counter
+
+
+def count_tokens(text: str) -> int:
+    """Count the tokens in a piece of text"""
+    if not text:
+        return 0
+    return _get_counter()(text)
+
+
+@lru_cache(maxsize=64)
+def count_prompt_tokens(text: str) -> int:
+    """Count tokens for a prompt that is sent repeatedly (e.g. a system prompt)"""
+    return count_tokens(text)
+
+
+def message_tokens(message: Any) -> int:
+    """Token count of a history message, using its cached count when it has one"""
+    tokens = getattr(message, "tokens", None)
+    return tokens if tokens is not None else count_tokens(message.content)
+
+
+class PackedPrompt(NamedTuple):
+    """Chat messages ready for the LLM, with their token accounting"""
+    messages: List[Dict[str, str]]
+    prompt_tokens: int
+    history_messages: int
+    history_dropped: int
+
+
+def recent_within_budget(history: Sequence[Any], budget: int) -> int:
+    """Number of most recent history messages whose tokens fit within budget"""
+    fit = getattr(history, "recent_within_budget", None)
+    if fit is not None:
+        return fit(budget, MESSAGE_OVERHEAD_TOKENS)
+
+    used = 0
+    count = 0
+    for message in reversed(history):
+        used += message_tokens(message) + MESSAGE_OVERHEAD_TOKENS
+        if used > budget:
+            break
+        count += 1
+    return count
+
+
+def pack_prompt(
+    system_prompt: str,
+    history: Optional[Sequence[Any]],
+    message: str,
+    budget: Optional[int] = None
+) -> PackedPrompt:
+    """
+    Build chat messages from the system prompt, as much recent history as
+    fits in the prompt token budget, and the user's message. The system
+    prompt and the user's message are always included.
+    """
+    if budget is None:
+        budget = get_settings().PROMPT_TOKEN_BUDGET
+
+    fixed = (
+        count_prompt_tokens(system_prompt) + count_tokens(message)
+        + 2 * MESSAGE_OVERHEAD_TOKENS + REPLY_PRIMING_TOKENS
+    )
+
+    messages = [{"role": "system", "content": system_prompt}]
+    history_tokens = 0
+    kept = 0
+    if history:
+        kept = recent_within_budget(history, max(0, budget - fixed))
+        for msg in (history[-kept:] if kept else []):
+            history_tokens += message_tokens(msg) + MESSAGE_OVERHEAD_TOKENS
+            messages.append({
+                "role": msg.role.value if hasattr(msg.role, 'value') else msg.role,
+                "content": msg.content
+            })
+    messages.append({"role": "user", "content": message})
+
+    return PackedPrompt(
+        messages=messages,
+        prompt_tokens=fixed + history_tokens,
+        history_messages=kept,
+        history_dropped=(len(history) if history else 0) - kept
+    )
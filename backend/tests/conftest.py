@@ -0,0 +1,10 @@
+"""
+LingoKa Test Configuration
+Tests keep sessions in memory and write packs and databases to a scratch
+directory instead of DATA_DIR.
+"""
+import os
+import tempfile
+
+os.environ.setdefault("STORAGE_BACKEND", "memory")
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="lingoka-tests-"))
@@ -0,0 +1,22 @@
+"""
+LingoKa Microbenchmark Suite Tests
+"""
+from backend.benchmarks.suite import BASELINE_PATH, StageResult, compare, load, save
+
+
+def test_committed_baseline_loads():
+    baseline = load(str(BASELINE_PATH))
+    assert "routing.director" in baseline and "search.all" in baseline
+
+
+def test_compare_flags_stages_past_the_threshold(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+    save({"fast": StageResult(10.0, 11.0, 5), "slow": StageResult(10.0, 11.0, 5)}, path)
+    results = {
+        "fast": StageResult(10.5, 11.0, 5),
+        "slow": StageResult(12.0, 13.0, 5),
+        "added": StageResult(1.0, 1.0, 5)
+    }
+    assert compare(results, load(path), threshold=0.1) == ["slow"]
+    output = capsys.readouterr().out
+    assert "REGRESSION" in output and "new" in output
@@ -0,0 +1,47 @@
+"""
+LingoKa Completion Cache Tests
+"""
+import asyncio
+
+from backend.services.completion_cache import SQLiteCompletionCache
+
+
+def test_sqlite_cache_trims_in_batches(tmp_path):
+    cache = SQLiteCompletionCache(str(tmp_path / "completions.db"), max_entries=10, ttl_seconds=60.0, trim_every=5)
+
+    async def run():
+        for i in range(14):
+            await cache.set(f"key-{i}", f"value-{i}")
+        # Under the trim threshold since the last trim: nothing is evicted yet
+        assert len(cache) == 14 and cache.trims == 2
+        await cache.set("key-14", "value-14")
+        return [await cache.get(f"key-{i}") for i in range(15)]
+
+    values = asyncio.run(run())
+    assert len(cache) == 10 and cache.trims == 3
+    assert values[:5] == [None] * 5
+    assert values[5:] == [f"value-{i}" for i in range(5, 15)]
+
+
+def test_sqlite_cache_keeps_its_row_count(tmp_path):
+    path = str(tmp_path / "completions.db")
+    cache = SQLiteCompletionCache(path, max_entries=10, ttl_seconds=60.0)
+
+    def rows() -> int:
+        return cache._conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    async def run():
+        await cache.set("a", "1")
+        await cache.set("a", "2")
+        await cache.set("b", "1")
+        assert len(cache) == rows() == 2
+        assert await cache.get("a") == "2"
+        cache._conn.execute("UPDATE completions SET expires_at = 0 WHERE key = 'b'")
+        assert await cache.get("b") is None
+        assert len(cache) == rows() == 1
+
+    asyncio.run(run())
+    # A reopened cache starts from the rows already on disk
+    assert len(SQLiteCompletionCache(path, max_entries=10, ttl_seconds=60.0)) == 1
+    asyncio.run(cache.clear())
+    assert len(cache) == rows() == 0
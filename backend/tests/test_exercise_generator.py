@@ -0,0 +1,30 @@
+"""
+LingoKa Exercise Generator Tests
+"""
+from backend.languages.exercise_generator import EXERCISE_TYPES
+from backend.languages.grading import answer_key, grade_answer
+from backend.languages.hiligaynon import DifficultyLevel, get_hiligaynon_module
+
+
+def test_seeded_generation_is_repeatable_and_answerable():
+    generator = get_hiligaynon_module().exercise_generator
+    exercises = generator.generate(200, seed=42)
+    assert exercises == generator.generate(200, seed=42)
+    assert {exercise.exercise_type for exercise in exercises} == set(EXERCISE_TYPES)
+
+    for exercise in exercises:
+        assert grade_answer(exercise, exercise.correct_answer).exact
+        if exercise.options:
+            keys = [answer_key(option) for option in exercise.options]
+            # Distractors never repeat the answer or each other
+            assert len(set(keys)) == len(keys)
+            assert keys.count(answer_key(exercise.correct_answer)) == 1
+
+
+def test_filters_restrict_generated_exercises():
+    generator = get_hiligaynon_module().exercise_generator
+    exercises = generator.generate(50, seed=1, difficulty=DifficultyLevel.BEGINNER, exercise_types=["translate"])
+    assert exercises
+    assert all(exercise.exercise_type == "translate" for exercise in exercises)
+    assert all(exercise.difficulty == DifficultyLevel.BEGINNER for exercise in exercises)
+    assert generator.generate(5, exercise_types=["speaking"]) == []
@@ -0,0 +1,47 @@
+"""
+LingoKa Exercise Sessions Tests
+"""
+import asyncio
+
+from backend.languages.hiligaynon import DifficultyLevel, Exercise
+from backend.services.exercise_sessions import SharedExerciseSessionStore
+from backend.services.storage import SQLiteDocumentStore
+
+EXERCISE = Exercise(
+    exercise_type="multiple_choice",
+    question="How do you say 'thank you'?",
+    options=("Salamat", "Paalam"),
+    correct_answer="Salamat",
+    explanation="Salamat means thank you.",
+    difficulty=DifficultyLevel.BEGINNER
+)
+
+
+def test_shared_exercise_graded_by_another_worker_once(tmp_path):
+    path = str(tmp_path / "shared.db")
+
+    async def run():
+        issuer = SharedExerciseSessionStore(SQLiteDocumentStore(path))
+        grader = SharedExerciseSessionStore(SQLiteDocumentStore(path))
+        exercise_id = await issuer.issue(EXERCISE, "user")
+        first = await grader.grade(exercise_id, "salamat")
+        second = await issuer.grade(exercise_id, "salamat")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first is not None and first.result.correct
+    assert first.pending.exercise == EXERCISE
+    assert first.pending.user_id == "user"
+    assert second is None
+
+
+def test_shared_sweep_drops_expired_exercises(tmp_path):
+    async def run():
+        sessions = SharedExerciseSessionStore(SQLiteDocumentStore(str(tmp_path / "shared.db")), ttl_seconds=0.0)
+        exercise_id = await sessions.issue(EXERCISE)
+        await asyncio.sleep(0.01)
+        return await sessions.sweep(), await sessions.get(exercise_id)
+
+    removed, pending = asyncio.run(run())
+    assert removed == 1
+    assert pending is None
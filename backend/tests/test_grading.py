@@ -0,0 +1,44 @@
+"""
+LingoKa Answer Grading Tests
+"""
+import random
+
+from backend.languages.grading import edit_distance, grade_answer
+from backend.languages.hiligaynon import Exercise
+
+
+def _levenshtein(a: str, b: str) -> int:
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (ca != cb))
+    return row[-1]
+
+
+def test_bit_parallel_edit_distance_matches_the_dp_table():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = "".join(rng.choice("abcx") for _ in range(rng.randint(0, 12)))
+        b = "".join(rng.choice("abcx") for _ in range(rng.randint(0, 12)))
+        assert edit_distance(a, b, 20) == _levenshtein(a, b)
+        assert edit_distance(a, b, 1) == min(_levenshtein(a, b), 2)
+
+
+def test_typed_answers_tolerate_formatting_and_small_typos():
+    exercise = Exercise("translate", "Good evening", None, "Maayong gab-i", "", accepted_answers=("Maayong gabii",))
+    assert grade_answer(exercise, "  maayong GABI! ").correct
+    result = grade_answer(exercise, "maayong gabe")
+    assert result.correct and not result.exact and result.matched == "Maayong gab-i"
+    assert not grade_answer(exercise, "maayong aga").correct
+
+
+def test_choice_typos_never_select_another_option():
+    exercise = Exercise("multiple_choice", "Thank you?", ("Salamat", "Salapi", "Palangga"), "Salamat", "")
+    assert grade_answer(exercise, "1").exact
+    assert not grade_answer(exercise, "2").correct
+    assert grade_answer(exercise, "salamqt").correct
+
+    exercise = Exercise("multiple_choice", "Thank you?", ("Salamat", "Salamet"), "Salamat", "")
+    # One typo from both options: not credited
+    assert not grade_answer(exercise, "salamit").correct
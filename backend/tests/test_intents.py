@@ -0,0 +1,23 @@
+"""
+LingoKa Intent Matching Tests
+"""
+from backend.agents.intents import CONVERSATION_INTENTS, DIRECTOR_INTENTS, IntentMatcher
+
+
+def test_keywords_match_whole_words_or_marked_prefixes():
+    matcher = IntentMatcher({
+        "greeting": ["hi", "good morning"],
+        "learning": ["learn*", "how do you say"]
+    })
+    assert matcher.match("Hi there!") == {"greeting"}
+    assert matcher.match("this is hiligaynon") == frozenset()
+    assert matcher.match("I'm learning, good morning") == {"greeting", "learning"}
+    assert matcher.match("How do you say thanks?") == {"learning"}
+    assert matcher.match("how do you") == frozenset()
+
+
+def test_longer_hits_credit_the_keywords_they_contain():
+    assert CONVERSATION_INTENTS.match("give me a practice quiz") == {"exercise"}
+    assert DIRECTOR_INTENTS.match("what is my progress on the lessons") == {"learning", "progress"}
+    # Repeated messages are served from the hit cache with the same answer
+    assert DIRECTOR_INTENTS.match("what is my progress on the lessons") == {"learning", "progress"}
@@ -0,0 +1,24 @@
+"""
+LingoKa Lesson Catalog Tests
+"""
+from fastapi.testclient import TestClient
+
+from backend.main import app
+
+
+def test_lesson_list_revalidates_with_etag():
+    with TestClient(app) as client:
+        response = client.get("/lessons")
+        assert response.status_code == 200
+        lessons = response.json()
+        assert lessons and all(lesson["topic"] for lesson in lessons)
+
+        etag = response.headers["etag"]
+        cached = client.get("/lessons", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+        stale = client.get("/lessons", headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+        assert stale.json() == lessons
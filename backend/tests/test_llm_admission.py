@@ -0,0 +1,123 @@
+"""
+LingoKa LLM Admission and Single-Flight Tests
+"""
+import asyncio
+
+import pytest
+
+from backend.services.llm_admission import AdmissionRejected, LLMAdmission, LLMPriority
+from backend.services.single_flight import SingleFlight
+
+
+def test_waiters_are_admitted_by_priority_then_arrival():
+    async def run() -> list:
+        admission = LLMAdmission(max_in_flight=1, max_queue=3, queue_timeout=5.0)
+        order = []
+
+        async def call(name: str, priority: LLMPriority):
+            async with admission.slot(priority):
+                order.append(name)
+
+        await admission.acquire()
+        tasks = [
+            asyncio.create_task(call("chat-1", LLMPriority.CHAT)),
+            asyncio.create_task(call("chat-2", LLMPriority.CHAT)),
+            asyncio.create_task(call("lesson", LLMPriority.LESSON))
+        ]
+        await asyncio.sleep(0)
+        assert admission.queued == 3
+        admission.release()
+        await asyncio.gather(*tasks)
+        assert admission.in_flight == 0 and admission.queued == 0
+        return order
+
+    assert asyncio.run(run()) == ["lesson", "chat-1", "chat-2"]
+
+
+def test_full_queue_rejects_or_displaces_lower_priority():
+    async def run():
+        admission = LLMAdmission(max_in_flight=1, max_queue=1, queue_timeout=5.0)
+        await admission.acquire()
+        chat = asyncio.create_task(admission.acquire(LLMPriority.CHAT))
+        await asyncio.sleep(0)
+
+        # A lesson call takes the queued chat call's place
+        lesson = asyncio.create_task(admission.acquire(LLMPriority.LESSON))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected):
+            await chat
+        # Nothing ranks below chat, so another chat call is turned away
+        with pytest.raises(AdmissionRejected):
+            await admission.acquire(LLMPriority.CHAT)
+
+        admission.release()
+        await lesson
+        admission.release()
+        assert admission.in_flight == 0 and admission.queued == 0
+        assert admission.rejected[LLMPriority.CHAT] == 2
+
+    asyncio.run(run())
+
+
+def test_timed_out_and_cancelled_waiters_leave_no_slot_behind():
+    async def run():
+        admission = LLMAdmission(max_in_flight=1, max_queue=5, queue_timeout=5.0)
+        await admission.acquire()
+        with pytest.raises(AdmissionRejected):
+            await admission.acquire(timeout=0.01)
+        waiter = asyncio.create_task(admission.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert admission.queued == 0
+        admission.release()
+        assert admission.in_flight == 0
+        assert admission.timed_out[LLMPriority.CHAT] == 1
+
+    asyncio.run(run())
+
+
+def test_single_flight_coalesces_concurrent_identical_calls():
+    async def run():
+        group = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "reply"
+
+        tasks = [asyncio.create_task(group.do("prompt", call)) for _ in range(5)]
+        await asyncio.sleep(0)
+        # The leader going away does not cancel the call for the others
+        tasks[0].cancel()
+        release.set()
+        results = await asyncio.gather(*tasks[1:])
+
+        assert calls == 1
+        assert results == [("reply", True)] * 4
+        assert group.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+        # Nothing is kept once the call finishes
+        assert await group.do("prompt", call) == ("reply", False)
+        assert calls == 2
+
+    asyncio.run(run())
+
+
+def test_single_flight_shares_failures_and_forgets_them():
+    async def run():
+        group = SingleFlight()
+
+        async def fail() -> str:
+            await asyncio.sleep(0)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(*(group.do("prompt", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert group.leaders == 1 and group.stats()["in_flight"] == 0
+
+    asyncio.run(run())
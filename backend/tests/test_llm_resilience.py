@@ -0,0 +1,53 @@
+"""
+LingoKa LLM Resilience Tests
+"""
+import asyncio
+import time
+
+from backend.services.llm_resilience import CircuitBreaker, Deadline, RetryPolicy
+
+
+def _open_breaker(reset_timeout: float) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=reset_timeout)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+
+def test_cancelled_probe_reopens_breaker():
+    breaker = _open_breaker(reset_timeout=0.05)
+    policy = RetryPolicy(max_retries=0, base_delay=0.0, max_delay=0.0, min_attempt_seconds=0.0)
+    time.sleep(0.06)
+
+    async def cancel_probe() -> None:
+        probe = asyncio.ensure_future(policy.call(lambda timeout: asyncio.sleep(10), Deadline(5.0), breaker))
+        await asyncio.sleep(0.01)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+    asyncio.run(cancel_probe())
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.blocked()
+
+    time.sleep(0.06)
+    assert not breaker.blocked()
+
+    async def succeed(timeout: float) -> str:
+        return "ok"
+
+    assert asyncio.run(policy.call(succeed, Deadline(5.0), breaker)) == "ok"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_probe_that_never_reports_back_is_replaced():
+    breaker = _open_breaker(reset_timeout=0.05)
+    time.sleep(0.06)
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.blocked()
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert not breaker.blocked()
+    assert breaker.allow()
@@ -0,0 +1,46 @@
+"""
+LingoKa Content Pack Tests
+"""
+import struct
+
+from backend.languages.packs import FORMAT_VERSION, ContentPack, PackRegistry, build_pack, pack_format_version
+
+SOURCE = '{"phrases": [{"hiligaynon": "Salamat", "english": "Thank you"}]}'
+
+
+def test_pack_from_another_format_version_is_rebuilt(tmp_path):
+    source_dir = tmp_path / "data"
+    source_dir.mkdir()
+    (source_dir / "xx.json").write_text(SOURCE, encoding="utf-8")
+    registry = PackRegistry(source_dir, tmp_path / "packs")
+    path = registry.pack_path("xx")
+    path.parent.mkdir()
+    # A pack newer than its source, written by some other format version
+    path.write_bytes(struct.pack("<4sHHII", b"LKPK", FORMAT_VERSION + 1, 0, 0, 0))
+    assert pack_format_version(path) == FORMAT_VERSION + 1
+
+    pack = registry.get("xx")
+    assert pack_format_version(path) == FORMAT_VERSION
+    assert pack.records("phrases")[0]["hiligaynon"] == "Salamat"
+
+
+def test_pack_round_trip_keeps_empty_sections(tmp_path):
+    source = {
+        "phrases": [{"hiligaynon": "Salamat", "english": "Thank you", "notes": None, "tags": ["polite"]}],
+        "exercises": [],
+        "vocabulary": {"greetings": [{"hiligaynon": "Maayong aga", "english": "Good morning"}], "food": []},
+        "tips": [],
+        "guide": {"intro": "Hello"}
+    }
+    pack = ContentPack(build_pack(source, tmp_path / "xx.lkpack"))
+
+    assert pack.section_names() == ["phrases", "exercises", "vocabulary/greetings", "vocabulary/food", "tips", "guide"]
+    assert list(pack.records("phrases")) == [dict(source["phrases"][0], tags=("polite",))]
+    assert len(pack.records("exercises")) == 0
+    vocabulary = pack.group("vocabulary")
+    assert list(vocabulary) == ["greetings", "food"]
+    assert list(vocabulary["greetings"]) == source["vocabulary"]["greetings"]
+    assert len(vocabulary["food"]) == 0
+    assert pack.document("tips") == []
+    assert pack.document("guide") == {"intro": "Hello"}
+    pack.close()
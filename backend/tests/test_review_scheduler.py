@@ -0,0 +1,45 @@
+"""
+LingoKa Review Scheduler Tests
+"""
+import asyncio
+
+from backend.services.review_scheduler import SharedReviewScheduler
+from backend.services.storage import SQLiteDocumentStore
+
+
+def test_shared_decks_keep_concurrent_reviews(tmp_path):
+    path = str(tmp_path / "shared.db")
+
+    async def run() -> dict:
+        # Two workers with their own caches over one file
+        first = SharedReviewScheduler(SQLiteDocumentStore(path))
+        second = SharedReviewScheduler(SQLiteDocumentStore(path))
+        await first.record_reviews("user", [("salamat", 5)], now=0)
+        await second.due("user", now=0)
+        await first.record_reviews("user", [("salamat", 5)], now=0)
+        # second's cached deck is now stale
+        await second.record_reviews("user", [("palangga", 4)], now=0)
+        await asyncio.gather(*(
+            scheduler.record_reviews("user", [(f"item-{i}", 5)], now=0)
+            for i, scheduler in enumerate([first, second] * 3)
+        ))
+        return {state.item: state for state in await first.due("user", 100, now=10 ** 9)}
+
+    cards = asyncio.run(run())
+    assert len(cards) == 8
+    assert cards["salamat"].repetitions == 2
+
+
+def test_known_items_follow_reviews():
+    async def run() -> tuple:
+        scheduler = SharedReviewScheduler(SQLiteDocumentStore(":memory:"))
+        await scheduler.record_reviews("user", [("salamat", 5), ("palangga", 5), ("balay", 1)], now=0)
+        await scheduler.record_reviews("user", [("salamat", 5)], now=0)
+        before = await scheduler.known_items("user", 10)
+        await scheduler.record_reviews("user", [("palangga", 5), ("palangga", 5)], now=0)
+        return before, await scheduler.known_items("user", 10), await scheduler.known_items("user", 1)
+
+    before, after, top = asyncio.run(run())
+    assert before == ["salamat", "palangga"]
+    assert after == ["palangga", "salamat"]
+    assert top == ["palangga"]
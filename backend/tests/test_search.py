@@ -0,0 +1,18 @@
+"""
+LingoKa Content Search Tests
+"""
+from backend.languages.search import MAX_CANDIDATES, TrigramIndex
+
+
+def test_kinds_filter_applies_before_the_candidate_budget():
+    index = TrigramIndex()
+    # Enough phrases on the query's rarest trigrams to spend the budget alone
+    for i in range(MAX_CANDIDATES - 50):
+        index.add("phrase", f"sala-{i}", [("text", "sala", 1.0)])
+    for i in range(MAX_CANDIDATES - 40):
+        index.add("phrase", f"lamat-{i}", [("text", "lamat", 1.0)])
+    index.add("vocabulary", "word", [("word", "lamat", 1.0)])
+
+    results = index.search("salamat", kinds=("vocabulary",))
+    assert [(result.kind, result.item) for result in results] == [("vocabulary", "word")]
+    assert {result.kind for result in index.search("salamat")} == {"phrase"}
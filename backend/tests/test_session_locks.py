@@ -0,0 +1,62 @@
+"""
+LingoKa Session Locks Tests
+"""
+import asyncio
+
+import pytest
+
+from backend.services.session_locks import SessionLocks
+
+
+def test_turns_on_one_session_run_in_arrival_order():
+    async def run() -> list:
+        locks = SessionLocks()
+        events = []
+
+        async def turn(session_id: str, name: str):
+            async with locks.hold(session_id):
+                events.append(f"{name} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} end")
+
+        await asyncio.gather(turn("a", "a1"), turn("a", "a2"), turn("b", "b1"))
+        assert len(locks) == 0
+        assert locks.acquired == 3 and locks.contended == 1
+        return events
+
+    events = asyncio.run(run())
+    # a2 waits for a1; b1 runs alongside them
+    assert events.index("a1 end") < events.index("a2 start")
+    assert events.index("b1 start") < events.index("a1 end")
+
+
+def test_cancelled_waiter_releases_its_lock_entry():
+    async def run():
+        locks = SessionLocks()
+        release = asyncio.Event()
+
+        async def holder():
+            async with locks.hold("a"):
+                await release.wait()
+
+        async def waiter():
+            async with locks.hold("a"):
+                pass
+
+        first = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(waiter())
+        await asyncio.sleep(0)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert len(locks) == 1
+
+        release.set()
+        await first
+        assert len(locks) == 0
+        # The key is usable again afterwards
+        async with locks.hold("a"):
+            assert len(locks) == 1
+
+    asyncio.run(run())
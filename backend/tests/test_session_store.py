@@ -0,0 +1,74 @@
+"""
+LingoKa Session Store Tests
+"""
+import asyncio
+
+import pytest
+
+from backend.models.message import MessageRole
+from backend.services.session_store import SessionStore
+from backend.services.storage import DocumentStore, WriteBehindWriter
+
+
+class _SlowStore(DocumentStore):
+    """Returns a stored (stale) session slowly and records commits"""
+
+    def __init__(self, doc=None, fail=False):
+        self.doc = doc
+        self.fail = fail
+        self.committed = []
+
+    async def get_document(self, collection, doc_id):
+        await asyncio.sleep(0.01)
+        return self.doc
+
+    async def commit(self, writes):
+        if self.fail:
+            raise OSError("disk full")
+        self.committed.extend(writes)
+
+
+def _store(backing: DocumentStore) -> SessionStore:
+    writer = WriteBehindWriter(backing, flush_interval=60.0, max_batch_size=100)
+    return SessionStore(max_sessions=10, idle_ttl_seconds=60.0, max_history=10, max_profiles=10, writer=writer)
+
+
+def test_cold_load_does_not_replace_live_session():
+    stale = {"session": {"session_id": "s", "current_agent": "director"}, "history": []}
+    sessions = _store(_SlowStore(stale))
+
+    async def run():
+        loading = asyncio.ensure_future(sessions.get("s"))
+        await asyncio.sleep(0)
+        # A chat turn creates the session and records a turn while the load is in flight
+        live = await sessions.create("s")
+        await sessions.record_turn(live, "conversation", [(MessageRole.USER, "Maayong aga", None, 0)])
+        return live, await loading, await sessions.get("s")
+
+    live, loaded, current = asyncio.run(run())
+    assert loaded is live and current is live
+    assert len(current.history) == 1
+
+
+def test_failed_producer_keeps_batch_pending():
+    backing = _SlowStore()
+    writer = WriteBehindWriter(backing, flush_interval=60.0, max_batch_size=100)
+    writer.enqueue("sessions", "good", lambda: {"ok": True})
+    writer.enqueue("sessions", "bad", lambda: 1 / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        asyncio.run(writer.flush())
+    assert writer.pending("sessions", "good") is not None
+    assert writer.pending("sessions", "bad") is not None
+    assert writer.errors == 1 and backing.committed == []
+
+
+def test_failed_commit_keeps_batch_pending():
+    backing = _SlowStore(fail=True)
+    writer = WriteBehindWriter(backing, flush_interval=60.0, max_batch_size=100)
+    writer.enqueue("sessions", "s", lambda: {"ok": True})
+    with pytest.raises(OSError):
+        asyncio.run(writer.flush())
+    backing.fail = False
+    asyncio.run(writer.flush())
+    assert backing.committed == [("sessions", "s", {"ok": True})]
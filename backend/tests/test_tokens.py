@@ -0,0 +1,76 @@
+"""
+LingoKa Token Budgeting Tests
+"""
+import sys
+import types
+
+import pytest
+
+from backend.models.message import MessageRole
+from backend.services import tokens
+from backend.services.conversation_history import ConversationHistory
+from backend.services.tokens import CHARS_PER_TOKEN, MESSAGE_OVERHEAD_TOKENS, pack_prompt
+
+
+class _Encoding:
+    """Mimics tiktoken: special tokens are rejected unless explicitly allowed"""
+
+    def encode(self, text, disallowed_special="all"):
+        if disallowed_special == "all" and "<|endoftext|>" in text:
+            raise ValueError("Encountered text corresponding to disallowed special token")
+        return text.split()
+
+
+def _fake_tiktoken(load):
+    module = types.ModuleType("tiktoken")
+    module.encoding_for_model = lambda model: load()
+    module.get_encoding = lambda name: load()
+    return module
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    """Install a fake tiktoken and reset the cached counter around each test"""
+    def install(load):
+        monkeypatch.setitem(sys.modules, "tiktoken", _fake_tiktoken(load))
+        monkeypatch.setattr(tokens, "_counter", None)
+    yield install
+    tokens._counter = None
+
+
+def test_special_token_text_is_counted(counter):
+    counter(_Encoding)
+    assert tokens.count_tokens("say <|endoftext|> please") == 3
+
+
+def test_unloadable_encoding_falls_back_to_estimate(counter):
+    def offline():
+        raise OSError("could not fetch the BPE file")
+    counter(offline)
+    assert tokens.count_tokens("a" * 10) == -(-10 // CHARS_PER_TOKEN)
+
+
+def test_pack_prompt_keeps_newest_history_within_budget(counter):
+    counter(_Encoding)
+    history = ConversationHistory(capacity=10)
+    for i in range(6):
+        history.append(MessageRole.USER if i % 2 == 0 else MessageRole.ASSISTANT, f"turn {i} words")
+
+    unbounded = pack_prompt("system prompt", history, "hello", budget=10000)
+    assert unbounded.history_messages == 6 and unbounded.history_dropped == 0
+
+    # Room for exactly two history messages beyond the fixed part
+    fixed = unbounded.prompt_tokens - 6 * (3 + MESSAGE_OVERHEAD_TOKENS)
+    packed = pack_prompt("system prompt", history, "hello", budget=fixed + 2 * (3 + MESSAGE_OVERHEAD_TOKENS))
+    assert packed.history_messages == 2 and packed.history_dropped == 4
+    assert [m["content"] for m in packed.messages] == ["system prompt", "turn 4 words", "turn 5 words", "hello"]
+    assert packed.prompt_tokens <= fixed + 2 * (3 + MESSAGE_OVERHEAD_TOKENS)
+
+
+def test_pack_prompt_always_keeps_system_prompt_and_message(counter):
+    counter(_Encoding)
+    history = ConversationHistory(capacity=10)
+    history.append(MessageRole.USER, "an earlier turn")
+    packed = pack_prompt("system prompt", history, "<|endoftext|> hello", budget=0)
+    assert [m["role"] for m in packed.messages] == ["system", "user"]
+    assert packed.history_dropped == 1